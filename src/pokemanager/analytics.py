@@ -0,0 +1,117 @@
+"""Vectorised offensive and defensive analytics of candidate teams.
+
+Teams are arrays of the positions of their members in a PC, one team per row, and the dual ids, species and coverage
+of both souls of every member are gathered from the PC's feature table with one index each. A whole batch of teams is
+then scored with a few array operations per metric. Members with movesets cover the dual types their moves hit super
+effectively, and the others those their own types do, so offensive coverage is an OR of packed masks either way.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from pokemanager.const import GENS
+from pokemanager.coverage import immunities, shared_weaknesses, unresisted
+from pokemanager.stats import BST_SCALE, team_stats
+from pokemanager.synergy import team_synergy
+from pokemanager.typer import get_scores
+
+# the metrics of a team, in the order they are reported
+TEAM_METRICS = np.dtype(
+    [
+        ("score", "<f8"),  # summed score of the members, plus their weighted synergy and base stats
+        ("synergy", "<f8"),  # summed synergy of every pair of members
+        ("bst", "<u2"),  # mean base stat total of the members' species
+        ("coverage", "<u2"),  # dual types at least one member hits super effectively, with its moves if known
+        ("holes", "<u1"),  # attacking types no member resists
+        ("stacked", "<u1"),  # attacking types at least three members are weak to
+        ("immunities", "<u1"),  # attacking types some member is immune to
+    ]
+)
+# whether a metric is better when higher
+HIGHER_IS_BETTER = {
+    "score": True,
+    "synergy": True,
+    "bst": True,
+    "coverage": True,
+    "holes": False,
+    "stacked": False,
+    "immunities": True,
+}
+
+
+@dataclass(frozen=True)
+class Scoring:
+    """How the score of a team adds to the scores of its members' types, and the metric teams are ranked by."""
+
+    synergy: float = 0.0  # weight of the synergy of the members
+    stats: float = 0.0  # weight of the mean base stat total of the members, relative to BST_SCALE
+    gen: GENS = 9  # the generation whose type chart teams are scored with
+    sort_by: str = "score"  # the metric teams are ranked by, best first
+
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(masks: npt.NDArray[np.unsignedinteger]) -> npt.NDArray[np.intp]:
+    """Count the set bits of every mask."""
+    return _POPCOUNT[np.ascontiguousarray(masks)[..., None].view(np.uint8)].sum(axis=-1, dtype=np.intp)
+
+
+def _gather(features: npt.NDArray[np.void], teams: npt.ArrayLike, first: str, second: str) -> npt.NDArray[Any]:
+    """Gather a feature of both souls of every member of each team, one team per row."""
+    positions = np.asarray(teams, dtype=np.intp)
+    souls = np.stack([features[first][positions], features[second][positions]], axis=2)
+    return souls.reshape(len(positions), -1, *souls.shape[3:])
+
+
+def team_super_effective(features: npt.NDArray[np.void], teams: npt.ArrayLike) -> npt.NDArray[np.uint8]:
+    """Get what both souls of every member of each team hit super effectively, packed as bits."""
+    return _gather(features, teams, "h1", "h2")
+
+
+def team_duals(features: npt.NDArray[np.void], teams: npt.ArrayLike) -> npt.NDArray[np.intp]:
+    """Get the dual ids of both souls of every member of each team."""
+    return _gather(features, teams, "p1", "p2").astype(np.intp)
+
+
+def team_species(features: npt.NDArray[np.void], teams: npt.ArrayLike) -> npt.NDArray[np.intp]:
+    """Get the pokedex entries of the species of both souls of every member of each team, EMPTY if unknown."""
+    return _gather(features, teams, "s1", "s2").astype(np.intp)
+
+
+def analyse_teams(
+    features: npt.NDArray[np.void], teams: npt.ArrayLike, scoring: Scoring = Scoring()
+) -> npt.NDArray[np.void]:
+    """Score a batch of teams on every metric.
+
+    Args:
+        features: The feature table of the PC the teams are drawn from, in the generation of the scoring.
+        teams: The positions of the members of each team in the PC, one team per row.
+        scoring: How the teams are scored, and in which generation.
+    """
+    gen = scoring.gen
+    duals = team_duals(features, teams)
+    metrics = np.empty(len(duals), dtype=TEAM_METRICS)
+    metrics["synergy"] = team_synergy(duals, gen)
+    bst = team_stats(team_species(features, teams))
+    metrics["bst"] = bst.round()
+    metrics["score"] = (
+        get_scores(gen)[duals].sum(axis=1) + scoring.synergy * metrics["synergy"] + scoring.stats * bst / BST_SCALE
+    )
+    covered = np.bitwise_or.reduce(team_super_effective(features, teams), axis=1)
+    metrics["coverage"] = popcount(covered).sum(axis=1)
+    metrics["holes"] = popcount(unresisted(duals, gen))
+    metrics["stacked"] = popcount(shared_weaknesses(duals, 3, gen))
+    metrics["immunities"] = popcount(immunities(duals, gen))
+    return metrics
+
+
+def rank_teams(metrics: npt.NDArray[np.void], sort_by: str = "score") -> npt.NDArray[np.intp]:
+    """Get the order of the teams from best to worst by one metric, breaking ties by score."""
+    key = metrics[sort_by].astype(np.float64)
+    if HIGHER_IS_BETTER[sort_by]:
+        key = -key
+    return np.lexsort((-metrics["score"], key))
@@ -18,7 +18,16 @@ config [CONFIG_KEY] [CONFIG_VALUE]
 spreadsheet
     fetch [GOOGLE_SHEET_URL] [CATEGORY] [BOX_NAME]
         "Fetch box data from Google Sheets."
-    report
+    report [BOX_NAME] [WORKSHEET_NAME]
+        "Report the teams of a box to Google Sheets."
+        --memory-budget [SIZE]
+            "Generate teams within a fixed memory budget."
+        --sort-by [METRIC]
+            "Order the teams by a metric."
+        --synergy [WEIGHT]
+            "Add the weighted synergy of each team's members to its score."
+        --stats [WEIGHT]
+            "Add the weighted mean base stat total of each team's members to its score."
 box
     list
         "List all boxes."
@@ -34,51 +43,92 @@ box
         "Export a box to a file."
     import [FILE_PATH]
         "Import a box from a file."
+    survival [BOX_NAME]
+        "Estimate the chance of a valid team surviving the next fights."
+    teams [BOX_NAME] --vs [OPPONENTS]
+        "Rank the teams of a box by their matchups against bosses."
+    evolve [BOX_NAME]
+        "Compare the teams of a box now and once its Pokémon have fully evolved."
+        --choose [SPECIES=FINAL ...]
+            "The final stage of species that can evolve into several."
+    stats [BOX_NAME]
+        "Rank the active Soullinks of a box by a base stat."
+        --stat [STAT]
+            "The stat to rank by, or the base stat total."
+        --teams
+            "Rank the valid teams by the stat of their members instead."
 pokemon
     add [BOX_NAME] [POKEMON_DATA]
-        "Add a Pokémon to a box."
+        "Add a Pokémon to a box, looking up its types from its species."
+        --met [LOCATION]
+            "Where a Soullink was met."
+        --party
+            "Whether a Soullink is in the party."
+        --moves [MOVE,...]
+            "The moveset of each soul in turn, which its coverage is worked out from."
+        --types [TYPE1[/TYPE2]]
+            "The types of each soul in turn, for species missing from the pokedex."
     remove [BOX_NAME] [POKEMON_ID]
         "Remove a Pokémon from a box."
     move [FROM_BOX_NAME] [TO_BOX_NAME] [POKEMON_ID]
         "Move a Pokémon from one box to another."
     list [BOX_NAME]
         "List all Pokémon in a box."
+        --type [TYPE], --status [STATUS], --met [LOCATION]
+            "Only list Pokémon with a type, status or met location."
     find [SEARCH_CRITERIA]
-        "Find Pokémon across all boxes based on criteria."
+        "Find Pokémon across all boxes by terms such as type:water status:alive box:run3 met~route, or by name."
+        --limit [COUNT]
+            "The most Pokémon to show, best matches first."
+    dex [PREFIX]
+        "Look up species and their types by the start of their name."
     export [BOX_NAME] [FILE_PATH]
         "Export Pokémon from a box to a file."
     import [FILE_PATH] [BOX_NAME]
         "Import Pokémon from a file to a box."
     edit [BOX_NAME] [POKEMON_ID] [NEW_POKEMON_DATA]
         "Edit a Pokémon's data in a box."
+calc
+    box [BOX_NAME] --vs [BOSS]
+        "Estimate the damage the active Pokémon of a box deal to each member of a boss's team."
+        --level [LEVEL]
+            "The level of the box's Pokémon, the boss's highest by default."
+        --moves
+            "Show the move each Pokémon does the most damage with."
+type
+    query
+        resists [TYPE ...]
+            "List the dual types that resist all of the attacking types."
+        attackers [DUAL_TYPE]
+            "List the best attacking dual types against a dual type."
+        walls [DUAL_TYPE ...]
+            "List the dual types that wall a team."
 """
 
 import argparse
+from collections.abc import Callable
 from pathlib import Path
 
 from pokemanager._version import __version__
-from pokemanager.cli_commands import cli_box, cli_config, cli_pokemon, cli_spreadsheet, utils
-from pokemanager.utils import URL
+from pokemanager.analytics import TEAM_METRICS
+from pokemanager.cli_commands import cli_box, cli_calc, cli_config, cli_pokemon, cli_spreadsheet, cli_type, utils
+from pokemanager.indexes import STATUSES
+from pokemanager.stats import STATS, TOTAL
+from pokemanager.utils import URL, parse_size
 
 
-def main():
-    """Main entry point for the CLI."""
-    # pokemanager / pkm command
-    parser = argparse.ArgumentParser(description="your very own command-line PC")
-    parser.add_argument("-v", "--verbosity", action="count", default=0, help="increase output verbosity")
-    parser.add_argument("--version", action="version", version=f"pokemanager version {__version__}")
-    subparsers = parser.add_subparsers(help="subcommand help")
-
+def _add_config_commands(add_parser: Callable[..., argparse.ArgumentParser]) -> None:
+    """Add the commands that set up and configure pokemanager."""
     # init subcommand
-    parser_init = subparsers.add_parser("init", help="initialize pokemanager")
+    parser_init = add_parser("init", help="initialize pokemanager")
     parser_init.set_defaults(func=utils.init)
 
     # clean subcommand
-    parser_clean = subparsers.add_parser("clean", help="clean your system from pokemanager files")
+    parser_clean = add_parser("clean", help="clean your system from pokemanager files")
     parser_clean.set_defaults(func=utils.clean)
 
     # config subcommand
-    parser_config = subparsers.add_parser("config", help="configure the package")
+    parser_config = add_parser("config", help="configure the package")
     parser_config.add_argument(
         "--appdata",
         nargs="?",
@@ -93,8 +143,11 @@ def main():
     parser_config_locate = subparsers_config.add_parser("locate", help="locate the config file")
     parser_config_locate.set_defaults(func=cli_config.locate_config_file)
 
+
+def _add_spreadsheet_commands(add_parser: Callable[..., argparse.ArgumentParser]) -> None:
+    """Add the commands that fetch boxes from and report teams to Google Sheets."""
     # spreadsheet subcommand
-    parser_spreadsheet = subparsers.add_parser("spreadsheet", aliases=["ss"], help="interact with Google Sheets")
+    parser_spreadsheet = add_parser("spreadsheet", aliases=["ss"], help="interact with Google Sheets")
     parser_spreadsheet.set_defaults(func=lambda _: parser_spreadsheet.print_help())  # type: ignore
     subparsers_spreadsheet = parser_spreadsheet.add_subparsers(help="subcommand help")
 
@@ -125,10 +178,40 @@ def main():
         default="Team Builder",
         help="name of the worksheet to report to",
     )
+    parser_spreadsheet_report.add_argument(
+        "-m",
+        "--memory-budget",
+        type=parse_size,
+        default=None,
+        help="generate teams within this many bytes (e.g. 256M), spilling to disk as needed",
+    )
+    parser_spreadsheet_report.add_argument(
+        "-s",
+        "--sort-by",
+        type=str,
+        choices=TEAM_METRICS.names,
+        default="score",
+        help="metric to order the teams by, best first (only score with --memory-budget)",
+    )
+    parser_spreadsheet_report.add_argument(
+        "--synergy",
+        type=float,
+        default=0.0,
+        help="weight of the synergy of each team's members in its score",
+    )
+    parser_spreadsheet_report.add_argument(
+        "--stats",
+        type=float,
+        default=0.0,
+        help="weight of the mean base stat total of each team's members, relative to 600, in its score",
+    )
     parser_spreadsheet_report.set_defaults(func=cli_spreadsheet.spreadsheet_report)
 
+
+def _add_box_commands(add_parser: Callable[..., argparse.ArgumentParser]) -> None:
+    """Add the commands that manage and analyse boxes."""
     # box subcommand
-    parser_box = subparsers.add_parser("box", help="manage boxes")
+    parser_box = add_parser("box", help="manage boxes")
     parser_box.set_defaults(func=lambda _: parser_box.print_help())  # type: ignore
     subparsers_box = parser_box.add_subparsers(help="subcommand help")
 
@@ -167,16 +250,95 @@ def main():
     parser_box_import = subparsers_box.add_parser("import", help="import a box from a file")
     parser_box_import.add_argument("file_path", type=argparse.FileType("r"), help="path to the file to import from")
     parser_box_import.set_defaults(func=cli_box.box_import)
+    _add_box_analysis_commands(subparsers_box.add_parser)
+
+
+def _add_box_analysis_commands(add_parser: Callable[..., argparse.ArgumentParser]) -> None:
+    """Add the box commands that analyse the teams of a box."""
+    ## survival subcommand
+    parser_box_survival = add_parser("survival", help="estimate the chance of a valid team surviving the next fights")
+    parser_box_survival.add_argument("name", type=str, help="name of the box")
+    parser_box_survival.add_argument("-f", "--fights", type=int, default=1, help="number of fights to simulate")
+    parser_box_survival.add_argument(
+        "-d", "--death-chance", type=float, default=0.1, help="chance of a soullink dying in a single fight"
+    )
+    parser_box_survival.add_argument(
+        "-r",
+        "--risk",
+        action="append",
+        default=[],
+        metavar="SOULLINK=CHANCE",
+        help="death chance of a specific soullink, may be repeated",
+    )
+    parser_box_survival.add_argument("-s", "--samples", type=int, default=10000, help="number of scenarios to sample")
+    parser_box_survival.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes")
+    parser_box_survival.add_argument("--seed", type=int, default=None, help="seed for reproducible sampling")
+    parser_box_survival.set_defaults(func=cli_box.box_survival)
+    ## teams subcommand
+    parser_box_teams = add_parser("teams", help="rank the teams of a box by their matchups against bosses")
+    parser_box_teams.add_argument("name", type=str, help="name of the box")
+    parser_box_teams.add_argument(
+        "--vs", type=str, required=True, help='comma separated bosses of the box\'s game, e.g. "Brock,Misty"'
+    )
+    parser_box_teams.add_argument("-n", "--top", type=int, default=10, help="number of teams to show")
+    parser_box_teams.set_defaults(func=cli_box.box_teams)
 
+    ## evolve subcommand
+    parser_box_evolve = add_parser(
+        "evolve", help="compare the teams of a box now and once its Pokémon have fully evolved"
+    )
+    parser_box_evolve.add_argument("name", type=str, help="name of the box")
+    parser_box_evolve.add_argument(
+        "-c",
+        "--choose",
+        type=str,
+        nargs="*",
+        default=[],
+        help="final stage of species with several, as SPECIES=FINAL, such as Eevee=Vaporeon",
+    )
+    parser_box_evolve.set_defaults(func=cli_box.box_evolve)
+    ## stats subcommand
+    parser_box_stats = add_parser("stats", help="rank the active soullinks of a box by a base stat")
+    parser_box_stats.add_argument("name", type=str, help="name of the box")
+    parser_box_stats.add_argument(
+        "-s", "--stat", type=str, choices=(*STATS, TOTAL), default=TOTAL, help="stat to rank by"
+    )
+    parser_box_stats.add_argument(
+        "-t", "--teams", action="store_true", help="rank the valid teams by the mean stat of their members instead"
+    )
+    parser_box_stats.add_argument("-n", "--top", type=int, default=10, help="number of soullinks or teams to show")
+    parser_box_stats.set_defaults(func=cli_box.box_stats)
+
+
+def _add_pokemon_commands(add_parser: Callable[..., argparse.ArgumentParser]) -> None:
+    """Add the commands that manage Pokémon."""
     # pokemon subcommand
-    parser_pokemon = subparsers.add_parser("pokemon", help="manage Pokémon")
+    parser_pokemon = add_parser("pokemon", help="manage Pokémon")
     parser_pokemon.set_defaults(func=lambda _: parser_pokemon.print_help())  # type: ignore
     subparsers_pokemon = parser_pokemon.add_subparsers(help="subcommand help")
 
     ## add subcommand
     parser_pokemon_add = subparsers_pokemon.add_parser("add", help="add a Pokémon to a box")
     parser_pokemon_add.add_argument("box_name", type=str, help="name of the box")
-    parser_pokemon_add.add_argument("pokemon_data", type=str, help="Pokémon data")
+    parser_pokemon_add.add_argument(
+        "pokemon_data", type=str, help="species and optional nickname, as SPECIES[:NICKNAME][,SPECIES[:NICKNAME]]"
+    )
+    parser_pokemon_add.add_argument("--met", type=str, default="", help="where a Soullink was met")
+    parser_pokemon_add.add_argument("--party", action="store_true", help="whether a Soullink is in the party")
+    parser_pokemon_add.add_argument(
+        "--moves",
+        type=str,
+        action="append",
+        default=[],
+        help="comma separated moves of each soul in turn, may be repeated",
+    )
+    parser_pokemon_add.add_argument(
+        "--types",
+        type=str,
+        action="append",
+        default=[],
+        help="types of each soul in turn as TYPE1[/TYPE2], instead of those of its species, may be repeated",
+    )
     parser_pokemon_add.set_defaults(func=cli_pokemon.pokemon_add)
 
     ## remove subcommand
@@ -192,20 +354,7 @@ def main():
     parser_pokemon_move.add_argument("pokemon_id", type=str, help="ID of the Pokémon")
     parser_pokemon_move.set_defaults(func=cli_pokemon.pokemon_move)
 
-    ## list subcommand
-    parser_pokemon_list = subparsers_pokemon.add_parser("list", help="list all Pokémon in a box")
-    parser_pokemon_list.add_argument("box_name", type=str, help="name of the box")
-    parser_pokemon_list.set_defaults(func=cli_pokemon.pokemon_list)
-    ## show subcommand
-    parser_pokemon_list = subparsers_pokemon.add_parser("show", help="show information about a Pokémon")
-    parser_pokemon_list.add_argument("box_name", type=str, help="name of the box")
-    parser_pokemon_list.add_argument("name", type=str, help="name of the Pokémon")
-    parser_pokemon_list.set_defaults(func=cli_pokemon.pokemon_show)
-
-    ## find subcommand
-    parser_pokemon_find = subparsers_pokemon.add_parser("find", help="find Pokémon across all boxes based on criteria")
-    parser_pokemon_find.add_argument("search_criteria", type=str, help="search criteria")
-    parser_pokemon_find.set_defaults(func=cli_pokemon.pokemon_find)
+    _add_pokemon_query_commands(subparsers_pokemon.add_parser)
 
     ## export subcommand
     parser_pokemon_export = subparsers_pokemon.add_parser("export", help="export Pokémon from a box to a file")
@@ -227,6 +376,118 @@ def main():
     parser_pokemon_edit.add_argument("new_pokemon_data", type=str, help="new Pokémon data")
     parser_pokemon_edit.set_defaults(func=cli_pokemon.pokemon_edit)
 
+
+def _add_pokemon_query_commands(add_parser: Callable[..., argparse.ArgumentParser]) -> None:
+    """Add the Pokémon commands that list, show, find and look up Pokémon."""
+    ## list subcommand
+    parser_pokemon_list = add_parser("list", help="list all Pokémon in a box")
+    parser_pokemon_list.add_argument("box_name", type=str, help="name of the box")
+    parser_pokemon_list.add_argument("--type", type=str, help="only list Pokémon with this type")
+    parser_pokemon_list.add_argument("--status", choices=STATUSES, help="only list Pokémon with this status")
+    parser_pokemon_list.add_argument("--met", type=str, help="only list Pokémon met at this location")
+    parser_pokemon_list.set_defaults(func=cli_pokemon.pokemon_list)
+    ## show subcommand
+    parser_pokemon_list = add_parser("show", help="show information about a Pokémon")
+    parser_pokemon_list.add_argument("box_name", type=str, help="name of the box")
+    parser_pokemon_list.add_argument("name", type=str, help="name of the Pokémon")
+    parser_pokemon_list.set_defaults(func=cli_pokemon.pokemon_show)
+
+    ## find subcommand
+    parser_pokemon_find = add_parser("find", help="find Pokémon across all boxes based on criteria")
+    parser_pokemon_find.add_argument(
+        "search_criteria", type=str, help="terms such as 'type:water status:alive box:run3 met~route' and names"
+    )
+    parser_pokemon_find.add_argument("-n", "--limit", type=int, default=20, help="number of Pokémon to show")
+    parser_pokemon_find.set_defaults(func=cli_pokemon.pokemon_find)
+
+    ## dex subcommand
+    parser_pokemon_dex = add_parser("dex", help="look up species by the start of their name")
+    parser_pokemon_dex.add_argument("prefix", type=str, help="start of the species name")
+    parser_pokemon_dex.add_argument("-g", "--gen", type=int, choices=range(1, 10), default=9, help="generation")
+    parser_pokemon_dex.add_argument("-n", "--limit", type=int, default=10, help="number of species to show")
+    parser_pokemon_dex.set_defaults(func=cli_pokemon.pokemon_dex)
+
+
+def _add_calc_commands(add_parser: Callable[..., argparse.ArgumentParser]) -> None:
+    """Add the commands that estimate damage."""
+    # calc subcommand
+    parser_calc = add_parser("calc", help="estimate damage")
+    parser_calc.set_defaults(func=lambda _: parser_calc.print_help())  # type: ignore
+    subparsers_calc = parser_calc.add_subparsers(help="subcommand help")
+
+    ## box subcommand
+    parser_calc_box = subparsers_calc.add_parser(
+        "box", help="estimate the damage the active Pokémon of a box deal to a boss's team"
+    )
+    parser_calc_box.add_argument("name", type=str, help="name of the box")
+    parser_calc_box.add_argument("--vs", type=str, required=True, help="boss of the box's game, e.g. Lance")
+    parser_calc_box.add_argument(
+        "-l", "--level", type=int, default=None, help="level of the box's Pokémon, the boss's highest by default"
+    )
+    parser_calc_box.add_argument(
+        "-m", "--moves", action="store_true", help="show the move each Pokémon does the most damage with"
+    )
+    parser_calc_box.set_defaults(func=cli_calc.calc_box)
+
+
+def _add_type_commands(add_parser: Callable[..., argparse.ArgumentParser]) -> None:
+    """Add the commands that query type matchups."""
+    # type subcommand
+    parser_type = add_parser("type", help="query type matchups")
+    parser_type.set_defaults(func=lambda _: parser_type.print_help())  # type: ignore
+    subparsers_type = parser_type.add_subparsers(help="subcommand help")
+
+    ## query subcommand
+    parser_type_query = subparsers_type.add_parser("query", help="query the matchups of dual types")
+    parser_type_query.set_defaults(func=lambda _: parser_type_query.print_help())  # type: ignore
+    subparsers_type_query = parser_type_query.add_subparsers(help="subcommand help")
+    gen_parser = argparse.ArgumentParser(add_help=False)
+    gen_parser.add_argument("-g", "--gen", type=int, choices=range(1, 10), default=9, help="generation of the chart")
+
+    ### resists subcommand
+    parser_type_query_resists = subparsers_type_query.add_parser(
+        "resists", parents=[gen_parser], help="list the dual types that resist all of the attacking types"
+    )
+    parser_type_query_resists.add_argument("types", type=str, nargs="+", help="attacking types, e.g. Ground Ice")
+    parser_type_query_resists.add_argument(
+        "-a", "--at-most", type=float, default=0.5, help="highest effectiveness that counts as resisting"
+    )
+    parser_type_query_resists.set_defaults(func=cli_type.type_query_resists)
+
+    ### attackers subcommand
+    parser_type_query_attackers = subparsers_type_query.add_parser(
+        "attackers", parents=[gen_parser], help="list the best attacking dual types against a dual type"
+    )
+    parser_type_query_attackers.add_argument("defender", type=str, help="defending dual type, e.g. Water/Ground")
+    parser_type_query_attackers.add_argument("-k", "--top", type=int, default=10, help="number of attackers to list")
+    parser_type_query_attackers.set_defaults(func=cli_type.type_query_attackers)
+
+    ### walls subcommand
+    parser_type_query_walls = subparsers_type_query.add_parser(
+        "walls", parents=[gen_parser], help="list the dual types that wall a team"
+    )
+    parser_type_query_walls.add_argument("team", type=str, nargs="+", help="dual types of the team, e.g. Fire/Flying")
+    parser_type_query_walls.add_argument(
+        "-a", "--at-most", type=float, default=0.5, help="highest effectiveness that counts as walling"
+    )
+    parser_type_query_walls.set_defaults(func=cli_type.type_query_walls)
+
+
+def main():
+    """Main entry point for the CLI."""
+    # pokemanager / pkm command
+    parser = argparse.ArgumentParser(description="your very own command-line PC")
+    parser.add_argument("-v", "--verbosity", action="count", default=0, help="increase output verbosity")
+    parser.add_argument("--version", action="version", version=f"pokemanager version {__version__}")
+    subparsers = parser.add_subparsers(help="subcommand help")
+
+    _add_config_commands(subparsers.add_parser)
+    _add_spreadsheet_commands(subparsers.add_parser)
+    _add_box_commands(subparsers.add_parser)
+    _add_pokemon_commands(subparsers.add_parser)
+    _add_calc_commands(subparsers.add_parser)
+    _add_type_commands(subparsers.add_parser)
+
     args = parser.parse_args()
     v = args.verbosity
     if hasattr(args, "func"):
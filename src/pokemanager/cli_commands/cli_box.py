@@ -2,8 +2,17 @@
 
 from argparse import Namespace
 
-from pokemanager.data import Box
+import numpy as np
+
+from pokemanager.analytics import team_duals, team_species
+from pokemanager.cli_commands.utils import print_progress
+from pokemanager.data import Box, SoullinkPC
+from pokemanager.evolution import evolve_box
 from pokemanager.main import AppData
+from pokemanager.opponents import evaluate, get_opponents
+from pokemanager.progress import Progress
+from pokemanager.simulate import SimulationOptions, simulate_survival
+from pokemanager.stats import rank_links, team_stats
 
 
 def box(args: list[str]):
@@ -86,3 +95,125 @@ def box_import(args: Namespace):
     """Import a box from a file."""
     print(f"Importing box from file {args.file_path.name}")
     raise NotImplementedError("Box import not implemented yet.")
+
+
+def box_survival(args: Namespace):
+    """Estimate the chance of a valid team surviving the next fights."""
+    app_data = AppData()
+    if args.name not in app_data.boxes:
+        print(f"Box '{args.name}' not found.")
+        return
+    box: Box = app_data.boxes[args.name]
+    if not isinstance(box.pc, SoullinkPC):
+        raise NotImplementedError("Survival is only supported for soullink boxes.")
+    default_chance: float = args.death_chance
+    death_chances = dict.fromkeys(range(len(box.pc)), default_chance)
+    for risk in args.risk:
+        name, _, value = risk.rpartition("=")
+        # soullinks are found by their own name or the names and nicknames of either soul
+        positions = box.index.get("name", name)
+        if not positions:
+            print(f"Soullink '{name}' not found in box '{box.name}'.")
+            return
+        try:
+            chance = float(value)
+        except ValueError:
+            print(f"Invalid death chance of '{name}': {value}")
+            return
+        death_chances.update(dict.fromkeys(positions, chance))
+    options = SimulationOptions(
+        fights=args.fights, samples=args.samples, workers=args.workers, seed=args.seed, gen=box.gen
+    )
+    print(f"Simulating {options.samples} scenarios over {options.fights} fights...")
+    try:
+        estimates = simulate_survival(box.pc, death_chances, options)
+    except ValueError as e:
+        print(e)
+        return
+    for estimate in estimates:
+        low, high = estimate.interval()
+        print(f"- after fight {estimate.fight}: {estimate.probability:.1%} (95% CI {low:.1%} to {high:.1%})")
+
+
+def box_teams(args: Namespace):
+    """Rank the teams of a box by their expected matchups against a game's bosses."""
+    app_data = AppData()
+    if args.name not in app_data.boxes:
+        print(f"Box '{args.name}' not found.")
+        return
+    box: Box = app_data.boxes[args.name]
+    if not isinstance(box.pc, SoullinkPC):
+        raise NotImplementedError("Teams are only supported for soullink boxes.")
+    try:
+        opponents = get_opponents(box.game, args.vs.split(","))
+    except ValueError as e:
+        print(e)
+        return
+    progress = Progress(print_progress)
+    with progress.cancel_on_interrupt():
+        teams = box.pc.get_team_indices(progress, box.gen)
+    if not len(teams):
+        print(f"No valid teams in box '{box.name}'.")
+        return
+    matchups = evaluate(team_duals(box.pc.get_features(box.gen), teams), opponents, box.game)
+    expected = matchups.mean(axis=1)
+    print(f"Best {min(args.top, len(teams))} of {len(teams)} teams against {', '.join(opponents)}:")
+    for i in np.argsort(-expected, kind="stable")[: args.top]:
+        against = ", ".join(f"{name} {m:.3f}" for name, m in zip(opponents, matchups[i]))
+        members: list[int] = teams[i].tolist()
+        print(f"- {expected[i]:.3f} ({against}): {', '.join(box.pc[j].name for j in members)}")
+
+
+def box_evolve(args: Namespace):
+    """Compare the number of valid teams of a box now and once its Pokémon have fully evolved."""
+    app_data = AppData()
+    if args.name not in app_data.boxes:
+        print(f"Box '{args.name}' not found.")
+        return
+    box: Box = app_data.boxes[args.name]
+    if not isinstance(box.pc, SoullinkPC):
+        raise NotImplementedError("Evolution planning is only supported for soullink boxes.")
+    choices = dict(choice.partition("=")[::2] for choice in args.choose)
+    try:
+        evolved = evolve_box(box, choices)
+    except ValueError as e:
+        print(e)
+        return
+    for before, after in zip(box.pc, evolved.pc):
+        if before != after:
+            print(f"- {before.name} -> {after.name}")
+    progress = Progress(print_progress)
+    with progress.cancel_on_interrupt():
+        now = len(box.pc.get_team_indices(progress, box.gen))
+        later = len(evolved.pc.get_team_indices(progress, box.gen))  # type: ignore
+    print(f"Valid teams: {now} now, {later} after evolutions.")
+
+
+def box_stats(args: Namespace):
+    """Rank the active Soullinks of a box, or its valid teams, by a base stat."""
+    app_data = AppData()
+    if args.name not in app_data.boxes:
+        print(f"Box '{args.name}' not found.")
+        return
+    box: Box = app_data.boxes[args.name]
+    if not isinstance(box.pc, SoullinkPC):
+        raise NotImplementedError("Stats are only supported for soullink boxes.")
+    if not args.teams:
+        indices, values = rank_links(box.pc, args.stat, box.gen)
+        print(f"Active soullinks of box '{box.name}' by {args.stat}:")
+        ranked: list[int] = indices[: args.top].tolist()
+        for i, value in zip(ranked, values[: args.top].tolist()):
+            link = box.pc[i]
+            print(f"- {value:.1f}: {link.name} ({link.p1.name}/{link.p2.name})")
+        return
+    progress = Progress(print_progress)
+    with progress.cancel_on_interrupt():
+        teams = box.pc.get_team_indices(progress, box.gen)
+    if not len(teams):
+        print(f"No valid teams in box '{box.name}'.")
+        return
+    values = team_stats(team_species(box.pc.get_features(box.gen), teams), args.stat)
+    print(f"Best {min(args.top, len(teams))} of {len(teams)} teams by mean {args.stat}:")
+    for i in np.argsort(-values, kind="stable")[: args.top]:
+        members: list[int] = teams[i].tolist()
+        print(f"- {values[i]:.1f}: {', '.join(box.pc[j].name for j in members)}")
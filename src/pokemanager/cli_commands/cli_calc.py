@@ -0,0 +1,73 @@
+"""CLI commands for estimating damage."""
+
+from argparse import Namespace
+
+import numpy as np
+
+from pokemanager.damage import Fighters, best_ranges, damage_ranges, get_moves
+from pokemanager.data import Box, Pokemon, Soul, SoullinkPC
+from pokemanager.main import AppData
+from pokemanager.opponents import get_boss_team
+from pokemanager.pokedex import get_pokedex, get_species_types
+from pokemanager.typer import get_dual
+
+MAX_LEVEL = 100
+
+
+def calc_box(args: Namespace):
+    """Show the damage the active Pokémon of a box deal to each member of a boss's team, as a share of its HP."""
+    app_data = AppData()
+    if args.name not in app_data.boxes:
+        print(f"Box '{args.name}' not found.")
+        return
+    box: Box = app_data.boxes[args.name]
+    try:
+        boss, team = get_boss_team(box.game, args.vs)
+    except ValueError as e:
+        print(e)
+        return
+    pokedex = get_pokedex()
+    pokemon: list[Pokemon | Soul] = (
+        [pk for sl in box.pc.get_active(box.gen) for pk in (sl.p1, sl.p2)]
+        if isinstance(box.pc, SoullinkPC)
+        else list(box.pc.get_active())
+    )
+    entries = {pk.name: entry for pk in pokemon if (entry := pokedex.find(pk.name)) is not None}
+    if unknown := [pk.name for pk in pokemon if pk.name not in entries]:
+        print(f"Skipping species missing from the pokedex: {', '.join(unknown)}")
+    pokemon = [pk for pk in pokemon if pk.name in entries]
+    if not pokemon:
+        print(f"No active Pokémon in box '{box.name}' to calculate with.")
+        return
+    try:
+        duals = [get_dual(*get_species_types(species, box.gen)) for species, _ in team]
+    except ValueError as e:
+        print(e)
+        return
+
+    level = args.level if args.level is not None else max(lvl for _, lvl in team)
+    if not 1 <= level <= MAX_LEVEL:
+        print(f"Levels must be between 1 and {MAX_LEVEL}, got {level}.")
+        return
+    attackers = Fighters.build(
+        [entries[pk.name] for pk in pokemon], np.full(len(pokemon), level), [pk.dual for pk in pokemon]
+    )
+    moves = get_moves(pokemon, attackers.stats, box.gen)
+    # every species of the team was found when its types were looked up
+    found = [entry for species, _ in team if (entry := pokedex.find(species)) is not None]
+    defenders = Fighters.build(found, [lvl for _, lvl in team], duals)
+    low, high, best = best_ranges(*damage_ranges(attackers, moves, defenders, box.gen))
+    hp = defenders.stats[:, 0]
+
+    print(f"Damage of level {level} Pokémon of box '{box.name}' against {boss}, as a share of HP:")
+    labels = [pk.nickname or pk.name for pk in pokemon]
+    width = max(map(len, labels))
+    headers = [f"{species} {lvl}" for species, lvl in team]
+    print(" " * width, *(f"{header:>16}" for header in headers))
+    for i, label in enumerate(labels):
+        cells = [f"{low[i, j] / hp[j]:.0%}-{high[i, j] / hp[j]:.0%}" for j in range(len(team))]
+        print(f"{label:<{width}}", *(f"{cell:>16}" for cell in cells))
+    if args.moves:
+        for i, label in enumerate(labels):
+            used = ", ".join(f"{moves.names[i][best[i, j]]} on {species}" for j, (species, _) in enumerate(team))
+            print(f"- {label}: {used}")
@@ -1,9 +1,33 @@
 """CLI commands for managing Pokémon."""
 
 from argparse import Namespace
+from collections.abc import Iterable
+from itertools import islice
+from typing import Optional
 
-from pokemanager.data import Box, Pokemon, Soullink
+from pokemanager.const import Type
+from pokemanager.data import Box, Pokemon, Soul, Soullink
+from pokemanager.indexes import FIELD, parse_key
 from pokemanager.main import AppData
+from pokemanager.movedex import parse_moveset
+from pokemanager.pokedex import get_pokedex, get_species_types
+from pokemanager.query import compile_query, run
+
+
+def _parse_types(text: str) -> tuple[Type, Optional[Type]]:
+    """Parse the types of a soul given as TYPE1[/TYPE2], such as "Grass/Poison".
+
+    Raises:
+        ValueError: If a type is unknown or more than two are given.
+    """
+    names = text.split("/")
+    if len(names) > 2:
+        raise ValueError(f"At most two types per soul, got {text}.")
+    try:
+        type1, *type2 = (Type[name.strip().title()] for name in names)
+    except KeyError as e:
+        raise ValueError(f"Unknown type: {e.args[0]}") from None
+    return type1, type2[0] if type2 else None
 
 
 def pokemon(commands: list[str]):
@@ -12,8 +36,69 @@ def pokemon(commands: list[str]):
 
 
 def pokemon_add(commands: Namespace):
-    """Add a Pokémon to a box."""
+    """Add a Pokémon to a box, with its types looked up from its species in the box's generation.
+
+    The Pokémon data is a species with an optional nickname, such as "Vulpix-Alola:Frost", or for Soullink boxes the
+    species of both souls separated by a comma. Their movesets are given in the same order, as comma separated moves,
+    and so are the types of species missing from the pokedex, which are used instead of looking them up.
+    """
     print(f"Adding Pokémon to box {commands.box_name} with data: {commands.pokemon_data}")
+    app_data = AppData()
+    if commands.box_name not in app_data.boxes:
+        print(f"Box '{commands.box_name}' not found.")
+        return
+    box: Box = app_data.boxes[commands.box_name]
+    souls = [soul.partition(":") for soul in commands.pokemon_data.split(",")]
+    expected = 2 if box.category == "soullink" else 1
+    if len(souls) != expected:
+        print(f"Box '{box.name}' needs {expected} species per entry, got {len(souls)}.")
+        return
+    if len(commands.moves) > expected:
+        print(f"Box '{box.name}' needs at most {expected} movesets per entry, got {len(commands.moves)}.")
+        return
+    if len(commands.types) > expected:
+        print(f"Box '{box.name}' needs at most {expected} types per entry, got {len(commands.types)}.")
+        return
+    given: list[Optional[str]] = [*commands.types, *[None] * (expected - len(commands.types))]
+    try:
+        types = [
+            get_species_types(species, box.gen) if text is None else _parse_types(text)
+            for (species, _, _), text in zip(souls, given)
+        ]
+        movesets = [parse_moveset(moves.split(",")) for moves in commands.moves]
+    except ValueError as e:
+        print(e)
+        return
+    movesets += [()] * (expected - len(movesets))
+    pokedex = get_pokedex()
+    # species missing from the pokedex keep the name they were given with
+    names = [
+        species.strip() if (entry := pokedex.find(species)) is None else pokedex.name(entry) for species, _, _ in souls
+    ]
+    nicknames = [nickname.strip() or name for (_, _, nickname), name in zip(souls, names)]
+    if box.category == "soullink":
+        p1, p2 = (
+            Soul(name, nickname, type1.name, None if type2 is None else type2.name, moves=moves)
+            for name, nickname, (type1, type2), moves in zip(names, nicknames, types, movesets)
+        )
+        box.add(Soullink(commands.party, commands.met, p1, p2))
+    else:
+        (type1, type2), *_ = types
+        box.add(Pokemon(names[0], nicknames[0], type1.name, None if type2 is None else type2.name, moves=movesets[0]))
+    app_data.save_box(box)
+    print(f"Added {' & '.join(nicknames)} to box '{box.name}'.")
+
+
+def pokemon_dex(commands: Namespace):
+    """List the species and forms starting with a prefix, with their types in a generation."""
+    pokedex = get_pokedex()
+    for name in pokedex.complete(commands.prefix, commands.limit):
+        entry = pokedex.find(name)
+        if entry is None:
+            continue
+        types = pokedex.types(entry, commands.gen)
+        shown = "/".join(t.name for t in types if t is not None) if types else f"not in generation {commands.gen}"
+        print(f"#{pokedex.dex(entry):04} {name}: {shown}")
 
 
 def pokemon_remove(commands: Namespace):
@@ -29,14 +114,25 @@ def pokemon_move(commands: Namespace):
 
 
 def pokemon_list(args: Namespace):
-    """List all Pokémon in a box."""
+    """List all Pokémon in a box, or those with a type, status or met location."""
     print(f"Listing all Pokémon in box {args.box_name}")
     app_data = AppData()
     if args.box_name not in app_data.boxes:
         print(f"Box '{args.box_name}' not found.")
         return
-    for entry in app_data.boxes[args.box_name].pc:
-        print(f"- {entry.name}")
+    box = app_data.boxes[args.box_name]
+    filters: list[tuple[FIELD, str]] = [
+        (field, value) for field in ("type", "status", "met") if (value := getattr(args, field)) is not None
+    ]
+    positions: Iterable[int] = range(len(box.pc))
+    if filters:
+        try:
+            positions = box.index.find((field, parse_key(field, value)) for field, value in filters)
+        except ValueError as e:
+            print(e)
+            return
+    for position in positions:
+        print(f"- {box.pc[position].name}")
 
 
 def pokemon_show(args: Namespace):
@@ -46,26 +142,43 @@ def pokemon_show(args: Namespace):
     if args.box_name not in app_data.boxes:
         print(f"Box '{args.box_name}' not found.")
         return
-    for entry in app_data.boxes[args.box_name].pc:
-        if entry.name == args.name:
-            if isinstance(entry, Pokemon):
-                raise NotImplementedError
-            else:
-                print(f"Soullink: {entry.name}")
-                print(f"- {entry.p1.name}:")
-                print(f"  - type1: {entry.p1.type1.name}:")
-                print(f"  - type2: {entry.p1.type2}:")
-                print(f"  - score: {entry.p1.score}:")
-                print(f"- {entry.p2.name}:")
-                print(f"  - type1: {entry.p2.type1.name}:")
-                print(f"  - type2: {entry.p2.type2}:")
-                print(f"  - score: {entry.p2.score}:")
-            break
+    box = app_data.boxes[args.box_name]
+    # Soullinks are found by their own name or the names and nicknames of either soul
+    positions = box.index.get("name", args.name)
+    if not positions:
+        print(f"Pokémon '{args.name}' not found in box '{box.name}'.")
+        return
+    entry = box.pc[positions[0]]
+    if isinstance(entry, Pokemon):
+        raise NotImplementedError
+    print(f"Soullink: {entry.name}")
+    print(f"- {entry.p1.name}:")
+    print(f"  - type1: {entry.p1.type1.name}:")
+    print(f"  - type2: {entry.p1.type2}:")
+    print(f"  - score: {entry.p1.score}:")
+    print(f"  - moves: {', '.join(entry.p1.moves) or None}:")
+    print(f"- {entry.p2.name}:")
+    print(f"  - type1: {entry.p2.type1.name}:")
+    print(f"  - type2: {entry.p2.type2}:")
+    print(f"  - score: {entry.p2.score}:")
+    print(f"  - moves: {', '.join(entry.p2.moves) or None}:")
 
 
 def pokemon_find(commands: Namespace):
-    """Find Pokémon across all boxes based on criteria."""
+    """Find Pokémon across all boxes that satisfy a query, printing each as it is found."""
     print(f"Finding Pokémon with criteria: {commands.search_criteria}")
+    try:
+        plan = compile_query(commands.search_criteria)
+    except ValueError as e:
+        print(e)
+        return
+    found = 0
+    for match in islice(run(plan), commands.limit):
+        matched = f" (matched {match.term}, {match.score:.0%})" if match.term else ""
+        print(f"- {match.label} in box '{match.box}'{matched}")
+        found += 1
+    if not found:
+        print("No Pokémon found.")
 
 
 def pokemon_export(commands: Namespace):
@@ -2,9 +2,13 @@
 
 from argparse import Namespace
 
+from pokemanager.analytics import Scoring
+from pokemanager.cli_commands.utils import print_progress
 from pokemanager.data import Box
 from pokemanager.main import AppData
+from pokemanager.progress import Progress
 from pokemanager.spreadsheet import fetch, report
+from pokemanager.teams import MemoryBudget
 
 
 def spreadsheet_fetch(args: Namespace):
@@ -21,4 +25,13 @@ def spreadsheet_report(args: Namespace):
     if args.box_name not in app_data.boxes:
         print(f"Box '{args.box_name}' not found.")
         return
-    report(app_data.boxes[args.box_name], args.worksheet_name)
+    budget = None
+    if args.memory_budget is not None:
+        budget = MemoryBudget(args.memory_budget, AppData.get_appdata().joinpath("tmp"))
+    scoring = Scoring(synergy=args.synergy, stats=args.stats, sort_by=args.sort_by)
+    progress = Progress(print_progress)
+    with progress.cancel_on_interrupt():
+        try:
+            report(app_data.boxes[args.box_name], args.worksheet_name, budget, progress, scoring=scoring)
+        except ValueError as e:
+            print(e)
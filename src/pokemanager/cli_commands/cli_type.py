@@ -0,0 +1,53 @@
+"""CLI commands for querying type matchups."""
+
+from argparse import Namespace
+
+from pokemanager.const import Dual, Type
+from pokemanager.matchup import resisting, top_attackers, walls
+from pokemanager.typer import parse_dual
+
+
+def _format(dual: Dual) -> str:
+    return "/".join(dual.display())
+
+
+def type_query_resists(args: Namespace):
+    """List the dual types that resist all of the given attacking types."""
+    types: list[Type] = []
+    for name in args.types:
+        try:
+            types.append(Type[name.title()])
+        except KeyError:
+            print(f"Unknown type: {name}")
+            return
+    duals = resisting(types, args.gen, args.at_most)
+    print(f"{len(duals)} dual types take at most x{args.at_most} from {', '.join(t.name for t in types)}:")
+    for dual in duals:
+        print(f"- {_format(dual)}")
+
+
+def type_query_attackers(args: Namespace):
+    """List the best attacking dual types against a defending dual type."""
+    try:
+        defender = parse_dual(args.defender)
+    except ValueError:
+        print(f"Unknown type: {args.defender}")
+        return
+    print(f"Top {args.top} attackers against {_format(defender)}:")
+    for attacker, matchup in top_attackers(defender, args.top, args.gen):
+        print(f"- {_format(attacker)}: {matchup:.3f}")
+
+
+def type_query_walls(args: Namespace):
+    """List the dual types that wall a team of dual types."""
+    team: list[Dual] = []
+    for member in args.team:
+        try:
+            team.append(parse_dual(member))
+        except ValueError:
+            print(f"Unknown type: {member}")
+            return
+    duals = walls(team, args.gen, args.at_most)
+    print(f"{len(duals)} dual types take at most x{args.at_most} from {', '.join(map(_format, team))}:")
+    for dual in duals:
+        print(f"- {_format(dual)}")
@@ -1,12 +1,15 @@
 """Utility classes and functions for CLI commands."""
 
+import sys
 from argparse import Action, Namespace
+from datetime import timedelta
 from pathlib import Path
 from shutil import rmtree
 
 from pokemanager import config_file
 from pokemanager.cli_commands.cli_config import default_config, get_config
 from pokemanager.main import AppData
+from pokemanager.progress import ProgressUpdate
 
 
 class ConfigAction(Action):
@@ -20,6 +23,16 @@ class ConfigAction(Action):
         setattr(namespace, "configuration", getattr(namespace, "configuration", {}) | {self.dest: values})
 
 
+def print_progress(update: ProgressUpdate):
+    """Show the progress of an analysis on a single, continually updated line."""
+    eta = f"{timedelta(seconds=round(update.eta))}" if update.eta is not None else "?"
+    line = f"{update.stage}: {update.examined}/{update.total} examined, {update.found} found, ETA {eta}"
+    if update.cancelled:
+        line = f"{update.stage}: cancelled after {update.examined}/{update.total}, keeping {update.found} found"
+    finished = update.cancelled or update.examined >= update.total
+    print(f"\r\033[K{line}", end="\n" if finished else "", file=sys.stderr, flush=True)
+
+
 def clean(_: Namespace):
     """Clean pokemanager files."""
     print("Cleaning pokemanager files...")
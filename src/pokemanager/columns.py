@@ -0,0 +1,164 @@
+"""Columnar storage of the entries of a PC.
+
+A PC can be backed by parallel arrays of its entries' types, statuses, scores and names, so that filtering it is a
+vectorised mask operation. Filters return views that select entries by index and still hand out the objects.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, Optional, TypeVar, overload
+
+import numpy as np
+import numpy.typing as npt
+
+from pokemanager.const import Type
+
+if TYPE_CHECKING:
+    from pokemanager.data import Pokemon, Soul
+
+# status bitflags of an entry, where an entry is lost or dead if any of its souls is
+LOST = 1
+DEAD = 2
+PARTY = 4
+
+NO_TYPE = 255  # the second type of a single typed soul
+
+SOUL_COLUMNS = np.dtype(
+    [
+        ("type1", "u1"),
+        ("type2", "u1"),
+        ("dual", "u1"),
+        ("status", "u1"),
+        ("score", "<f8"),
+        ("name", "<u4"),  # index into the name table
+        ("nickname", "<u4"),  # index into the name table
+    ]
+)
+
+
+class NameTable:
+    """Strings stored once in a table and referred to by index."""
+
+    def __init__(self) -> None:
+        """Initialise an empty table."""
+        self.names: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._folded: dict[str, list[int]] = {}  # casefolded string to the indices of the strings with it
+
+    def add(self, name: str) -> int:
+        """Get the index of a string, adding it to the table if it is new."""
+        if (index := self._ids.get(name)) is None:
+            index = self._ids[name] = len(self.names)
+            self.names.append(name)
+            self._folded.setdefault(name.casefold(), []).append(index)
+        return index
+
+    def find(self, name: str) -> list[int]:
+        """Get the indices of the strings equal to a string regardless of case."""
+        return self._folded.get(name.casefold(), [])
+
+    def __getitem__(self, index: int) -> str:
+        """Get the string at an index."""
+        return self.names[index]
+
+
+@dataclass(frozen=True)
+class Columns:
+    """Parallel arrays of the entries of a PC, where each entry is one or more souls."""
+
+    souls: npt.NDArray[np.void]  # entries by souls
+    status: npt.NDArray[np.uint8]
+    score: npt.NDArray[np.float64]
+    met: npt.NDArray[np.uint32]  # index into the name table
+    names: NameTable
+
+    @classmethod
+    def build(
+        cls, souls: Sequence[Sequence["Soul | Pokemon"]], party: Iterable[bool], met: Iterable[str], width: int = 1
+    ) -> "Columns":
+        """Build the columns of entries from their souls, `width` each, whether they are in the party and where met."""
+        names = NameTable()
+        rows = [
+            [
+                (
+                    soul.type1,
+                    NO_TYPE if soul.type2 is None else soul.type2,
+                    soul.dual,
+                    LOST * soul.lost | DEAD * soul.dead,
+                    soul.score,
+                    names.add(soul.name),
+                    names.add(soul.nickname),
+                )
+                for soul in entry
+            ]
+            for entry in souls
+        ]
+        columns = np.array(rows, dtype=SOUL_COLUMNS).reshape(len(souls), width)
+        status = np.bitwise_or.reduce(columns["status"], axis=1) | np.array(list(party), dtype=np.uint8) * PARTY
+        return cls(
+            souls=columns,
+            status=status.astype(np.uint8),
+            score=columns["score"].sum(axis=1),
+            met=np.array([names.add(m) for m in met], dtype=np.uint32),
+            names=names,
+        )
+
+
+T = TypeVar("T")
+
+
+class PCView(Sequence[T], Generic[T]):
+    """The entries of a PC selected by index, filtered with masks over its columns."""
+
+    def __init__(self, entries: Sequence[T], columns: Columns, indices: Optional[npt.NDArray[np.intp]] = None):
+        """Select entries of a PC, by default all of them."""
+        self.entries = entries
+        self.columns = columns
+        self.indices = np.arange(len(entries)) if indices is None else indices
+
+    def __len__(self) -> int:
+        """Get the number of selected entries."""
+        return len(self.indices)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> "PCView[T]": ...
+    def __getitem__(self, index: int | slice) -> "T | PCView[T]":
+        """Get a selected entry, or a view of a slice of them."""
+        if isinstance(index, slice):
+            return PCView(self.entries, self.columns, self.indices[index])
+        return self.entries[int(self.indices[index])]
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the selected entries."""
+        indices: list[int] = self.indices.tolist()
+        return (self.entries[i] for i in indices)
+
+    def where(self, mask: npt.NDArray[np.bool_]) -> "PCView[T]":
+        """Narrow the view to the entries for which a mask over all entries of the PC is set."""
+        return PCView(self.entries, self.columns, self.indices[mask[self.indices]])
+
+    def active(self) -> "PCView[T]":
+        """Narrow the view to entries that are not lost or dead."""
+        return self.where(self.columns.status & (LOST | DEAD) == 0)
+
+    def in_party(self) -> "PCView[T]":
+        """Narrow the view to entries in the party."""
+        return self.where(self.columns.status & PARTY != 0)
+
+    def of_type(self, type_: Type) -> "PCView[T]":
+        """Narrow the view to entries with a soul of the given type."""
+        souls = self.columns.souls
+        return self.where(((souls["type1"] == type_) | (souls["type2"] == type_)).any(axis=1))
+
+    def named(self, name: str) -> "PCView[T]":
+        """Narrow the view to entries with a soul of the given name or nickname, regardless of case."""
+        indices = self.columns.names.find(name)
+        souls = self.columns.souls
+        named = np.isin(np.stack([souls["name"], souls["nickname"]]), indices)
+        return self.where(np.any(named, axis=(0, 2)))
+
+    def met_at(self, location: str) -> "PCView[T]":
+        """Narrow the view to entries met at a location, regardless of case."""
+        return self.where(np.isin(self.columns.met, self.columns.names.find(location)))
@@ -833,352 +833,3 @@ class Dual(IntEnum):
     def display(self) -> list[TYPE]:
         """Get the display names of the types."""
         return cast(list[TYPE], self.name.split("_"))
-
-
-# SCORES = [
-#     0.06099708268989983,
-#     0.07609668309797292,
-#     0.07755098162773733,
-#     0.07528787581726906,
-#     0.06697917958709365,
-#     0.07042041698182097,
-#     0.06875172446240499,
-#     0.0694707402033407,
-#     0.07871372802753264,
-#     0.07323443566449268,
-#     0.0734142231474166,
-#     0.06896843606909984,
-#     0.07081173266313882,
-#     0.08114435019846389,
-#     0.06949257906575437,
-#     0.07174329343762528,
-#     0.08051413755887118,
-#     0.07707333217963225,
-#     0.07196733599403997,
-#     0.0822145977462367,
-#     0.08048466345048298,
-#     0.08008416541007814,
-#     0.07670186749098513,
-#     0.08061798471687527,
-#     0.07624386645555797,
-#     0.08776581339080189,
-#     0.08024170636459432,
-#     0.07842869458115684,
-#     0.07642054379060188,
-#     0.07792274132754143,
-#     0.08149382555217943,
-#     0.08108635221014555,
-#     0.07972598994678298,
-#     0.08132764024997748,
-#     0.08290273705547217,
-#     0.0738765670814289,
-#     0.08110635890290156,
-#     0.07508760465680409,
-#     0.07865085111906754,
-#     0.07859748991628117,
-#     0.08329739091634021,
-#     0.08586540296305616,
-#     0.08410507231498227,
-#     0.07687230328350217,
-#     0.0801906595523224,
-#     0.07886822172722424,
-#     0.08264157449142727,
-#     0.0814419756756884,
-#     0.07794116333602953,
-#     0.0849322782015798,
-#     0.08497007083544503,
-#     0.06678378352588568,
-#     0.07200421919651631,
-#     0.07786109803338916,
-#     0.07985640838887952,
-#     0.07850646723260973,
-#     0.08157617127878836,
-#     0.08188212837484066,
-#     0.07501370307342767,
-#     0.07833342663429348,
-#     0.07490521478869988,
-#     0.08075201112892263,
-#     0.07545277752902801,
-#     0.07617804292105185,
-#     0.08276417416423272,
-#     0.08279844458345843,
-#     0.058479650323857144,
-#     0.06882502896388686,
-#     0.06990635907412243,
-#     0.0720162836569761,
-#     0.0751690925656788,
-#     0.07250924800380361,
-#     0.06729986899770189,
-#     0.06367756447029613,
-#     0.07887237159370081,
-#     0.07510174996932503,
-#     0.06778473297611413,
-#     0.06840617970572468,
-#     0.08060977514310849,
-#     0.07258065142641656,
-#     0.06742960171786011,
-#     0.07712075551199601,
-#     0.07309356241777559,
-#     0.08328799877661246,
-#     0.07467707845151807,
-#     0.07190280073272544,
-#     0.06998267673901543,
-#     0.0729180612295194,
-#     0.07779417834499505,
-#     0.07363459971828158,
-#     0.07156548921918267,
-#     0.07870948133566741,
-#     0.07463488832787037,
-#     0.06321328111252883,
-#     0.07674894157543237,
-#     0.07688275392825408,
-#     0.07996061595312456,
-#     0.0798324598502394,
-#     0.07149471645065407,
-#     0.07753706634621016,
-#     0.08252510264731804,
-#     0.07615511893099207,
-#     0.0799705242159704,
-#     0.08384228267601063,
-#     0.07746595217275272,
-#     0.060234744856404975,
-#     0.08264010941333622,
-#     0.07383745923351437,
-#     0.07404715678160786,
-#     0.06839276056828127,
-#     0.07450480629943806,
-#     0.0774863885360134,
-#     0.0749698346445271,
-#     0.08246788120157773,
-#     0.08028592588010074,
-#     0.0766080953530492,
-#     0.07045358537239108,
-#     0.08810992765207135,
-#     0.0769272423378444,
-#     0.0805176476562979,
-#     0.07805291628650511,
-#     0.08218445669214106,
-#     0.08055778315435881,
-#     0.07872338504481863,
-#     0.08777148225173652,
-#     0.08603398554434964,
-#     0.07084952962955093,
-#     0.07216009079421647,
-#     0.07043408885235967,
-#     0.07825149419582203,
-#     0.07807127149925701,
-#     0.07453908951312235,
-#     0.0785742841357946,
-#     0.0877414002549554,
-#     0.07599463821579963,
-#     0.06406699776010721,
-#     0.0709343621377375,
-#     0.07312945035075082,
-#     0.07548329195052206,
-#     0.07054281590450659,
-#     0.07562311940066314,
-#     0.0800874072809677,
-#     0.07677641573068052,
-#     0.060195549536478946,
-#     0.07804257315381534,
-#     0.07538857286678381,
-#     0.06987853232264757,
-#     0.0703298589130096,
-#     0.08238821557889091,
-#     0.07149056170545819,
-#     0.06907626168614014,
-#     0.07761792265398405,
-#     0.07472088730144642,
-#     0.07261858900072435,
-#     0.07997836046033566,
-#     0.07979248624314776,
-#     0.06877145970112279,
-#     0.07811837052886945,
-#     0.07902191370033665,
-#     0.08683098360112304,
-#     0.08386573523321612,
-#     0.06552424292032369,
-#     0.07245435691951418,
-#     0.08577940828226004,
-#     0.07801175394504743,
-#     0.06833136120136728,
-#     0.08403167536389736,
-#     0.08080831490852695,
-#     0.07289999294553741,
-#     0.08771094821357792,
-#     0.07311026857313073,
-# ]
-
-SCORES = {
-    frozenset(("Normal",)): 0.06099708268989983,
-    frozenset(("Normal", "Fire")): 0.07609668309797292,
-    frozenset(("Normal", "Water")): 0.07755098162773733,
-    frozenset(("Normal", "Electric")): 0.07528787581726906,
-    frozenset(("Normal", "Grass")): 0.06697917958709365,
-    frozenset(("Normal", "Ice")): 0.07042041698182097,
-    frozenset(("Normal", "Fighting")): 0.06875172446240499,
-    frozenset(("Normal", "Poison")): 0.0694707402033407,
-    frozenset(("Normal", "Ground")): 0.07871372802753264,
-    frozenset(("Normal", "Flying")): 0.07323443566449268,
-    frozenset(("Normal", "Psychic")): 0.0734142231474166,
-    frozenset(("Normal", "Bug")): 0.06896843606909984,
-    frozenset(("Normal", "Rock")): 0.07081173266313882,
-    frozenset(("Normal", "Ghost")): 0.08114435019846389,
-    frozenset(("Normal", "Dragon")): 0.06949257906575437,
-    frozenset(("Normal", "Dark")): 0.07174329343762528,
-    frozenset(("Normal", "Steel")): 0.08051413755887118,
-    frozenset(("Normal", "Fairy")): 0.07707333217963225,
-    frozenset(("Fire",)): 0.07196733599403997,
-    frozenset(("Fire", "Water")): 0.0822145977462367,
-    frozenset(("Fire", "Electric")): 0.08048466345048298,
-    frozenset(("Fire", "Grass")): 0.08008416541007814,
-    frozenset(("Fire", "Ice")): 0.07670186749098513,
-    frozenset(("Fire", "Fighting")): 0.08061798471687527,
-    frozenset(("Fire", "Poison")): 0.07624386645555797,
-    frozenset(("Fire", "Ground")): 0.08776581339080189,
-    frozenset(("Fire", "Flying")): 0.08024170636459432,
-    frozenset(("Fire", "Psychic")): 0.07842869458115684,
-    frozenset(("Fire", "Bug")): 0.07642054379060188,
-    frozenset(("Fire", "Rock")): 0.07792274132754143,
-    frozenset(("Fire", "Ghost")): 0.08149382555217943,
-    frozenset(("Fire", "Dragon")): 0.08108635221014555,
-    frozenset(("Fire", "Dark")): 0.07972598994678298,
-    frozenset(("Fire", "Steel")): 0.08132764024997748,
-    frozenset(("Fire", "Fairy")): 0.08290273705547217,
-    frozenset(("Water",)): 0.0738765670814289,
-    frozenset(("Water", "Electric")): 0.08110635890290156,
-    frozenset(("Water", "Grass")): 0.07508760465680409,
-    frozenset(("Water", "Ice")): 0.07865085111906754,
-    frozenset(("Water", "Fighting")): 0.07859748991628117,
-    frozenset(("Water", "Poison")): 0.08329739091634021,
-    frozenset(("Water", "Ground")): 0.08586540296305616,
-    frozenset(("Water", "Flying")): 0.08410507231498227,
-    frozenset(("Water", "Psychic")): 0.07687230328350217,
-    frozenset(("Water", "Bug")): 0.0801906595523224,
-    frozenset(("Water", "Rock")): 0.07886822172722424,
-    frozenset(("Water", "Ghost")): 0.08264157449142727,
-    frozenset(("Water", "Dragon")): 0.0814419756756884,
-    frozenset(("Water", "Dark")): 0.07794116333602953,
-    frozenset(("Water", "Steel")): 0.0849322782015798,
-    frozenset(("Water", "Fairy")): 0.08497007083544503,
-    frozenset(("Electric",)): 0.06678378352588568,
-    frozenset(("Electric", "Grass")): 0.07200421919651631,
-    frozenset(("Electric", "Ice")): 0.07786109803338916,
-    frozenset(("Electric", "Fighting")): 0.07985640838887952,
-    frozenset(("Electric", "Poison")): 0.07850646723260973,
-    frozenset(("Electric", "Ground")): 0.08157617127878836,
-    frozenset(("Electric", "Flying")): 0.08188212837484066,
-    frozenset(("Electric", "Psychic")): 0.07501370307342767,
-    frozenset(("Electric", "Bug")): 0.07833342663429348,
-    frozenset(("Electric", "Rock")): 0.07490521478869988,
-    frozenset(("Electric", "Ghost")): 0.08075201112892263,
-    frozenset(("Electric", "Dragon")): 0.07545277752902801,
-    frozenset(("Electric", "Dark")): 0.07617804292105185,
-    frozenset(("Electric", "Steel")): 0.08276417416423272,
-    frozenset(("Electric", "Fairy")): 0.08279844458345843,
-    frozenset(("Grass",)): 0.058479650323857144,
-    frozenset(("Grass", "Ice")): 0.06882502896388686,
-    frozenset(("Grass", "Fighting")): 0.06990635907412243,
-    frozenset(("Grass", "Poison")): 0.0720162836569761,
-    frozenset(("Grass", "Ground")): 0.0751690925656788,
-    frozenset(("Grass", "Flying")): 0.07250924800380361,
-    frozenset(("Grass", "Psychic")): 0.06729986899770189,
-    frozenset(("Grass", "Bug")): 0.06367756447029613,
-    frozenset(("Grass", "Rock")): 0.07887237159370081,
-    frozenset(("Grass", "Ghost")): 0.07510174996932503,
-    frozenset(("Grass", "Dragon")): 0.06778473297611413,
-    frozenset(("Grass", "Dark")): 0.06840617970572468,
-    frozenset(("Grass", "Steel")): 0.08060977514310849,
-    frozenset(("Grass", "Fairy")): 0.07258065142641656,
-    frozenset(("Ice",)): 0.06742960171786011,
-    frozenset(("Ice", "Fighting")): 0.07712075551199601,
-    frozenset(("Ice", "Poison")): 0.07309356241777559,
-    frozenset(("Ice", "Ground")): 0.08328799877661246,
-    frozenset(("Ice", "Flying")): 0.07467707845151807,
-    frozenset(("Ice", "Psychic")): 0.07190280073272544,
-    frozenset(("Ice", "Bug")): 0.06998267673901543,
-    frozenset(("Ice", "Rock")): 0.0729180612295194,
-    frozenset(("Ice", "Ghost")): 0.07779417834499505,
-    frozenset(("Ice", "Dragon")): 0.07363459971828158,
-    frozenset(("Ice", "Dark")): 0.07156548921918267,
-    frozenset(("Ice", "Steel")): 0.07870948133566741,
-    frozenset(("Ice", "Fairy")): 0.07463488832787037,
-    frozenset(("Fighting",)): 0.06321328111252883,
-    frozenset(("Fighting", "Poison")): 0.07674894157543237,
-    frozenset(("Fighting", "Ground")): 0.07688275392825408,
-    frozenset(("Fighting", "Flying")): 0.07996061595312456,
-    frozenset(("Fighting", "Psychic")): 0.0798324598502394,
-    frozenset(("Fighting", "Bug")): 0.07149471645065407,
-    frozenset(("Fighting", "Rock")): 0.07753706634621016,
-    frozenset(("Fighting", "Ghost")): 0.08252510264731804,
-    frozenset(("Fighting", "Dragon")): 0.07615511893099207,
-    frozenset(("Fighting", "Dark")): 0.0799705242159704,
-    frozenset(("Fighting", "Steel")): 0.08384228267601063,
-    frozenset(("Fighting", "Fairy")): 0.07746595217275272,
-    frozenset(("Poison",)): 0.060234744856404975,
-    frozenset(("Poison", "Ground")): 0.08264010941333622,
-    frozenset(("Poison", "Flying")): 0.07383745923351437,
-    frozenset(("Poison", "Psychic")): 0.07404715678160786,
-    frozenset(("Poison", "Bug")): 0.06839276056828127,
-    frozenset(("Poison", "Rock")): 0.07450480629943806,
-    frozenset(("Poison", "Ghost")): 0.0774863885360134,
-    frozenset(("Poison", "Dragon")): 0.0749698346445271,
-    frozenset(("Poison", "Dark")): 0.08246788120157773,
-    frozenset(("Poison", "Steel")): 0.08028592588010074,
-    frozenset(("Poison", "Fairy")): 0.0766080953530492,
-    frozenset(("Ground",)): 0.07045358537239108,
-    frozenset(("Ground", "Flying")): 0.08810992765207135,
-    frozenset(("Ground", "Psychic")): 0.0769272423378444,
-    frozenset(("Ground", "Bug")): 0.0805176476562979,
-    frozenset(("Ground", "Rock")): 0.07805291628650511,
-    frozenset(("Ground", "Ghost")): 0.08218445669214106,
-    frozenset(("Ground", "Dragon")): 0.08055778315435881,
-    frozenset(("Ground", "Dark")): 0.07872338504481863,
-    frozenset(("Ground", "Steel")): 0.08777148225173652,
-    frozenset(("Ground", "Fairy")): 0.08603398554434964,
-    frozenset(("Flying",)): 0.07084952962955093,
-    frozenset(("Flying", "Psychic")): 0.07216009079421647,
-    frozenset(("Flying", "Bug")): 0.07043408885235967,
-    frozenset(("Flying", "Rock")): 0.07825149419582203,
-    frozenset(("Flying", "Ghost")): 0.07807127149925701,
-    frozenset(("Flying", "Dragon")): 0.07453908951312235,
-    frozenset(("Flying", "Dark")): 0.0785742841357946,
-    frozenset(("Flying", "Steel")): 0.0877414002549554,
-    frozenset(("Flying", "Fairy")): 0.07599463821579963,
-    frozenset(("Psychic",)): 0.06406699776010721,
-    frozenset(("Psychic", "Bug")): 0.0709343621377375,
-    frozenset(("Psychic", "Rock")): 0.07312945035075082,
-    frozenset(("Psychic", "Ghost")): 0.07548329195052206,
-    frozenset(("Psychic", "Dragon")): 0.07054281590450659,
-    frozenset(("Psychic", "Dark")): 0.07562311940066314,
-    frozenset(("Psychic", "Steel")): 0.0800874072809677,
-    frozenset(("Psychic", "Fairy")): 0.07677641573068052,
-    frozenset(("Bug",)): 0.060195549536478946,
-    frozenset(("Bug", "Rock")): 0.07804257315381534,
-    frozenset(("Bug", "Ghost")): 0.07538857286678381,
-    frozenset(("Bug", "Dragon")): 0.06987853232264757,
-    frozenset(("Bug", "Dark")): 0.0703298589130096,
-    frozenset(("Bug", "Steel")): 0.08238821557889091,
-    frozenset(("Bug", "Fairy")): 0.07149056170545819,
-    frozenset(("Rock",)): 0.06907626168614014,
-    frozenset(("Rock", "Ghost")): 0.07761792265398405,
-    frozenset(("Rock", "Dragon")): 0.07472088730144642,
-    frozenset(("Rock", "Dark")): 0.07261858900072435,
-    frozenset(("Rock", "Steel")): 0.07997836046033566,
-    frozenset(("Rock", "Fairy")): 0.07979248624314776,
-    frozenset(("Ghost",)): 0.06877145970112279,
-    frozenset(("Ghost", "Dragon")): 0.07811837052886945,
-    frozenset(("Ghost", "Dark")): 0.07902191370033665,
-    frozenset(("Ghost", "Steel")): 0.08683098360112304,
-    frozenset(("Ghost", "Fairy")): 0.08386573523321612,
-    frozenset(("Dragon",)): 0.06552424292032369,
-    frozenset(("Dragon", "Dark")): 0.07245435691951418,
-    frozenset(("Dragon", "Steel")): 0.08577940828226004,
-    frozenset(("Dragon", "Fairy")): 0.07801175394504743,
-    frozenset(("Dark",)): 0.06833136120136728,
-    frozenset(("Dark", "Steel")): 0.08403167536389736,
-    frozenset(("Dark", "Fairy")): 0.08080831490852695,
-    frozenset(("Steel",)): 0.07289999294553741,
-    frozenset(("Steel", "Fairy")): 0.08771094821357792,
-    frozenset(("Fairy",)): 0.07311026857313073,
-}
@@ -0,0 +1,147 @@
+"""Weakness, resistance and immunity profiles of dual types as bitsets.
+
+Bit `t` of a profile is set when attacking type `t` has that effect on the dual type, so team coverage is a few
+integer operations over the members' profiles. Teams are arrays of dual ids whose last axis holds the members, so
+a single team and millions of candidate teams are checked alike. The dual types a Pokémon hits super effectively are
+packed as bits the same way, one bit per defending dual type.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+from pokemanager.const import GENS, Dual, Type
+from pokemanager.movedex import get_movedex
+from pokemanager.typer import chart_era, get_dual_type_chart, get_gen_duals, get_gen_types, get_type_vs_dual_chart
+
+if TYPE_CHECKING:
+    from pokemanager.data import Pokemon, Soul
+
+MASK = np.uint32
+HIT_BYTES = (len(Dual) + 7) // 8  # the dual types a Pokémon hits super effectively, packed as bits
+
+Teams: TypeAlias = npt.ArrayLike  # dual ids, with the members of each team along the last axis
+
+
+@dataclass(frozen=True)
+class Profiles:
+    """The 18-bit profiles of every dual type under one type chart."""
+
+    weak: npt.NDArray[np.uint32]
+    resist: npt.NDArray[np.uint32]
+    immune: npt.NDArray[np.uint32]
+    # the attacking types that exist in the chart's generation
+    types: int
+
+
+def _bits(table: npt.NDArray[np.bool_]) -> npt.NDArray[np.uint32]:
+    """Pack a boolean table of attacking types by dual types into a mask per dual type."""
+    masks = (table.astype(MASK) << np.arange(len(Type), dtype=MASK)[:, None]).sum(axis=0, dtype=MASK)
+    masks.flags.writeable = False
+    return masks
+
+
+@cache
+def _get_era_profiles(era: GENS) -> Profiles:
+    chart = get_type_vs_dual_chart(era)
+    exists = get_gen_types(era)
+    return Profiles(
+        weak=_bits(chart > 1),
+        resist=_bits((chart > 0) & (chart < 1)),
+        immune=_bits(chart == 0),
+        types=int(_bits(exists[:, None])[0]),
+    )
+
+
+def get_profiles(gen: GENS = 9) -> Profiles:
+    """Get the profiles of every dual type in a generation."""
+    return _get_era_profiles(chart_era(gen))
+
+
+@cache
+def _get_era_super_effective(era: GENS) -> npt.NDArray[np.uint8]:
+    """Get, per attacking dual type, the existing defending dual types it hits super effectively, packed as bits."""
+    packed = np.packbits((get_dual_type_chart(era) > 1) & get_gen_duals(era), axis=1)
+    packed.flags.writeable = False
+    return packed
+
+
+@cache
+def _get_era_move_super_effective(era: GENS) -> npt.NDArray[np.uint8]:
+    """Get, per move and a last row for unknown moves, the existing dual types it hits super effectively, packed."""
+    moves = get_movedex().moves
+    hits = (get_type_vs_dual_chart(era) > 1) & get_gen_duals(era) & get_gen_types(era)[:, None]
+    table = np.zeros((len(moves) + 1, hits.shape[1]), dtype=np.bool_)
+    # status moves hit nothing
+    table[:-1] = hits[moves["type"]] & (moves["power"] > 0)[:, None]
+    packed = np.packbits(table, axis=1)
+    packed.flags.writeable = False
+    return packed
+
+
+def super_effective(souls: Sequence["Pokemon | Soul"], gen: GENS = 9) -> npt.NDArray[np.uint8]:
+    """Get the existing dual types each Pokémon hits super effectively, packed as bits, one row each.
+
+    A Pokémon with a moveset attacks with its moves, ignoring unknown ones, and one without with its own types.
+    """
+    era = chart_era(gen)
+    hits = _get_era_super_effective(era)[np.array([pk.dual for pk in souls], dtype=np.intp)]
+    movedex = get_movedex()
+    for row, pk in enumerate(souls):
+        if pk.moves:
+            moves = [len(movedex) if (move := movedex.find(name)) is None else move for name in pk.moves]
+            hits[row] = np.bitwise_or.reduce(_get_era_move_super_effective(era)[moves], axis=0)
+    return hits
+
+
+def _members(teams: Teams) -> npt.NDArray[np.intp]:
+    return np.moveaxis(np.asarray(teams, dtype=np.intp), -1, 0)
+
+
+def unresisted(teams: Teams, gen: GENS = 9) -> npt.NDArray[np.uint32]:
+    """Get the attacking types that no member of each team resists or is immune to."""
+    profiles = get_profiles(gen)
+    covered = profiles.resist | profiles.immune
+    return MASK(profiles.types) & ~np.bitwise_or.reduce(covered[_members(teams)], axis=0)
+
+
+def immunities(teams: Teams, gen: GENS = 9) -> npt.NDArray[np.uint32]:
+    """Get the attacking types that some member of each team is immune to."""
+    profiles = get_profiles(gen)
+    return np.bitwise_or.reduce(profiles.immune[_members(teams)], axis=0)
+
+
+def count_at_least(masks: Sequence[npt.NDArray[np.uint32]], at_least: int) -> npt.NDArray[np.uint32]:
+    """Get the bits set in at least the given number of masks, counting with bit-sliced adders.
+
+    Each bit position keeps its own binary counter, stored across planes where plane `i` holds bit `i` of every
+    counter, so adding a mask to all counters at once is a ripple of ANDs and XORs through the planes.
+    """
+    planes: list[npt.NDArray[np.uint32]] = []
+    for mask in masks:
+        carry = mask
+        for i, plane in enumerate(planes):
+            planes[i], carry = plane ^ carry, plane & carry
+        if np.any(carry):
+            planes.append(carry)
+    # compare every counter with the threshold from the most significant plane down
+    greater = MASK(0)
+    equal = ~MASK(0)
+    for i in reversed(range(max(len(planes), at_least.bit_length()))):
+        plane = planes[i] if i < len(planes) else MASK(0)
+        if at_least >> i & 1:
+            equal = equal & plane
+        else:
+            greater = greater | equal & plane
+            equal = equal & ~plane
+    return np.asarray(greater | equal, dtype=np.uint32)
+
+
+def shared_weaknesses(teams: Teams, at_least: int = 3, gen: GENS = 9) -> npt.NDArray[np.uint32]:
+    """Get the attacking types that at least the given number of members of each team are weak to."""
+    profiles = get_profiles(gen)
+    return count_at_least([profiles.weak[member] for member in _members(teams)], at_least) & MASK(profiles.types)
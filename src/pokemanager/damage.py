@@ -0,0 +1,148 @@
+"""Approximate damage ranges of attacks, worked out over whole arrays of attackers and defenders at once.
+
+Damage follows the standard formula of the later generations: base damage from the attacker's level, the move's
+power and the ratio of the attacking to the defending stat, then a random roll from 85% to 100%, the same type attack
+bonus and the type effectiveness, each rounded down in turn. Critical hits, abilities, items, weather and stat stages
+are left out. Stats are worked out from base stats at a level, with average IVs, no EVs and a neutral nature.
+
+Every move of every attacker is evaluated against every defender in one broadcast, as arrays of shape
+(attackers, moves, defenders), and the type effectiveness is gathered from the array-backed type chart.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from pokemanager.const import GENS, Type
+from pokemanager.data import Pokemon, Soul
+from pokemanager.movedex import CATEGORIES, get_movedex
+from pokemanager.stats import species_stats
+from pokemanager.typer import get_type_vs_dual_chart
+
+ROLLS = (85, 100)  # lowest and highest random roll, in percent
+IV = 15  # average individual value of every stat
+ASSUMED_POWER = 80  # power of the attacks of each of its types assumed of a Pokémon without a moveset
+SPLIT_GEN = 4  # first generation where a move's category is its own, rather than that of its type
+PHYSICAL_TYPES = frozenset(
+    {Type.Normal, Type.Fighting, Type.Flying, Type.Poison, Type.Ground, Type.Rock, Type.Bug, Type.Ghost, Type.Steel}
+)
+PHYSICAL, SPECIAL, STATUS = (CATEGORIES.index(category) for category in ("physical", "special", "status"))
+
+
+@dataclass(frozen=True)
+class Moves:
+    """The moves of a batch of attackers, one row per attacker, padded with moves of no power."""
+
+    type: npt.NDArray[np.intp]
+    category: npt.NDArray[np.intp]
+    power: npt.NDArray[np.intp]
+    stab: npt.NDArray[np.bool_]  # the move has one of the attacker's types
+    names: tuple[tuple[str, ...], ...]
+
+
+@dataclass(frozen=True)
+class Fighters:
+    """A batch of Pokémon on one side of a fight, one row each."""
+
+    levels: npt.NDArray[np.intp]
+    stats: npt.NDArray[np.intp]
+    duals: npt.NDArray[np.intp]
+
+    @classmethod
+    def build(cls, entries: npt.ArrayLike, levels: npt.ArrayLike, duals: npt.ArrayLike) -> "Fighters":
+        """Build fighters from their pokedex entries, levels and dual ids, working out their stats."""
+        levels = np.asarray(levels, dtype=np.intp)
+        return cls(levels, calc_stats(species_stats(entries), levels), np.asarray(duals, dtype=np.intp))
+
+
+def calc_stats(base: npt.ArrayLike, levels: npt.ArrayLike, iv: int = IV) -> npt.NDArray[np.intp]:
+    """Get the stats of Pokémon from their base stats, one row each, at their levels."""
+    base = np.asarray(base, dtype=np.intp)
+    levels = np.asarray(levels, dtype=np.intp)[..., None]
+    stats = (2 * base + iv) * levels // 100 + 5
+    # HP grows with the level itself too
+    stats[..., 0] += levels[..., 0] + 5
+    return stats
+
+
+def get_moves(pokemon: Sequence[Pokemon | Soul], stats: npt.NDArray[np.intp], gen: GENS = 9) -> Moves:
+    """Get the moves of Pokémon, ignoring unknown moves.
+
+    A Pokémon without a moveset is assumed to have an attack of each of its types, in the category of its higher
+    attacking stat.
+
+    Args:
+        pokemon: The attacking Pokémon.
+        stats: Their stats, one row each.
+        gen: The generation, before which the category of a move is that of its type.
+    """
+    movedex = get_movedex()
+    categories, powers = movedex.moves["category"].tolist(), movedex.moves["power"].tolist()
+    rows: list[list[tuple[Type, int, int, str]]] = []
+    for pk, (_, attack, _, special, _, _) in zip(pokemon, stats.tolist()):
+        if pk.moves:
+            known = [move for name in pk.moves if (move := movedex.find(name)) is not None]
+            row = [(movedex.type(m), categories[m], powers[m], movedex.names[m]) for m in known]
+        else:
+            category = PHYSICAL if attack >= special else SPECIAL
+            types = [t for t in (pk.type1, pk.type2) if t is not None]
+            row = [(t, category, ASSUMED_POWER, f"{t.name} attack") for t in dict.fromkeys(types)]
+        if gen < SPLIT_GEN:
+            row = [(t, c if c == STATUS else PHYSICAL if t in PHYSICAL_TYPES else SPECIAL, p, n) for t, c, p, n in row]
+        rows.append(row)
+    width = max(map(len, rows), default=0) or 1
+    padded = [row + [(Type.Normal, STATUS, 0, "")] * (width - len(row)) for row in rows]
+    table = np.array([[(t, c, p) for t, c, p, _ in row] for row in padded], dtype=np.intp).reshape(len(rows), width, 3)
+    return Moves(
+        type=table[..., 0],
+        category=table[..., 1],
+        power=table[..., 2],
+        stab=np.array(
+            [[t in (pk.type1, pk.type2) for t, _, _, _ in row] for pk, row in zip(pokemon, padded)], dtype=np.bool_
+        ).reshape(len(rows), width),
+        names=tuple(tuple(n for _, _, _, n in row) for row in padded),
+    )
+
+
+def damage_ranges(
+    attackers: Fighters, moves: Moves, defenders: Fighters, gen: GENS = 9
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Get the lowest and highest damage of every move of every attacker against every defender.
+
+    Args:
+        attackers: The attacking Pokémon.
+        moves: The moves of the attackers.
+        defenders: The defending Pokémon.
+        gen: The generation whose type chart is used.
+
+    Returns:
+        The lowest and highest damage, each of shape (attackers, moves, defenders).
+    """
+    physical = (moves.category == PHYSICAL)[..., None]
+    attack = np.where(physical, attackers.stats[:, None, None, 1], attackers.stats[:, None, None, 3])
+    defense = np.where(physical, defenders.stats[None, None, :, 2], defenders.stats[None, None, :, 4])
+    level = attackers.levels[:, None, None]
+    power = moves.power[..., None]
+    base = (2 * level // 5 + 2) * power * attack // np.maximum(defense, 1) // 50 + 2
+    effectiveness = get_type_vs_dual_chart(gen)[moves.type[..., None], defenders.duals]
+    damaging = (power > 0) & (effectiveness > 0)
+
+    def roll(percent: int) -> npt.NDArray[np.intp]:
+        damage = base * percent // 100
+        damage = np.where(moves.stab[..., None], damage * 3 // 2, damage)
+        damage = np.floor(damage * effectiveness).astype(np.intp)
+        # a move that is not ineffective deals at least 1
+        return np.where(damaging, np.maximum(damage, 1), 0)
+
+    return roll(ROLLS[0]), roll(ROLLS[1])
+
+
+def best_ranges(
+    low: npt.NDArray[np.intp], high: npt.NDArray[np.intp]
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Get the damage range of each attacker's most damaging move against each defender, with that move's index."""
+    best = high.argmax(axis=1)
+    pick = best[:, None, :]
+    return np.take_along_axis(low, pick, axis=1)[:, 0], np.take_along_axis(high, pick, axis=1)[:, 0], best
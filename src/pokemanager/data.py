@@ -1,83 +1,234 @@
 """."""
 
-from dataclasses import InitVar, dataclass, field
-from itertools import combinations
+import sys
+from collections.abc import Iterable
+from copy import copy
+from dataclasses import MISSING, InitVar, dataclass, field, fields
+from functools import cache
+from itertools import combinations, islice
+from math import comb
 from pathlib import Path
-from typing import Generic, Literal, Optional, TypeVar
+from typing import Any, Generic, Literal, Optional, Self, SupportsIndex, TypeVar
 
-from pokemanager.const import GAME_TO_GEN, GAMES, GENS, SCORES, TYPE, Dual, Type
+import numpy as np
+import numpy.typing as npt
+
+from pokemanager.columns import Columns, PCView
+from pokemanager.const import GAME_TO_GEN, GAMES, GENS, TYPE, Dual, Type
+from pokemanager.coverage import HIT_BYTES, get_profiles, super_effective
+from pokemanager.indexes import BoxIndex
+from pokemanager.pokedex import EMPTY, get_pokedex
+from pokemanager.progress import Progress
+from pokemanager.typer import get_dual, get_gen_duals, get_scores
 from pokemanager.utils import URL
 
 
-@dataclass(frozen=True)
-class Soul:
+@dataclass(frozen=True, slots=True)
+class TypeRecord:
+    """The types of a Pokémon and the score they earn in a generation, shared by every Pokémon with those types."""
+
+    type1: Type
+    type2: Optional[Type]
+    dual: Dual
+    gen: GENS = field(compare=False)
+    score: float = field(compare=False)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the record as its types and generation, so a loaded record is the shared one again."""
+        return get_type_record, (self.type1, self.type2, self.gen)
+
+
+def get_type_record(type1: Type, type2: Optional[Type] = None, gen: GENS = 9) -> TypeRecord:
+    """Get the shared type record of a pair of types in a generation."""
+    # cached by position only, so every way of passing the same types gets the same record
+    return _get_type_record(type1, type2, gen)
+
+
+@cache
+def _get_type_record(type1: Type, type2: Optional[Type], gen: GENS) -> TypeRecord:
+    dual = get_dual(type1, type2)
+    return TypeRecord(type1, type2, dual, gen, float(get_scores(gen)[dual]))
+
+
+@cache
+def _field_names(cls: type, compared: bool = False) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls) if f.compare or not compared)
+
+
+@cache
+def _field_defaults(cls: type) -> dict[str, Any]:
+    return {f.name: f.default for f in fields(cls) if f.default is not MISSING}
+
+
+class _Fields:
+    """A slotted record pickled by the names of its fields, so records pickled before a field was added load."""
+
+    __slots__ = ()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the fields of the record by name."""
+        return {name: getattr(self, name) for name in _field_names(type(self))}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the record from its pickled fields, or from the __dict__ pickled before it had slots."""
+        # fields added since the record was pickled take their defaults
+        for name, value in (_field_defaults(type(self)) | self._upgrade(dict(state))).items():
+            object.__setattr__(self, name, value)
+
+    def _upgrade(self, state: dict[str, Any]) -> dict[str, Any]:
+        """Convert the fields of a record pickled by an earlier release into its current fields."""
+        if "type1" in state:
+            # Pokémon used to be saved with their own types and scores, rather than a shared type record
+            state["types"] = get_type_record(state.pop("type1"), state.pop("type2"))
+            state.pop("score", None)
+        return state
+
+
+class _Record(_Fields):
+    """A frozen record that caches its hash in a slot outside its fields, so the hash is neither compared nor saved."""
+
+    __slots__ = ("_hash",)
+
+    def __hash__(self) -> int:
+        """Hash the compared fields once, caching the result."""
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash(tuple(getattr(self, name) for name in _field_names(type(self), compared=True)))
+            object.__setattr__(self, "_hash", value)
+            return value
+
+
+class _Typed(_Record):
+    """A Pokémon, whose types and score are those of a shared type record."""
+
+    __slots__ = ()
+    types: TypeRecord
+
+    @property
+    def type1(self) -> Type:
+        """The elected type."""
+        return self.types.type1
+
+    @property
+    def type2(self) -> Optional[Type]:
+        """The auxiliary type, if any."""
+        return self.types.type2
+
+    @property
+    def dual(self) -> Dual:
+        """The dual type of both types."""
+        return self.types.dual
+
+    @property
+    def score(self) -> float:
+        """The score of the types in the generation of the type record."""
+        return self.types.score
+
+    def in_gen(self, gen: GENS) -> Self:
+        """Get the Pokémon with the type record of a generation, itself if it already has it."""
+        types = get_type_record(self.type1, self.type2, gen)
+        if types is self.types:
+            return self
+        pk = copy(self)
+        object.__setattr__(pk, "types", types)
+        return pk
+
+
+def _intern_fields(pk: "Soul | Pokemon", elected_type: TYPE, auxiliary_type: Optional[TYPE], gen: GENS) -> None:
+    """Intern the names of a new Pokémon and point it at the type record of its types in a generation."""
+    object.__setattr__(pk, "name", sys.intern(pk.name))
+    object.__setattr__(pk, "nickname", sys.intern(pk.nickname))
+    object.__setattr__(pk, "moves", tuple(sys.intern(move) for move in pk.moves))
+    type2 = None if auxiliary_type is None else Type[auxiliary_type]
+    object.__setattr__(pk, "types", get_type_record(Type[elected_type], type2, gen))
+
+
+@dataclass(frozen=True, slots=True)
+class Soul(_Typed):
     """A Pokémon Soul."""
 
     name: str
     nickname: str
     elected_type: InitVar[TYPE]
     auxiliary_type: InitVar[Optional[TYPE]] = None
-    type1: Type = field(init=False)
-    type2: Optional[Type] = field(init=False)
+    types: TypeRecord = field(init=False)
     lost: bool = False
     dead: bool = False
-    score: float = field(init=False)
-
-    def __post_init__(self, elected_type: TYPE, auxiliary_type: Optional[TYPE]):
-        """Set type1, type2, and score after initialization."""
-        object.__setattr__(self, "type1", Type[elected_type])
-        if auxiliary_type is None:
-            object.__setattr__(self, "type2", None)
-            object.__setattr__(self, "score", SCORES[frozenset((elected_type,))])
-        else:
-            object.__setattr__(self, "type2", Type[auxiliary_type])
-            object.__setattr__(self, "score", SCORES[frozenset((elected_type, auxiliary_type))])
+    moves: tuple[str, ...] = ()
+    gen: InitVar[GENS] = 9
+
+    def __post_init__(self, elected_type: TYPE, auxiliary_type: Optional[TYPE], gen: GENS):
+        """Intern the names and share the type record of the types in the generation."""
+        _intern_fields(self, elected_type, auxiliary_type, gen)
+
+    __hash__ = _Record.__hash__
+    __getstate__ = _Fields.__getstate__
+    __setstate__ = _Fields.__setstate__
 
 
-@dataclass(frozen=True)
-class Pokemon:
+@dataclass(frozen=True, slots=True)
+class Pokemon(_Typed):
     """A Pokémon."""
 
-    party: bool = field(init=False)
-    met: str = field(init=False)
+    party: bool = field(init=False, default=False)
+    met: str = field(init=False, default="")
     name: str
     nickname: str
     elected_type: InitVar[TYPE]
     auxiliary_type: InitVar[Optional[TYPE]] = None
-    type1: Type = field(init=False)
-    type2: Optional[Type] = field(init=False)
+    types: TypeRecord = field(init=False)
     lost: bool = False
     dead: bool = False
-    score: float = field(init=False)
-
-    def __post_init__(self, elected_type: TYPE, auxiliary_type: Optional[TYPE]):
-        """Set dual and score after initialization."""
-        object.__setattr__(self, "type1", Type[elected_type])
-        if auxiliary_type is None:
-            object.__setattr__(self, "type2", None)
-            object.__setattr__(self, "score", SCORES[frozenset((elected_type,))])
-        else:
-            object.__setattr__(self, "type2", Type[auxiliary_type])
-            object.__setattr__(self, "score", SCORES[frozenset((elected_type, auxiliary_type))])
+    moves: tuple[str, ...] = ()
+    gen: InitVar[GENS] = 9
+
+    def __post_init__(self, elected_type: TYPE, auxiliary_type: Optional[TYPE], gen: GENS):
+        """Intern the names and share the type record of the types in the generation."""
+        _intern_fields(self, elected_type, auxiliary_type, gen)
+
+    __hash__ = _Record.__hash__
+    __getstate__ = _Fields.__getstate__
+    __setstate__ = _Fields.__setstate__
 
     def is_lost_or_dead(self) -> bool:
         """Check if pokemon is lost or dead."""
         return self.lost or self.dead
 
 
-@dataclass(frozen=True)
-class Soullink:
+@dataclass(frozen=True, slots=True)
+class Soullink(_Record):
     """A soullink between two Pokémon souls."""
 
     party: bool
     met: str
     p1: Soul
     p2: Soul
-    name: str = field(init=False)
 
     def __post_init__(self) -> None:
-        """Initialise the name of the soullink."""
-        object.__setattr__(self, "name", f"{self.p1.name} & {self.p2.name}")
+        """Intern the location."""
+        object.__setattr__(self, "met", sys.intern(self.met))
+
+    __hash__ = _Record.__hash__
+    __getstate__ = _Fields.__getstate__
+    __setstate__ = _Fields.__setstate__
+
+    def _upgrade(self, state: dict[str, Any]) -> dict[str, Any]:
+        # soullinks used to store their names
+        state.pop("name", None)
+        return state
+
+    @property
+    def name(self) -> str:
+        """The name of the soullink."""
+        return f"{self.p1.name} & {self.p2.name}"
+
+    def in_gen(self, gen: GENS) -> "Soullink":
+        """Get the Soullink with the type records of a generation, itself if both souls already have them."""
+        p1, p2 = self.p1.in_gen(gen), self.p2.in_gen(gen)
+        if p1 is self.p1 and p2 is self.p2:
+            return self
+        return Soullink(self.party, self.met, p1, p2)
 
     def is_lost(self) -> bool:
         """Check if either soul is lost."""
@@ -91,6 +242,10 @@ class Soullink:
         """Check if either soul is lost or dead."""
         return self.is_dead() or self.is_lost()
 
+    def get_type_mask(self) -> int:
+        """Get a bitmask of the elected types of both souls."""
+        return 1 << self.p1.type1 | 1 << self.p2.type1
+
     def get_data(self) -> list[bool | str]:
         """Get soullink data as a list."""
         return [
@@ -111,23 +266,238 @@ class Soullink:
         ]
 
 
-class StandardPC(list[Pokemon]):
+T = TypeVar("T")
+
+
+class _CachedPC(list[T], Generic[T]):
+    """A PC that caches arrays built from its entries, dropping them whenever it changes and never saving them."""
+
+    _columns: Optional[Columns]
+
+    def _invalidate(self) -> None:
+        """Drop the arrays built from the entries, since every attribute of a PC is one."""
+        vars(self).clear()
+
+    def __getstate__(self) -> None:
+        """Save only the entries, since the arrays built from them may be stale when loaded."""
+        return None
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Drop the arrays saved with PCs before they were excluded."""
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Replace an entry, or a slice of them."""
+        super().__setitem__(index, value)
+        self._invalidate()
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        """Remove an entry, or a slice of them."""
+        super().__delitem__(index)
+        self._invalidate()
+
+    def __iadd__(self, entries: Iterable[T]) -> Self:
+        """Add entries in place."""
+        self.extend(entries)
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> Self:
+        """Repeat the entries in place."""
+        super().__imul__(count)
+        self._invalidate()
+        return self
+
+    def append(self, entry: T) -> None:
+        """Add an entry."""
+        super().append(entry)
+        self._invalidate()
+
+    def extend(self, entries: Iterable[T]) -> None:
+        """Add entries."""
+        super().extend(entries)
+        self._invalidate()
+
+    def insert(self, index: SupportsIndex, entry: T) -> None:
+        """Add an entry before an index."""
+        super().insert(index, entry)
+        self._invalidate()
+
+    def pop(self, index: SupportsIndex = -1) -> T:
+        """Remove and return the entry at an index."""
+        entry = super().pop(index)
+        self._invalidate()
+        return entry
+
+    def remove(self, entry: T) -> None:
+        """Remove the first occurrence of an entry."""
+        super().remove(entry)
+        self._invalidate()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        super().clear()
+        self._invalidate()
+
+    def sort(self, *, key: Any = None, reverse: bool = False) -> None:
+        """Sort the entries in place."""
+        super().sort(key=key, reverse=reverse)
+        self._invalidate()
+
+    def reverse(self) -> None:
+        """Reverse the entries in place."""
+        super().reverse()
+        self._invalidate()
+
+
+class StandardPC(_CachedPC[Pokemon]):
     """A PC containing Pokémon."""
 
-    def get_active(self) -> "StandardPC":
-        """Get all active Pokémon (not lost or dead)."""
-        return StandardPC(pk for pk in self if not pk.is_lost_or_dead())
+    def get_columns(self) -> Columns:
+        """Get the columnar backing of the PC, building it on first use or after the PC has changed."""
+        if (columns := getattr(self, "_columns", None)) is None:
+            columns = self._columns = Columns.build(
+                [(pk,) for pk in self], (pk.party for pk in self), (pk.met for pk in self)
+            )
+        return columns
+
+    def view(self) -> PCView[Pokemon]:
+        """Get a view of every Pokémon, to be narrowed with vectorised filters."""
+        return PCView(self, self.get_columns())
 
+    def get_active(self) -> PCView[Pokemon]:
+        """Get a view of all active Pokémon (not lost or dead)."""
+        return self.view().active()
 
-class SoullinkPC(list[Soullink]):
+
+# the features of a Soullink that analyses read, one record per Soullink in a PC
+LINK_FEATURES = np.dtype(
+    [
+        ("score", "<f8"),  # summed score of both souls
+        ("mask", "<u4"),  # bitmask of the elected types of both souls
+        ("weak", "<u4"),  # bitmask of the attacking types either soul is weak to
+        ("p1", "u1"),  # dual type of the first soul
+        ("p2", "u1"),  # dual type of the second soul
+        ("s1", "<u2"),  # pokedex entry of the species of the first soul, EMPTY if unknown
+        ("s2", "<u2"),  # pokedex entry of the species of the second soul, EMPTY if unknown
+        ("h1", "u1", (HIT_BYTES,)),  # dual types the first soul hits super effectively, packed as bits
+        ("h2", "u1", (HIT_BYTES,)),  # dual types the second soul hits super effectively, packed as bits
+        ("active", "?"),  # neither soul is lost or dead
+    ]
+)
+
+
+class SoullinkPC(_CachedPC[Soullink]):
     """A PC containing Soullinks."""
 
-    def get_active(self) -> "SoullinkPC":
-        """Get all active Soullinks (not lost or dead)."""
-        return SoullinkPC(sl for sl in self if not sl.is_lost_or_dead())
+    _features: dict[GENS, npt.NDArray[np.void]]
+
+    @staticmethod
+    def build_features(links: list[Soullink], gen: GENS = 9) -> npt.NDArray[np.void]:
+        """Build the feature records of Soullinks."""
+        features = np.empty(len(links), dtype=LINK_FEATURES)
+        features["p1"] = [sl.p1.dual for sl in links]
+        features["p2"] = [sl.p2.dual for sl in links]
+        pokedex = get_pokedex()
+        for column, souls in (("s1", [sl.p1 for sl in links]), ("s2", [sl.p2 for sl in links])):
+            features[column] = [EMPTY if (entry := pokedex.find(pk.name)) is None else entry for pk in souls]
+        features["h1"] = super_effective([sl.p1 for sl in links], gen)
+        features["h2"] = super_effective([sl.p2 for sl in links], gen)
+        features["mask"] = [sl.get_type_mask() for sl in links]
+        features["active"] = [not sl.is_lost_or_dead() for sl in links]
+        p1, p2 = features["p1"].astype(np.intp), features["p2"].astype(np.intp)
+        features["score"] = get_scores(gen)[p1] + get_scores(gen)[p2]
+        features["weak"] = get_profiles(gen).weak[p1] | get_profiles(gen).weak[p2]
+        return features
+
+    def get_features(self, gen: GENS = 9) -> npt.NDArray[np.void]:
+        """Get the feature table of the Soullinks in a generation, building it on first use or after the PC has changed.
+
+        Replacing a single Soullink updates its record in place rather than rebuilding the table.
+        """
+        if not hasattr(self, "_features"):
+            self._features = {}
+        if (features := self._features.get(gen)) is None:
+            features = self._features[gen] = self.build_features(self, gen)
+        return features
 
-    def get_teams(self) -> list["SoullinkPC"]:
-        return [SoullinkPC(team) for team in combinations(self.get_active(), 6) if SoullinkPC(team).validate_as_team()]
+    def get_columns(self) -> Columns:
+        """Get the columnar backing of the PC, building it on first use or after the PC has changed."""
+        if (columns := getattr(self, "_columns", None)) is None:
+            columns = self._columns = Columns.build(
+                [(sl.p1, sl.p2) for sl in self], (sl.party for sl in self), (sl.met for sl in self), width=2
+            )
+        return columns
+
+    def view(self) -> PCView[Soullink]:
+        """Get a view of every Soullink, to be narrowed with vectorised filters."""
+        return PCView(self, self.get_columns())
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Replace a Soullink, updating its features in place, or a slice of them."""
+        if isinstance(index, slice):
+            super().__setitem__(index, value)
+            return
+        # past the cached PC, which would drop the features rather than update them
+        super(_CachedPC, self).__setitem__(index, value)
+        self._columns = None
+        for gen, features in getattr(self, "_features", {}).items():
+            features[index] = self.build_features([value], gen)[0]
+
+    def get_active_indices(self, gen: GENS = 9) -> npt.NDArray[np.intp]:
+        """Get the indices of all active Soullinks (not lost or dead)."""
+        return np.flatnonzero(self.get_features(gen)["active"])
+
+    def get_active(self, gen: GENS = 9) -> "SoullinkPC":
+        """Get all active Soullinks (not lost or dead), from the feature table of a generation."""
+        active: list[int] = self.get_active_indices(gen).tolist()
+        return SoullinkPC(self[i] for i in active)
+
+    def get_team_indices(self, progress: Optional[Progress] = None, gen: GENS = 9) -> npt.NDArray[np.intp]:
+        """Get the positions of the members of all valid teams of active Soullinks, one team per row.
+
+        If the progress is cancelled, the teams found so far are returned.
+        """
+        active = self.get_active_indices(gen)
+        masks = self.get_features(gen)["mask"].tolist()
+        combos = combinations(active.tolist(), 6)
+        teams: list[tuple[int, ...]] = []
+        if progress is None:
+            teams = [team for team in combos if self.team_exists([masks[i] for i in team])]
+        else:
+            progress.start("enumerating teams", comb(len(active), 6))
+            while batch := list(islice(combos, progress.interval)):
+                teams.extend(team for team in batch if self.team_exists([masks[i] for i in team]))
+                if not progress.advance(len(batch), len(teams)):
+                    break
+        return np.array(teams, dtype=np.intp).reshape(len(teams), 6)
+
+    def get_teams(self, progress: Optional[Progress] = None, gen: GENS = 9) -> list["SoullinkPC"]:
+        """Get all valid teams of active Soullinks.
+
+        If the progress is cancelled, the teams found so far are returned.
+        """
+        teams: list[list[int]] = self.get_team_indices(progress, gen).tolist()
+        return [SoullinkPC(self[i] for i in team) for team in teams]
+
+    @staticmethod
+    def team_exists(masks: list[int]) -> bool:
+        """Check if a valid team can be formed from Soullinks with the given type masks.
+
+        A team of six is valid when five of its members have no elected types in common, so a team exists exactly
+        when there are six Soullinks and five of them have pairwise disjoint masks.
+        """
+        if len(masks) < 6:
+            return False
+        distinct = sorted(set(masks))
+
+        def search(start: int, used: int, depth: int) -> bool:
+            if depth == 0:
+                return True
+            for i in range(start, len(distinct) - depth + 1):
+                if not distinct[i] & used and search(i + 1, used | distinct[i], depth - 1):
+                    return True
+            return False
+
+        return search(0, 0, 5)
 
     def validate_as_team(self) -> bool:
         if len(self) > 6:
@@ -146,8 +516,8 @@ class SoullinkPC(list[Soullink]):
         return False
 
 
-@dataclass(frozen=True)
-class Box:
+@dataclass(frozen=True, slots=True)
+class Box(_Fields):
     """A box containing Pokémon."""
 
     name: str
@@ -160,12 +530,61 @@ class Box:
     spreadsheet_url: Optional[URL] = None
     worksheet_name: Optional[str] = None
     pc: StandardPC | SoullinkPC = field(init=False)
+    index: BoxIndex = field(init=False, repr=False, compare=False)
+
+    __getstate__ = _Fields.__getstate__
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the box, scoring every Pokémon for its generation and indexing it if it was saved without indexes."""
+        _Fields.__setstate__(self, state)
+        # Pokémon saved before they had type records were scored in the latest generation
+        self.pc[:] = [entry.in_gen(self.gen) for entry in self.pc]  # type: ignore
+        if not hasattr(self, "index"):
+            object.__setattr__(self, "index", BoxIndex(self.pc))
 
     def __post_init__(self, pokemon: list[Pokemon] | list[Soullink]) -> None:
-        """Initialise the box's generation and PC."""
+        """Initialise the box's generation and PC, with every Pokémon scored for the generation."""
         object.__setattr__(self, "gen", GAME_TO_GEN[self.game])
         match self.category:
             case "standard":
-                object.__setattr__(self, "pc", StandardPC(pokemon))
+                object.__setattr__(self, "pc", StandardPC(pk.in_gen(self.gen) for pk in pokemon))
             case "soullink":
-                object.__setattr__(self, "pc", SoullinkPC(pokemon))
+                object.__setattr__(self, "pc", SoullinkPC(sl.in_gen(self.gen) for sl in pokemon))
+        self.validate_types()
+        if isinstance(self.pc, SoullinkPC):
+            self.pc.get_features(self.gen)
+        object.__setattr__(self, "index", BoxIndex(self.pc))
+
+    def get_pokemon(self) -> list[Pokemon | Soul]:
+        """Get every Pokémon in the box, including both souls of every soullink."""
+        return [pk for entry in self.pc for pk in ((entry.p1, entry.p2) if isinstance(entry, Soullink) else (entry,))]
+
+    def validate_types(self) -> None:
+        """Check that every Pokémon in the box has types that exist in the box's generation."""
+        pokemon = self.get_pokemon()
+        valid = get_gen_duals(self.gen)[[pk.dual for pk in pokemon]]
+        if not valid.all():
+            pk = pokemon[int(valid.argmin())]
+            raise ValueError(f"{pk.name} cannot be {'/'.join(pk.dual.display())} type in generation {self.gen}.")
+
+    def update_link(self, index: int, link: Soullink) -> None:
+        """Replace the Soullink at an index, such as after a change of status, keeping its features up to date."""
+        if not isinstance(self.pc, SoullinkPC):
+            raise TypeError(f"Box {self.name} does not contain Soullinks.")
+        if not get_gen_duals(self.gen)[[link.p1.dual, link.p2.dual]].all():
+            raise ValueError(f"{link.name} have types that do not exist in generation {self.gen}.")
+        link = link.in_gen(self.gen)
+        self.index.remove(index, self.pc[index])
+        self.pc[index] = link
+        self.index.add(index, link)
+
+    def add(self, entry: Pokemon | Soullink) -> None:
+        """Add a Pokémon or Soullink to the box, scoring it for the box's generation."""
+        if isinstance(entry, Soullink) != isinstance(self.pc, SoullinkPC):
+            raise TypeError(f"Box {self.name} does not contain {type(entry).__name__}s.")
+        souls = (entry.p1, entry.p2) if isinstance(entry, Soullink) else (entry,)
+        if not get_gen_duals(self.gen)[[pk.dual for pk in souls]].all():
+            raise ValueError(f"{entry.name} have types that do not exist in generation {self.gen}.")
+        entry = entry.in_gen(self.gen)
+        self.pc.append(entry)  # type: ignore
+        self.index.add(len(self.pc) - 1, entry)
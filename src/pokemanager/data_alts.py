@@ -6,7 +6,8 @@ from typing import Any
 
 import gspread
 
-from pokemanager.typer import dual_score_map
+from pokemanager.const import Dual
+from pokemanager.typer import get_scores
 from pokemanager.utils import combinations
 
 
@@ -246,11 +247,11 @@ if __name__ == "__main__":
     data_out = [
         [
             sum(
-                dual_score_map[poke]
+                get_scores()[Dual[f"{soul.type1}_{soul.type2 or soul.type1}"]]
                 for sl in team
-                for poke in (
-                    sl.p1.get_types(),
-                    sl.p2.get_types(),
+                for soul in (
+                    sl.p1,
+                    sl.p2,
                 )
             )
         ]
@@ -0,0 +1,116 @@
+"""Evolution chains of the species in the pokedex, and boxes as they will be once their Pokémon have fully evolved.
+
+The chains are stored in the pokedex as the entry each entry evolves from. The final stages every entry can reach
+are derived once per generation and cached, since evolutions that only exist in later generations
+are not final stages of earlier ones.
+"""
+
+from collections.abc import Mapping
+from functools import cache
+from typing import Optional
+
+import numpy as np
+
+from pokemanager.columns import NO_TYPE
+from pokemanager.const import GENS
+from pokemanager.data import Box, Pokemon, Soul, Soullink
+from pokemanager.pokedex import EMPTY, get_pokedex
+
+
+@cache
+def get_evolutions() -> tuple[tuple[int, ...], ...]:
+    """Get the entries each entry of the pokedex evolves into directly."""
+    parents = get_pokedex().entries["parent"]
+    children: list[list[int]] = [[] for _ in parents]
+    for child in np.flatnonzero(parents != EMPTY).tolist():
+        children[int(parents[child])].append(child)
+    return tuple(tuple(c) for c in children)
+
+
+@cache
+def get_final_stages(gen: GENS = 9) -> tuple[tuple[int, ...], ...]:
+    """Get the final stages each entry of the pokedex can evolve into in a generation, itself if none."""
+    exists = get_pokedex().entries["types"][:, gen - 1, 0] != NO_TYPE
+    evolutions = get_evolutions()
+    finals: list[Optional[tuple[int, ...]]] = [None] * len(evolutions)
+
+    def final(entry: int) -> tuple[int, ...]:
+        found = finals[entry]
+        if found is None:
+            later = [stage for child in evolutions[entry] if exists[child] for stage in final(child)]
+            found = finals[entry] = tuple(later) or (entry,)
+        return found
+
+    return tuple(final(entry) for entry in range(len(evolutions)))
+
+
+def evolve(pk: Pokemon | Soul, gen: GENS = 9, choices: Optional[Mapping[str, str]] = None) -> Pokemon | Soul:
+    """Get a Pokémon as it will be once fully evolved, keeping it as it is if it is not in the pokedex.
+
+    Args:
+        pk: The Pokémon, whose name is its species.
+        gen: The generation it evolves in.
+        choices: The final stage to evolve each species into where it can evolve into several, by species name,
+            regardless of case. The first final stage is chosen otherwise.
+
+    Raises:
+        ValueError: If the final stage chosen for the Pokémon's species is not one it can evolve into.
+    """
+    pokedex = get_pokedex()
+    entry = pokedex.find(pk.name)
+    if entry is None:
+        return pk
+    stages = get_final_stages(gen)[entry]
+    stage = stages[0]
+    choice = next((final for species, final in (choices or {}).items() if pokedex.find(species) == entry), None)
+    if choice is not None:
+        chosen = pokedex.find(choice)
+        if chosen not in stages:
+            known = ", ".join(map(pokedex.name, stages))
+            raise ValueError(f"{choice} is not a final stage of {pk.name} in generation {gen}. Known: {known}.")
+        stage = chosen
+    if stage == entry:
+        return pk
+    type1, type2 = pokedex.types(stage, gen) or (pk.type1, pk.type2)
+    evolved = type(pk)(
+        pokedex.name(stage),
+        pk.nickname,
+        type1.name,
+        None if type2 is None else type2.name,
+        lost=pk.lost,
+        dead=pk.dead,
+        moves=pk.moves,
+        gen=gen,
+    )
+    if isinstance(pk, Pokemon):
+        object.__setattr__(evolved, "party", pk.party)
+        object.__setattr__(evolved, "met", pk.met)
+    return evolved
+
+
+def evolve_box(box: Box, choices: Optional[Mapping[str, str]] = None) -> Box:
+    """Get a box as it will be once every Pokémon in it has fully evolved.
+
+    Raises:
+        ValueError: If a species of the choices is unknown, or its chosen final stage is not one it can evolve into.
+    """
+    pokedex = get_pokedex()
+    for species in choices or {}:
+        if pokedex.find(species) is None:
+            raise ValueError(f"Unknown species: {species}")
+    pokemon = [
+        Soullink(entry.party, entry.met, *(evolve(pk, box.gen, choices) for pk in (entry.p1, entry.p2)))  # type: ignore
+        if isinstance(entry, Soullink)
+        else evolve(entry, box.gen, choices)
+        for entry in box.pc
+    ]
+    return Box(
+        name=box.name,
+        game=box.game,
+        category=box.category,
+        pokemon=pokemon,  # type: ignore
+        players=box.players,
+        credentials=box.credentials,
+        spreadsheet_url=box.spreadsheet_url,
+        worksheet_name=box.worksheet_name,
+    )
@@ -0,0 +1,97 @@
+"""Secondary indexes from the names, types, met locations and statuses of a box's entries to their positions.
+
+Every key maps to the sorted positions of the entries with it, so point lookups are a dictionary lookup and filtered
+listings intersect the postings of each filter, starting with the shortest. Names and locations are casefolded.
+"""
+
+from bisect import bisect_left, insort
+from collections.abc import Hashable, Iterable, Iterator
+from typing import TYPE_CHECKING, Literal
+
+from pokemanager.const import Type
+
+if TYPE_CHECKING:
+    from pokemanager.data import Pokemon, Soul, Soullink
+
+FIELD = Literal["name", "type", "met", "status"]
+STATUSES = ("alive", "lost", "dead", "party")
+
+
+def entry_keys(entry: "Pokemon | Soullink") -> Iterator[tuple[FIELD, Hashable]]:
+    """Get the keys an entry is indexed under."""
+    from pokemanager.data import Soullink  # noqa: PLC0415 - data indexes its boxes with this module
+
+    souls: tuple["Soul | Pokemon", ...] = (entry.p1, entry.p2) if isinstance(entry, Soullink) else (entry,)
+    names = {name.casefold() for soul in souls for name in (soul.name, soul.nickname, entry.name) if name}
+    types = {t for soul in souls for t in (soul.type1, soul.type2) if t is not None}
+    for name in names:
+        yield "name", name
+    for t in types:
+        yield "type", t
+    yield "met", entry.met.casefold()
+    lost = any(soul.lost for soul in souls)
+    dead = any(soul.dead for soul in souls)
+    if lost:
+        yield "status", "lost"
+    if dead:
+        yield "status", "dead"
+    if not (lost or dead):
+        yield "status", "alive"
+    if entry.party:
+        yield "status", "party"
+
+
+class BoxIndex:
+    """Postings of the positions of a box's entries under each of their keys."""
+
+    def __init__(self, entries: Iterable["Pokemon | Soullink"] = ()) -> None:
+        """Index entries by their positions."""
+        self.postings: dict[FIELD, dict[Hashable, list[int]]] = {"name": {}, "type": {}, "met": {}, "status": {}}
+        for position, entry in enumerate(entries):
+            self.add(position, entry)
+
+    def add(self, position: int, entry: "Pokemon | Soullink") -> None:
+        """Index an entry at a position."""
+        for field, key in entry_keys(entry):
+            insort(self.postings[field].setdefault(key, []), position)
+
+    def remove(self, position: int, entry: "Pokemon | Soullink") -> None:
+        """Stop indexing an entry at a position."""
+        for field, key in entry_keys(entry):
+            positions = self.postings[field][key]
+            del positions[bisect_left(positions, position)]
+            if not positions:
+                del self.postings[field][key]
+
+    def get(self, field: FIELD, key: Hashable) -> list[int]:
+        """Get the sorted positions of the entries with a key, which must not be modified."""
+        if isinstance(key, str):
+            key = key.casefold()
+        return self.postings[field].get(key, [])
+
+    def find(self, filters: Iterable[tuple[FIELD, Hashable]]) -> list[int]:
+        """Get the sorted positions of the entries with every key, intersecting the shortest postings first."""
+        postings = sorted((self.get(field, key) for field, key in filters), key=len)
+        if not postings:
+            raise ValueError("At least one filter is needed.")
+        found = set(postings[0])
+        for positions in postings[1:]:
+            if not found:
+                break
+            found.intersection_update(positions)
+        return sorted(found)
+
+
+def parse_key(field: FIELD, value: str) -> Hashable:
+    """Parse the key of a field from text, such as a type name.
+
+    Raises:
+        ValueError: If the value is not a valid key of the field.
+    """
+    if field == "type":
+        if value.title() not in Type.__members__:
+            raise ValueError(f"Invalid type: {value}")
+        return Type[value.title()]
+    if field == "status" and value.casefold() not in STATUSES:
+        raise ValueError(f"Invalid status: {value}. Known: {', '.join(STATUSES)}.")
+    return value.casefold()
@@ -1,12 +1,15 @@
 """."""
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from pickle import dump as pkl_dump
 from pickle import load as pkl_load
 from tomllib import load as toml_load
+from typing import Optional
 
 from pokemanager import config_file
 from pokemanager.data import Box
+from pokemanager.search import SearchIndex, file_stamp
 from pokemanager.utils import slugify
 
 
@@ -40,15 +43,34 @@ class AppData:
 
         return boxes
 
+    @classmethod
+    def get_box_slugs(cls) -> list[str]:
+        """Get the slugs of the saved boxes, without loading them."""
+        return [box_file.stem for box_file in cls.get_appdata().joinpath("boxes").glob("*.pkl")]
+
+    @classmethod
+    def iter_boxes(cls, slugs: Optional[Iterable[str]] = None) -> Iterator[Box]:
+        """Load boxes from the data directory one at a time, either every box or only those with the given slugs."""
+        directory = cls.get_appdata().joinpath("boxes")
+        files = directory.glob("*.pkl") if slugs is None else (directory.joinpath(f"{slug}.pkl") for slug in slugs)
+        for box_file in files:
+            if box_file.exists():
+                with box_file.open("rb") as f:
+                    yield pkl_load(f)
+
     @classmethod
     def save_box(cls, box: Box) -> None:
         """Save a box to the data directory."""
         box_file: Path = cls.get_appdata().joinpath("boxes", f"{slugify(box.name)}.pkl")
         print(f"Saving box to {box_file}")
+        # bring the index up to date before writing, so the box is indexed from memory rather than loaded again
+        index = cls.get_search_index()
         box_file.parent.mkdir(parents=True, exist_ok=True)
         with box_file.open("wb") as f:
             pkl_dump(box, f)
         print(f"Saved box: {box.name} with {len(box.pc)} Pokémon")
+        index.add_file(box_file.stem, box, file_stamp(box_file))
+        index.save(SearchIndex.get_path(cls.get_appdata()))
 
     @classmethod
     def delete_box(cls, box_name: str) -> None:
@@ -60,3 +82,22 @@ class AppData:
             print(f"Deleted box file {box_file}")
         else:
             print(f"Box file {box_file} does not exist, nothing to delete.")
+        cls.get_search_index()  # drops the deleted box from the index
+
+    @classmethod
+    def get_search_index(cls) -> SearchIndex:
+        """Get the search index of every box, reindexing the boxes whose files changed since it was saved."""
+        appdata = cls.get_appdata()
+        path = SearchIndex.get_path(appdata)
+        index = SearchIndex.load(path) or SearchIndex()
+        stamps = {box_file.stem: file_stamp(box_file) for box_file in appdata.joinpath("boxes").glob("*.pkl")}
+        changed, removed = index.stale_files(stamps)
+        if changed or removed:
+            print("Updating search index...")
+            for slug in removed:
+                index.remove_file(slug)
+            for slug in changed:
+                for box in cls.iter_boxes([slug]):
+                    index.add_file(slug, box, stamps[slug])
+            index.save(path)
+        return index
@@ -0,0 +1,91 @@
+"""Matchup queries backed by precomputed sorted indexes.
+
+Each attacker has the dual types it can hit sorted by effectiveness, and each defender has the dual types that can
+attack it sorted by matchup. Threshold queries are then a binary search into a sorted row and top-k queries a slice
+of one.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cache
+
+import numpy as np
+import numpy.typing as npt
+
+from pokemanager.const import GENS, Dual, Type
+from pokemanager.typer import chart_era, get_dual_matchups, get_dual_type_chart, get_gen_duals, get_type_vs_dual_chart
+
+
+@dataclass(frozen=True)
+class MatchupIndex:
+    """Sorted indexes over the dual types of one type chart.
+
+    Every row holds only the dual types that exist in the chart's generation, alongside the value it is sorted by.
+    """
+
+    # per attacking single type, the defending dual types from least to most affected
+    type_defenders: npt.NDArray[np.intp]
+    type_defender_effectiveness: npt.NDArray[np.float64]
+    # per attacking dual type, the defending dual types from least to most affected
+    defenders: npt.NDArray[np.intp]
+    defender_effectiveness: npt.NDArray[np.float64]
+    # per defending dual type, the attacking dual types from best to worst matchup
+    attackers: npt.NDArray[np.intp]
+    attacker_matchups: npt.NDArray[np.float64]
+
+
+def _sorted_rows(table: npt.NDArray[np.float64], exists: npt.NDArray[np.bool_], descending: bool = False):
+    columns = np.flatnonzero(exists)
+    values = table[:, columns]
+    order = np.argsort(-values if descending else values, axis=1, kind="stable")
+    return columns[order], np.take_along_axis(values, order, axis=1)
+
+
+@cache
+def _get_era_index(era: GENS) -> MatchupIndex:
+    exists = get_gen_duals(era)
+    type_defenders, type_defender_effectiveness = _sorted_rows(get_type_vs_dual_chart(era), exists)
+    defenders, defender_effectiveness = _sorted_rows(get_dual_type_chart(era), exists)
+    attackers, attacker_matchups = _sorted_rows(get_dual_matchups(era).T, exists, descending=True)
+    return MatchupIndex(
+        type_defenders,
+        type_defender_effectiveness,
+        defenders,
+        defender_effectiveness,
+        attackers,
+        attacker_matchups,
+    )
+
+
+def get_index(gen: GENS = 9) -> MatchupIndex:
+    """Get the matchup index of a generation, building it on first use."""
+    return _get_era_index(chart_era(gen))
+
+
+def _at_most(
+    rows: npt.NDArray[np.intp], values: npt.NDArray[np.float64], keys: Sequence[int], limit: float
+) -> list[Dual]:
+    """Intersect the prefixes of the given ascending rows whose values are at most the limit."""
+    common: npt.NDArray[np.intp] | None = None
+    for key in keys:
+        prefix = rows[key, : np.searchsorted(values[key], limit, side="right")]
+        common = prefix if common is None else np.intersect1d(common, prefix, assume_unique=True)
+    return [] if common is None else [Dual(d) for d in np.sort(common)]
+
+
+def resisting(types: Sequence[Type], gen: GENS = 9, at_most: float = 0.5) -> list[Dual]:
+    """Get the dual types that take at most the given effectiveness from every one of the attacking types."""
+    index = get_index(gen)
+    return _at_most(index.type_defenders, index.type_defender_effectiveness, types, at_most)
+
+
+def walls(team: Sequence[Dual], gen: GENS = 9, at_most: float = 0.5) -> list[Dual]:
+    """Get the dual types that take at most the given effectiveness from every member of a team."""
+    index = get_index(gen)
+    return _at_most(index.defenders, index.defender_effectiveness, team, at_most)
+
+
+def top_attackers(defender: Dual, k: int = 10, gen: GENS = 9) -> list[tuple[Dual, float]]:
+    """Get the k dual types with the best matchups against a defending dual type."""
+    index = get_index(gen)
+    return [(Dual(a), m) for a, m in zip(index.attackers[defender, :k].tolist(), index.attacker_matchups[defender, :k])]
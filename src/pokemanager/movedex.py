@@ -0,0 +1,82 @@
+"""A compact offline database of moves, with their types, categories and powers.
+
+The moves are one record each in a read-only array, in the order of the source, so a moveset is a handful of small
+integers and the data of every move of a batch of Pokémon is gathered with a single index.
+"""
+
+from collections.abc import Iterable
+from difflib import get_close_matches
+from functools import cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from pokemanager.const import Type
+
+SOURCE = Path(__file__).with_name("movedex.txt")
+
+CATEGORIES = ("physical", "special", "status")
+MOVE = np.dtype(
+    [
+        ("type", "u1"),
+        ("category", "u1"),  # index into CATEGORIES
+        ("power", "u1"),  # 0 for status moves
+    ]
+)
+MOVESET_SIZE = 4  # the most moves a Pokémon knows at once
+
+
+class Movedex:
+    """The moves of the database."""
+
+    def __init__(self, source: str):
+        """Parse the tab separated source of the database."""
+        rows = [line.split("\t") for line in source.splitlines() if line.strip() and not line.startswith("#")]
+        self.names = tuple(name for name, _, _, _ in rows)
+        self._ids = {name.casefold(): i for i, name in enumerate(self.names)}
+        if len(self._ids) != len(self.names):
+            raise ValueError("Names must be unique regardless of case.")
+        self.moves = np.array(
+            [(Type[type_.title()], CATEGORIES.index(category), int(power)) for _, type_, category, power in rows],
+            dtype=MOVE,
+        )
+        self.moves.flags.writeable = False
+
+    def __len__(self) -> int:
+        """Get the number of moves."""
+        return len(self.names)
+
+    def find(self, name: str) -> Optional[int]:
+        """Get a move by its name, regardless of case."""
+        return self._ids.get(name.strip().casefold())
+
+    def type(self, move: int) -> Type:
+        """Get the type of a move."""
+        return Type(int(self.moves[move]["type"]))
+
+
+@cache
+def get_movedex() -> Movedex:
+    """Get the bundled database of moves."""
+    return Movedex(SOURCE.read_text(encoding="utf-8"))
+
+
+def parse_moveset(names: Iterable[str]) -> tuple[str, ...]:
+    """Parse the names of the moves a Pokémon knows into their names in the database.
+
+    Raises:
+        ValueError: If a move is unknown, or there are too many moves.
+    """
+    movedex = get_movedex()
+    moves: list[str] = []
+    for name in filter(None, (name.strip() for name in names)):
+        move = movedex.find(name)
+        if move is None:
+            suggestions = get_close_matches(name.title(), movedex.names, n=3)
+            hint = f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
+            raise ValueError(f"Unknown move: {name}.{hint}")
+        moves.append(movedex.names[move])
+    if len(moves) > MOVESET_SIZE:
+        raise ValueError(f"A Pokémon knows at most {MOVESET_SIZE} moves, got {len(moves)}.")
+    return tuple(dict.fromkeys(moves))
@@ -0,0 +1,120 @@
+"""Rosters of the gym leaders and other bosses of each game, and matchups of teams against them."""
+
+from collections.abc import Mapping, Sequence
+from typing import TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+from pokemanager.const import GAME_TO_GEN, GAMES, Dual
+from pokemanager.coverage import Teams
+from pokemanager.typer import get_dual_matchups, get_gen_duals
+
+Roster: TypeAlias = tuple[Dual, ...]
+Member: TypeAlias = tuple[str, int]  # species and level
+
+_KANTO: dict[str, Roster] = {
+    "Brock": (Dual.Rock_Ground, Dual.Rock_Ground),
+    "Misty": (Dual.Water, Dual.Water_Psychic),
+    "Lt. Surge": (Dual.Electric, Dual.Electric, Dual.Electric),
+    "Erika": (Dual.Grass_Poison, Dual.Grass, Dual.Grass_Poison),
+    "Koga": (Dual.Poison, Dual.Poison, Dual.Poison, Dual.Poison),
+    "Sabrina": (Dual.Psychic, Dual.Psychic, Dual.Bug_Poison, Dual.Psychic),
+    "Blaine": (Dual.Fire, Dual.Fire, Dual.Fire, Dual.Fire),
+    "Giovanni": (Dual.Ground_Rock, Dual.Ground, Dual.Poison_Ground, Dual.Poison_Ground, Dual.Ground_Rock),
+    "Lorelei": (Dual.Water_Ice, Dual.Water_Ice, Dual.Water_Psychic, Dual.Ice_Psychic, Dual.Water_Ice),
+    "Bruno": (Dual.Rock_Ground, Dual.Fighting, Dual.Fighting, Dual.Rock_Ground, Dual.Fighting),
+    "Agatha": (Dual.Ghost_Poison, Dual.Poison_Flying, Dual.Ghost_Poison, Dual.Poison, Dual.Ghost_Poison),
+    "Lance": (Dual.Water_Flying, Dual.Dragon, Dual.Dragon, Dual.Rock_Flying, Dual.Dragon_Flying),
+}
+_PALDEA: dict[str, Roster] = {
+    "Katy": (Dual.Bug, Dual.Bug, Dual.Normal),
+    "Brassius": (Dual.Grass, Dual.Grass_Normal, Dual.Rock),
+    "Iono": (Dual.Electric_Flying, Dual.Electric, Dual.Electric, Dual.Ghost),
+    "Kofu": (Dual.Water_Psychic, Dual.Water, Dual.Fighting_Ice),
+    "Larry": (Dual.Normal, Dual.Normal, Dual.Normal_Flying),
+    "Ryme": (Dual.Ghost, Dual.Ghost_Fairy, Dual.Ghost, Dual.Electric_Poison),
+    "Tulip": (Dual.Normal_Psychic, Dual.Psychic_Fairy, Dual.Psychic, Dual.Fairy),
+    "Grusha": (Dual.Ice_Bug, Dual.Ice, Dual.Ice, Dual.Dragon_Flying),
+}
+
+# FireRed and LeafGreen, in the order of the rosters above
+_KANTO_FRLG_TEAMS: dict[str, tuple[Member, ...]] = {
+    "Brock": (("Geodude", 12), ("Onix", 14)),
+    "Misty": (("Staryu", 18), ("Starmie", 21)),
+    "Lt. Surge": (("Voltorb", 21), ("Pikachu", 18), ("Raichu", 24)),
+    "Erika": (("Victreebel", 29), ("Tangela", 24), ("Vileplume", 29)),
+    "Koga": (("Koffing", 37), ("Muk", 39), ("Koffing", 37), ("Weezing", 43)),
+    "Sabrina": (("Kadabra", 38), ("Mr. Mime", 37), ("Venomoth", 38), ("Alakazam", 43)),
+    "Blaine": (("Growlithe", 42), ("Ponyta", 40), ("Rapidash", 42), ("Arcanine", 47)),
+    "Giovanni": (("Rhyhorn", 45), ("Dugtrio", 42), ("Nidoqueen", 44), ("Nidoking", 45), ("Rhyhorn", 50)),
+    "Lorelei": (("Dewgong", 52), ("Cloyster", 51), ("Slowbro", 52), ("Jynx", 54), ("Lapras", 54)),
+    "Bruno": (("Onix", 51), ("Hitmonchan", 53), ("Hitmonlee", 53), ("Onix", 54), ("Machamp", 56)),
+    "Agatha": (("Gengar", 54), ("Golbat", 54), ("Haunter", 53), ("Arbok", 56), ("Gengar", 58)),
+    "Lance": (("Gyarados", 56), ("Dragonair", 54), ("Dragonair", 54), ("Aerodactyl", 58), ("Dragonite", 60)),
+}
+
+# the dual types of the teams of the bosses of each game, keyed by boss name
+ROSTERS: dict[GAMES, dict[str, Roster]] = {
+    "Red": _KANTO,
+    "Green": _KANTO,
+    "Blue": _KANTO,
+    "FireRed": _KANTO,
+    "LeafGreen": _KANTO,
+    "Scarlet": _PALDEA,
+    "Violet": _PALDEA,
+}
+
+
+# the species and levels of the teams of the bosses of the games whose teams are known in full, keyed by boss name
+BOSS_TEAMS: dict[GAMES, dict[str, tuple[Member, ...]]] = {
+    "FireRed": _KANTO_FRLG_TEAMS,
+    "LeafGreen": _KANTO_FRLG_TEAMS,
+}
+
+
+def get_opponents(game: GAMES, names: Sequence[str]) -> dict[str, Roster]:
+    """Get the rosters of the named bosses of a game, matching names regardless of case."""
+    if game not in ROSTERS:
+        raise ValueError(f"No opponent rosters for {game}.")
+    rosters = {name.casefold(): (name, roster) for name, roster in ROSTERS[game].items()}
+    missing = [name for name in names if name.strip().casefold() not in rosters]
+    if missing:
+        raise ValueError(f"Unknown opponents in {game}: {', '.join(missing)}. Known: {', '.join(ROSTERS[game])}.")
+    return dict(rosters[name.strip().casefold()] for name in names)
+
+
+def get_boss_team(game: GAMES, name: str) -> tuple[str, tuple[Member, ...]]:
+    """Get the name and the species and levels of the team of a boss of a game, matching its name regardless of case."""
+    if game not in BOSS_TEAMS:
+        raise ValueError(f"No boss teams with species and levels for {game}.")
+    teams = {boss.casefold(): (boss, team) for boss, team in BOSS_TEAMS[game].items()}
+    if name.strip().casefold() not in teams:
+        raise ValueError(f"Unknown boss in {game}: {name}. Known: {', '.join(BOSS_TEAMS[game])}.")
+    return teams[name.strip().casefold()]
+
+
+def evaluate(teams: Teams, opponents: Mapping[str, Roster], game: GAMES) -> npt.NDArray[np.float64]:
+    """Get the expected matchup of each team against each opponent.
+
+    Every opponent Pokémon is met by the team member with the best matchup against it, and the matchup against an
+    opponent is the mean over its roster, so the result has one row per team and one column per opponent.
+
+    Args:
+        teams: The dual ids of the members of each team, one team per row.
+        opponents: The rosters of the opponents to evaluate against.
+        game: The game whose generation's type chart the matchups are taken from.
+    """
+    gen = GAME_TO_GEN[game]
+    members = [dual for roster in opponents.values() for dual in roster]
+    if not get_gen_duals(gen)[members].all():
+        raise ValueError(f"Opponent rosters have types that do not exist in generation {gen}.")
+    # weights that average the matchups against each opponent's own roster
+    weights = np.zeros((len(members), len(opponents)))
+    start = 0
+    for column, roster in enumerate(opponents.values()):
+        weights[start : start + len(roster), column] = 1 / len(roster)
+        start += len(roster)
+    duals = np.asarray(teams, dtype=np.intp)
+    best = get_dual_matchups(gen)[duals[..., None], members].max(axis=1)
+    return best @ weights
@@ -0,0 +1,260 @@
+"""A compact offline database of species and forms, with their dex numbers, types in every generation and base stats.
+
+The database ships as a packed binary resource that is memory mapped rather than loaded, so looking a species up
+only reads the pages it touches. It is laid out as fixed size sections one after the other:
+
+- a header with the size of each section,
+- a record per species or form, sorted by dex number, with its name, its types in each generation, its base stats
+  and the record it evolves from,
+- an open addressing hash table from the casefolded names to their records, for lookups in constant time,
+- a trie of the casefolded names, as nodes linked to their first child and next sibling, for autocompletion,
+- the names, encoded as UTF-8 and referred to by offset.
+"""
+
+import mmap
+from functools import cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from pokemanager.columns import NO_TYPE
+from pokemanager.const import GENS, Type
+
+SOURCE = Path(__file__).with_name("pokedex.txt")
+RESOURCE = Path(__file__).with_name("pokedex.bin")
+
+MAGIC = b"PKDX"
+VERSION = 3  # bump whenever the layout changes
+
+HEADER = np.dtype(
+    [
+        ("magic", "S4"),
+        ("version", "<u2"),
+        ("entries", "<u2"),
+        ("slots", "<u4"),  # size of the hash table, a power of two
+        ("nodes", "<u4"),
+        ("names", "<u4"),  # size of the names in bytes
+    ]
+)
+ENTRY = np.dtype(
+    [
+        ("dex", "<u2"),
+        ("name", "<u4"),  # offset into the names
+        ("length", "u1"),  # length of the name in bytes
+        ("types", "u1", (9, 2)),  # both types in each generation, with no types where the entry does not exist yet
+        ("stats", "u1", (6,)),  # base HP, Attack, Defense, Special Attack, Special Defense and Speed
+        ("parent", "<u2"),  # entry it evolves from, if any
+    ]
+)
+NODE = np.dtype(
+    [
+        ("char", "<u4"),  # code point of the character leading to the node
+        ("child", "<u4"),  # first child, where 0 is none since the root is no one's child
+        ("sibling", "<u4"),  # next sibling, in order of character
+        ("entry", "<u2"),  # entry whose name ends at the node
+    ]
+)
+EMPTY = 0xFFFF  # an empty slot of the hash table, a node that ends no name, or an entry that evolves from none
+
+
+def name_hash(key: str) -> int:
+    """Hash a casefolded name with 32 bit FNV-1a, which is stable between processes unlike `hash`."""
+    h = 0x811C9DC5
+    for byte in key.encode():
+        h = ((h ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def parse_types(text: str) -> npt.NDArray[np.uint8]:
+    """Parse the types of an entry in each generation from the source, such as "Normal|6:Normal/Fairy"."""
+    types = np.full((9, 2), NO_TYPE, dtype=np.uint8)
+    for change in text.split("|"):
+        since, _, names = change.rpartition(":")
+        pair = [Type[name.title()] for name in names.split("/")]
+        if len(pair) > 2:
+            raise ValueError(f"Invalid types: {text}")
+        types[int(since or 1) - 1 :] = [pair[0], pair[-1] if len(pair) == 2 else NO_TYPE]
+    return types
+
+
+def pack(source: str) -> bytes:
+    """Pack the tab separated source of the database into its binary resource."""
+    # the pre-evolution column is optional
+    rows = [(*line.split("\t"), "")[:5] for line in source.splitlines() if line.strip() and not line.startswith("#")]
+    # sorting by dex number keeps every species next to its forms, with the base form first
+    rows.sort(key=lambda row: int(row[0]))
+    if len(rows) >= EMPTY:
+        raise ValueError(f"Too many entries: {len(rows)}")
+    keys = [name.casefold() for _, name, _, _, _ in rows]
+    ids = {key: i for i, key in enumerate(keys)}
+    if len(ids) != len(keys):
+        raise ValueError("Names must be unique regardless of case.")
+    if unknown := [parent for _, _, _, _, parent in rows if parent and parent.casefold() not in ids]:
+        raise ValueError(f"Unknown pre-evolutions: {', '.join(unknown)}")
+
+    names = bytearray()
+    entries = np.zeros(len(rows), dtype=ENTRY)
+    for i, (dex, name, types, stats, parent) in enumerate(rows):
+        encoded = name.encode()
+        entries[i] = (
+            int(dex),
+            len(names),
+            len(encoded),
+            parse_types(types),
+            [int(stat) for stat in stats.split("/")],
+            ids[parent.casefold()] if parent else EMPTY,
+        )
+        names += encoded
+
+    # at most half full, so probe sequences stay short
+    slots = 1 << max(len(rows) * 2 - 1, 1).bit_length()
+    index = np.full(slots, EMPTY, dtype="<u2")
+    for i, key in enumerate(keys):
+        slot = name_hash(key) & (slots - 1)
+        while index[slot] != EMPTY:
+            slot = (slot + 1) & (slots - 1)
+        index[slot] = i
+
+    children: list[dict[str, int]] = [{}]
+    ends = [EMPTY]
+    for i, key in enumerate(keys):
+        node = 0
+        for char in key:
+            if char not in children[node]:
+                children[node][char] = len(children)
+                children.append({})
+                ends.append(EMPTY)
+            node = children[node][char]
+        ends[node] = i
+    nodes = np.zeros(len(children), dtype=NODE)
+    nodes["entry"] = ends
+    for node, branches in enumerate(children):
+        ordered = sorted(branches.items())
+        if ordered:
+            nodes[node]["child"] = ordered[0][1]
+        for (char, child), (_, sibling) in zip(ordered, [*ordered[1:], ("", 0)]):
+            nodes[child]["char"] = ord(char)
+            nodes[child]["sibling"] = sibling
+
+    header = np.array([(MAGIC, VERSION, len(rows), slots, len(nodes), len(names))], dtype=HEADER)
+    return b"".join([header.tobytes(), entries.tobytes(), index.tobytes(), nodes.tobytes(), bytes(names)])
+
+
+class Pokedex:
+    """The species and forms of the packed database, read from a memory map."""
+
+    def __init__(self, path: Path = RESOURCE):
+        """Map the packed database, without reading more than its header."""
+        with path.open("rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        header = np.frombuffer(self._map, dtype=HEADER, count=1)[0]
+        if header["magic"] != MAGIC or header["version"] != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} pokedex.")
+        offset = HEADER.itemsize
+        self.entries = np.frombuffer(self._map, dtype=ENTRY, count=int(header["entries"]), offset=offset)
+        offset += self.entries.nbytes
+        self.index = np.frombuffer(self._map, dtype="<u2", count=int(header["slots"]), offset=offset)
+        offset += self.index.nbytes
+        self.nodes = np.frombuffer(self._map, dtype=NODE, count=int(header["nodes"]), offset=offset)
+        self._names = offset + self.nodes.nbytes
+
+    def __len__(self) -> int:
+        """Get the number of species and forms."""
+        return len(self.entries)
+
+    def name(self, entry: int) -> str:
+        """Get the name of an entry."""
+        start = self._names + int(self.entries[entry]["name"])
+        return self._map[start : start + int(self.entries[entry]["length"])].decode()
+
+    def dex(self, entry: int) -> int:
+        """Get the national dex number of an entry."""
+        return int(self.entries[entry]["dex"])
+
+    def find(self, name: str) -> Optional[int]:
+        """Get the entry of a species or form by its name, regardless of case."""
+        key = name.strip().casefold()
+        mask = len(self.index) - 1
+        slot = name_hash(key) & mask
+        while (entry := int(self.index[slot])) != EMPTY:
+            if self.name(entry).casefold() == key:
+                return entry
+            slot = (slot + 1) & mask
+        return None
+
+    def types(self, entry: int, gen: GENS = 9) -> Optional[tuple[Type, Optional[Type]]]:
+        """Get the types of an entry in a generation, if it exists in that generation."""
+        type1, type2 = self.entries[entry]["types"][gen - 1].tolist()
+        if type1 == NO_TYPE:
+            return None
+        return Type(type1), None if type2 == NO_TYPE else Type(type2)
+
+    def stats(self, entry: int) -> tuple[int, ...]:
+        """Get the base stats of an entry."""
+        return tuple(self.entries[entry]["stats"].tolist())
+
+    def parent(self, entry: int) -> Optional[int]:
+        """Get the entry an entry evolves from, if any."""
+        parent = int(self.entries[entry]["parent"])
+        return None if parent == EMPTY else parent
+
+    def forms(self, entry: int) -> list[int]:
+        """Get the entries of every form of the species of an entry, starting with its base form."""
+        dex: npt.NDArray[np.uint16] = self.entries["dex"]
+        start = np.searchsorted(dex, self.dex(entry), side="left")
+        stop = np.searchsorted(dex, self.dex(entry), side="right")
+        return list(range(int(start), int(stop)))
+
+    def complete(self, prefix: str, limit: int = 10) -> list[str]:
+        """Get the names starting with a prefix, regardless of case, in alphabetical order."""
+        node = 0
+        for char in prefix.strip().casefold():
+            node = int(self.nodes[node]["child"])
+            while node and self.nodes[node]["char"] != ord(char):
+                node = int(self.nodes[node]["sibling"])
+            if not node:
+                return []
+        names: list[str] = []
+        # depth first through the children in order, from the node of the prefix
+        stack = [node]
+        while stack and len(names) < limit:
+            node = stack.pop()
+            if (entry := int(self.nodes[node]["entry"])) != EMPTY:
+                names.append(self.name(entry))
+            children: list[int] = []
+            child = int(self.nodes[node]["child"])
+            while child:
+                children.append(child)
+                child = int(self.nodes[child]["sibling"])
+            stack.extend(reversed(children))
+        return names
+
+
+@cache
+def get_pokedex() -> Pokedex:
+    """Get the bundled database of species."""
+    return Pokedex()
+
+
+def get_species_types(name: str, gen: GENS = 9) -> tuple[Type, Optional[Type]]:
+    """Get the types of a species or form in a generation by its name, regardless of case.
+
+    Raises:
+        ValueError: If the species does not exist, or does not exist in the generation.
+    """
+    pokedex = get_pokedex()
+    entry = pokedex.find(name)
+    if entry is None:
+        suggestions = pokedex.complete(name[:3], limit=5)
+        hint = f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
+        raise ValueError(f"Unknown species: {name}.{hint}")
+    types = pokedex.types(entry, gen)
+    if types is None:
+        raise ValueError(f"{pokedex.name(entry)} does not exist in generation {gen}.")
+    return types
+
+
+if __name__ == "__main__":
+    RESOURCE.write_bytes(pack(SOURCE.read_text(encoding="utf-8")))
@@ -0,0 +1,98 @@
+"""Progress reporting and cooperative cancellation for long analyses."""
+
+import signal
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from types import FrameType
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ProgressUpdate:
+    """A snapshot of the progress of one stage of an analysis."""
+
+    stage: str
+    examined: int
+    found: int
+    total: int
+    elapsed: float
+    cancelled: bool = False
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds until the stage is complete, if it can be estimated yet."""
+        if not self.examined or not self.total:
+            return None
+        return self.elapsed * (self.total - self.examined) / self.examined
+
+
+ProgressCallback = Callable[[ProgressUpdate], None]
+
+
+class Progress:
+    """Tracks the progress of an analysis, reporting it to a callback and carrying requests to cancel it.
+
+    Analyses work in batches of `interval` items and call `advance` after each one, so the cost of tracking is paid
+    once per batch rather than once per item. Cancelling stops the current stage, whose results so far are kept and
+    passed on to the next stage.
+    """
+
+    def __init__(self, callback: Optional[ProgressCallback] = None, interval: int = 10000):
+        """Initialise progress tracking.
+
+        Args:
+            callback: Called with an update after every batch.
+            interval: The number of items an analysis examines between updates.
+        """
+        self.callback = callback
+        self.interval = interval
+        self.cancelled = False
+        self._stage = ""
+        self._total = 0
+        self._examined = 0
+        self._start = perf_counter()
+
+    def start(self, stage: str, total: int) -> None:
+        """Start a new stage of `total` items."""
+        self.cancelled = False
+        self._stage = stage
+        self._total = total
+        self._examined = 0
+        self._start = perf_counter()
+
+    def advance(self, examined: int, found: int) -> bool:
+        """Record a finished batch, returning whether the analysis should continue.
+
+        Args:
+            examined: The number of items examined in the batch.
+            found: The total number of results found so far in this stage.
+        """
+        self._examined += examined
+        if self.callback is not None:
+            elapsed = perf_counter() - self._start
+            self.callback(ProgressUpdate(self._stage, self._examined, found, self._total, elapsed, self.cancelled))
+        return not self.cancelled
+
+    def cancel(self) -> None:
+        """Ask the current stage to stop at the end of its batch."""
+        self.cancelled = True
+
+    @contextmanager
+    def cancel_on_interrupt(self) -> Generator["Progress", None, None]:
+        """Cancel the current stage on SIGINT instead of raising KeyboardInterrupt.
+
+        A second SIGINT before the next stage starts interrupts as usual.
+        """
+
+        def handler(signum: int, frame: Optional[FrameType]) -> None:
+            if self.cancelled:
+                raise KeyboardInterrupt
+            self.cancel()
+
+        previous = signal.signal(signal.SIGINT, handler)
+        try:
+            yield self
+        finally:
+            signal.signal(signal.SIGINT, previous)
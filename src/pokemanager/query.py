@@ -0,0 +1,151 @@
+"""A small query language for finding Pokémon across boxes.
+
+A query is a list of terms that must all hold, such as `type:water status:alive box:run3 met~route`. A term is a
+field and a value, separated by `:` for the field to equal the value or `~` for it to contain it, regardless of case.
+Words without a field are a fuzzy match on names and nicknames. Values with spaces are quoted: `met:"Route 1"`.
+
+A query is compiled once into a plan: box terms decide which boxes are loaded at all, fuzzy words are answered from
+the search index, other equality terms intersect the postings of each box's secondary indexes from the shortest, and
+only the terms that need it are checked entry by entry on what remains.
+"""
+
+import re
+import shlex
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Optional
+
+from pokemanager.data import Pokemon, Soullink
+from pokemanager.indexes import parse_key
+from pokemanager.main import AppData
+from pokemanager.search import Match
+from pokemanager.utils import slugify
+
+FIELDS = ("name", "type", "status", "met", "box")
+
+_TERM = re.compile(r"(?P<field>\w+)(?P<op>[:~])(?P<value>.*)", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class Term:
+    """A condition on one field of an entry."""
+
+    field: str
+    op: str  # ":" for the field to equal the value, "~" for it to contain it
+    value: str  # casefolded
+
+
+@dataclass(frozen=True)
+class Plan:
+    """A compiled query."""
+
+    boxes: Optional[frozenset[str]]  # keys of the only boxes that can match, or None for every box
+    fuzzy: str  # words to match names and nicknames like, or empty
+    steps: tuple[Term, ...]  # terms answered by the indexes of each box
+    scans: tuple[Term, ...]  # terms checked entry by entry
+
+    @property
+    def needs_boxes(self) -> bool:
+        """Whether the query reads the boxes, rather than being answered by the search index alone."""
+        return bool(self.steps or self.scans or not self.fuzzy)
+
+
+def parse(criteria: str) -> list[Term]:
+    """Parse a query into its terms.
+
+    Raises:
+        ValueError: If a term has an unknown field or an invalid value.
+    """
+    terms: list[Term] = []
+    words: list[str] = []
+    for token in shlex.split(criteria):
+        match = _TERM.fullmatch(token)
+        if match is None:
+            words.append(token)
+            continue
+        field, op, value = match["field"].lower(), match["op"], match["value"].strip().casefold()
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field: {field}. Known: {', '.join(FIELDS)}.")
+        if op == "~" and field not in {"name", "met"}:
+            raise ValueError(f"The {field} field can only be matched exactly, with ':'.")
+        if field in ("type", "status"):
+            parse_key(field, value)
+        terms.append(Term(field, op, value))
+    if words:
+        terms.append(Term("name", "", " ".join(words).casefold()))
+    return terms
+
+
+def box_key(name: str) -> str:
+    """Get the key a box is matched by, its slug without separators, so that `box:run3` matches the box "Run 3"."""
+    return slugify(name).replace("-", "").replace("_", "")
+
+
+def compile_query(criteria: str) -> Plan:
+    """Compile a query into a plan."""
+    terms = parse(criteria)
+    keys = {box_key(term.value) for term in terms if term.field == "box"}
+    return Plan(
+        boxes=frozenset(keys) if keys else None,
+        fuzzy=" ".join(term.value for term in terms if not term.op),
+        steps=tuple(term for term in terms if term.op == ":" and term.field != "box"),
+        scans=tuple(term for term in terms if term.op == "~"),
+    )
+
+
+def _holds(entry: Pokemon | Soullink, term: Term) -> bool:
+    if term.field == "met":
+        return term.value in entry.met.casefold()
+    souls = (entry.p1, entry.p2) if isinstance(entry, Soullink) else (entry,)
+    return any(term.value in name.casefold() for soul in souls for name in (soul.name, soul.nickname))
+
+
+def _filter(plan: Plan, candidates: Optional[dict[str, set[int]]]) -> Iterator[tuple[str, int, Pokemon | Soullink]]:
+    """Get the box name, position and entry of every entry that satisfies the terms of a plan besides fuzzy words.
+
+    Args:
+        plan: The plan whose terms the entries must satisfy.
+        candidates: The positions of the only entries of each box, by its key, that can match, or None for every entry.
+    """
+    keys = plan.boxes if candidates is None else frozenset(candidates)
+    # boxes are saved under their slugs, so only the files of matching boxes are loaded
+    slugs = None if keys is None else [slug for slug in AppData.get_box_slugs() if box_key(slug) in keys]
+    for box in AppData.iter_boxes(slugs):
+        if plan.steps:
+            # the index intersects the postings of the terms from the shortest, so the most selective goes first
+            positions = box.index.find((term.field, parse_key(term.field, term.value)) for term in plan.steps)  # type: ignore
+        else:
+            positions = range(len(box.pc))
+        if candidates is not None:
+            fuzzy_positions = candidates.get(box_key(box.name), set())
+            positions = [position for position in positions if position in fuzzy_positions]
+        for position in positions:
+            entry = box.pc[position]
+            if all(_holds(entry, term) for term in plan.scans):
+                yield box.name, position, entry
+
+
+def run(plan: Plan) -> Iterator[Match]:
+    """Find the entries that satisfy a plan, yielding each as soon as it is found.
+
+    Entries matched by fuzzy words come from the best match to the worst, and the others in the order of their boxes.
+    """
+    if not plan.fuzzy:
+        for box_name, position, entry in _filter(plan, None):
+            yield Match(1.0, box_name, position, entry.name, "")
+        return
+    ranked: list[Match] = []
+    candidates: dict[str, set[int]] = {}
+    for match in AppData.get_search_index().search(plan.fuzzy):
+        if plan.boxes is None or box_key(match.box) in plan.boxes:
+            if not plan.needs_boxes:
+                yield match
+            ranked.append(match)
+            candidates.setdefault(box_key(match.box), set()).add(match.index)
+    if not plan.needs_boxes:
+        return
+    # entries matched by fuzzy words are only ranked once every box has been checked for the other terms
+    found = {(box_key(box_name), position): entry for box_name, position, entry in _filter(plan, candidates)}
+    for match in ranked:
+        if (entry := found.get((box_key(match.box), match.index))) is not None:
+            yield Match(match.score, match.box, match.index, entry.name, match.term)
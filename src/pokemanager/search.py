@@ -0,0 +1,163 @@
+"""A fuzzy search index of the species names and nicknames of the Pokémon in every box.
+
+Names are indexed by their character trigrams, so a query is matched by counting the trigrams it shares with each
+name and ranking names by their Dice similarity, which tolerates typos without comparing the query to every name.
+The index is saved next to the boxes with the modification time and size of each box file it indexed, so searching
+only loads the boxes whose files were written or deleted since, including by anything other than this app.
+"""
+
+import pickle
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import mkstemp
+from typing import Optional
+
+from pokemanager.data import Box, Soullink
+
+INDEX_VERSION = 2  # bump whenever the layout of the index changes, to rebuild saved indexes
+
+
+Stamp = tuple[int, int]  # modification time in nanoseconds and size of a box file
+
+
+def file_stamp(path: Path) -> Stamp:
+    """Get the stamp of a box file, which changes whenever the file is written."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def trigrams(text: str) -> set[str]:
+    """Get the trigrams of a casefolded text, padded so that its start and end are trigrams of their own."""
+    padded = f"  {text.casefold()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class Match:
+    """A Pokémon whose name or nickname matches a query."""
+
+    score: float
+    box: str
+    index: int  # index of the entry in its box's PC
+    label: str  # name of the entry
+    term: str  # the name or nickname that matched
+
+
+class SearchIndex:
+    """A trigram index from names and nicknames to the entries of every box they appear in."""
+
+    def __init__(self) -> None:
+        """Initialise an empty index."""
+        self.version = INDEX_VERSION
+        self.grams: dict[str, set[str]] = {}  # trigram to the terms containing it
+        self.postings: dict[str, set[tuple[str, int]]] = {}  # casefolded term to the entries it names
+        self.terms: dict[str, str] = {}  # casefolded term to the term as written
+        self.entries: dict[str, list[tuple[str, tuple[str, ...]]]] = {}  # box name to the name and terms of each entry
+        self.files: dict[str, tuple[str, Stamp]] = {}  # slug of each indexed box file to its box name and stamp
+
+    @staticmethod
+    def get_path(appdata: Path) -> Path:
+        """Get the path of the index in the appdata directory, beside the boxes but not mistaken for one."""
+        return appdata.joinpath("boxes", "search.idx")
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SearchIndex"]:
+        """Load a saved index, if there is one and it has the current layout."""
+        try:
+            with path.open("rb") as f:
+                index = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if not isinstance(index, cls) or getattr(index, "version", None) != INDEX_VERSION:
+            return None
+        return index
+
+    def save(self, path: Path) -> None:
+        """Save the index, replacing the previous one atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, name = mkstemp(suffix=".idx", dir=path.parent)
+        with open(fd, "wb") as f:
+            pickle.dump(self, f)
+        Path(name).replace(path)
+
+    def stale_files(self, stamps: dict[str, Stamp]) -> tuple[list[str], list[str]]:
+        """Get the slugs of the box files that changed and of those that were removed, given the current stamps."""
+        changed = [slug for slug, stamp in stamps.items() if slug not in self.files or self.files[slug][1] != stamp]
+        removed = [slug for slug in self.files if slug not in stamps]
+        return changed, removed
+
+    def add_file(self, slug: str, box: Box, stamp: Stamp) -> None:
+        """Reindex the box saved in a file, remembering the file's stamp."""
+        self.remove_file(slug)
+        self.update_box(box)
+        self.files[slug] = (box.name, stamp)
+
+    def remove_file(self, slug: str) -> None:
+        """Remove the box saved in a file from the index."""
+        if slug in self.files:
+            self.remove_box(self.files.pop(slug)[0])
+
+    def _add(self, term: str, posting: tuple[str, int]) -> None:
+        key = term.casefold()
+        if key not in self.postings:
+            self.postings[key] = set()
+            self.terms[key] = term
+            for gram in trigrams(key):
+                self.grams.setdefault(gram, set()).add(key)
+        self.postings[key].add(posting)
+
+    def _discard(self, key: str, posting: tuple[str, int]) -> None:
+        postings = self.postings.get(key)
+        if postings is None:
+            return
+        postings.discard(posting)
+        if not postings:
+            del self.postings[key], self.terms[key]
+            for gram in trigrams(key):
+                self.grams[gram].discard(key)
+                if not self.grams[gram]:
+                    del self.grams[gram]
+
+    def remove_box(self, box_name: str) -> None:
+        """Remove every entry of a box from the index."""
+        for position, (_, keys) in enumerate(self.entries.pop(box_name, [])):
+            for key in keys:
+                self._discard(key, (box_name, position))
+
+    def update_box(self, box: Box) -> None:
+        """Reindex a box after it has changed, leaving the other boxes' entries untouched."""
+        self.remove_box(box.name)
+        entries: list[tuple[str, tuple[str, ...]]] = []
+        for position, entry in enumerate(box.pc):
+            souls = (entry.p1, entry.p2) if isinstance(entry, Soullink) else (entry,)
+            terms = {term for soul in souls for term in (soul.name, soul.nickname) if term}
+            for term in terms:
+                self._add(term, (box.name, position))
+            entries.append((entry.name, tuple({term.casefold() for term in terms})))
+        self.entries[box.name] = entries
+
+    def search(self, query: str, threshold: float = 0.3) -> Iterator[Match]:
+        """Find the entries named like a query, from the best match to the worst.
+
+        Args:
+            query: The name or nickname to look for, possibly misspelled.
+            threshold: The least Dice similarity of trigrams for a name to match, where names containing the query
+                always match.
+        """
+        key = query.strip().casefold()
+        grams = trigrams(key)
+        shared = Counter(term for gram in grams for term in self.grams.get(gram, ()))
+        scored: list[tuple[float, str]] = []
+        for term, count in shared.items():
+            score = 1.0 if key in term else 2 * count / (len(grams) + len(trigrams(term)))
+            if score >= threshold:
+                scored.append((score, term))
+        scored.sort(key=lambda pair: (-pair[0], pair[1]))
+        # an entry is found by its best matching term only
+        seen: set[tuple[str, int]] = set()
+        for score, term in scored:
+            for box_name, position in sorted(self.postings[term] - seen):
+                seen.add((box_name, position))
+                yield Match(score, box_name, position, self.entries[box_name][position][0], self.terms[term])
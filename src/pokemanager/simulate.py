@@ -0,0 +1,108 @@
+"""Monte Carlo simulation of a Soullink run's survival."""
+
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from math import sqrt
+from os import cpu_count
+from random import Random
+from typing import Optional
+
+from pokemanager.const import GENS
+from pokemanager.data import SoullinkPC
+
+SAMPLES_PER_CHUNK = 1000  # scenarios sampled per task, fixed so results depend on the seed but not on the workers
+
+
+@dataclass(frozen=True)
+class SurvivalEstimate:
+    """The estimated chance of a valid team still existing after a number of fights."""
+
+    fight: int
+    survived: int
+    samples: int
+
+    @property
+    def probability(self) -> float:
+        """The fraction of sampled scenarios in which a valid team survived."""
+        return self.survived / self.samples
+
+    def interval(self, z: float = 1.96) -> tuple[float, float]:
+        """Get the Wilson score interval of the probability, by default at 95% confidence."""
+        p = self.probability
+        denominator = 1 + z**2 / self.samples
+        centre = (p + z**2 / (2 * self.samples)) / denominator
+        spread = z * sqrt(p * (1 - p) / self.samples + z**2 / (4 * self.samples**2)) / denominator
+        return max(0.0, centre - spread), min(1.0, centre + spread)
+
+
+def run_scenarios(masks: list[int], death_chances: list[float], fights: int, samples: int, seed: int) -> list[int]:
+    """Sample death scenarios and count, for each fight, how many still have a valid team afterwards."""
+    rng = Random(seed)
+    survived = [0] * fights
+    for _ in range(samples):
+        # the fight in which each link dies, or `fights` if it survives them all
+        deaths: list[int] = []
+        for chance in death_chances:
+            fight = 0
+            while fight < fights and rng.random() >= chance:
+                fight += 1
+            deaths.append(fight)
+        for fight in range(fights):
+            if not SoullinkPC.team_exists([mask for mask, death in zip(masks, deaths) if death > fight]):
+                break
+            survived[fight] += 1
+    return survived
+
+
+@dataclass(frozen=True, kw_only=True)
+class SimulationOptions:
+    """How many fights a survival simulation covers and how it samples them."""
+
+    fights: int  # the number of upcoming fights to simulate
+    samples: int = 10000  # the number of death scenarios to sample
+    workers: Optional[int] = None  # the number of processes to sample in, by default one per CPU
+    seed: Optional[int] = None  # seed for sampling the same scenarios with any number of workers
+    gen: GENS = 9  # the generation of the PC's box, whose feature table is used
+
+
+def simulate_survival(
+    pc: SoullinkPC, death_chances: Mapping[int, float] | float, options: SimulationOptions
+) -> list[SurvivalEstimate]:
+    """Estimate the chance of a valid team existing after each of the next fights.
+
+    Args:
+        pc: The PC whose active Soullinks are at risk.
+        death_chances: The chance of each Soullink dying in a single fight, either one for all links or keyed by
+            position in the PC; links missing from the mapping are assumed safe.
+        options: The fights to simulate and how to sample them.
+    """
+    fights, samples = options.fights, options.samples
+    if fights < 1 or samples < 1:
+        raise ValueError("At least one fight and one sample must be simulated.")
+    if options.workers is not None and options.workers < 1:
+        raise ValueError("At least one worker is needed.")
+    indices = pc.get_active_indices(options.gen)
+    masks = pc.get_features(options.gen)["mask"][indices].tolist()
+    chances: list[float]
+    if isinstance(death_chances, Mapping):
+        chances = [death_chances.get(i, 0.0) for i in indices.tolist()]
+    else:
+        chances = [death_chances] * len(indices)
+    if any(not 0 <= chance <= 1 for chance in chances):
+        raise ValueError("Death chances must be between 0 and 1.")
+
+    workers = options.workers or cpu_count() or 1
+    # the scenarios are split into the same chunks with the same seeds however many workers sample them
+    chunks = -(-samples // SAMPLES_PER_CHUNK)
+    sizes = [min(SAMPLES_PER_CHUNK, samples - chunk * SAMPLES_PER_CHUNK) for chunk in range(chunks)]
+    seeds = Random(options.seed).sample(range(2**32), chunks)
+    survived = [0] * fights
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_scenarios, masks, chances, fights, size, chunk_seed)
+            for size, chunk_seed in zip(sizes, seeds)
+        ]
+        for future in futures:
+            survived = [total + count for total, count in zip(survived, future.result())]
+    return [SurvivalEstimate(fight + 1, count, samples) for fight, count in enumerate(survived)]
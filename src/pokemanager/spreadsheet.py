@@ -1,12 +1,23 @@
 """Fetch a box from a Google Sheet."""
 
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, Generator, Literal, get_args
+from typing import Any, Generator, Literal, Optional, get_args
 
 import gspread
+import numpy as np
+import numpy.typing as npt
 
+from pokemanager.analytics import (
+    TEAM_METRICS,
+    Scoring,
+    analyse_teams,
+    rank_teams,
+)
 from pokemanager.const import TYPE
 from pokemanager.data import Box, Pokemon, Soul, Soullink, SoullinkPC, StandardPC
+from pokemanager.progress import Progress
+from pokemanager.teams import MemoryBudget, get_teams_bounded
 from pokemanager.utils import URL
 
 
@@ -92,18 +103,58 @@ def parse_soullink(data: list[list[str]]) -> Generator[Soullink]:
 def report(
     box: Box,
     worksheet_name: str,
+    budget: Optional[MemoryBudget] = None,
+    progress: Optional[Progress] = None,
+    *,
+    scoring: Scoring = Scoring(),
 ):
+    """Report the teams of a box to a worksheet, with their metrics, best first by the chosen metric.
+
+    Teams are always scored in the generation of the box, whatever the generation of the scoring.
+
+    Raises:
+        ValueError: If the box is not configured, or teams generated within a memory budget are sorted by a metric other
+            than score, since only the best scoring teams are kept.
+    """
+    if budget is not None and scoring.sort_by != "score":
+        raise ValueError("Teams generated within a memory budget can only be sorted by score.")
     if not all(bool(config) for config in (box.category, box.credentials, box.spreadsheet_url)):
         raise ValueError(f"Please configure box: {box.name}")
     gspread_connection = gspread.service_account(box.credentials)
     spreadsheet = gspread_connection.open_by_url(box.spreadsheet_url)
     worksheet = spreadsheet.worksheet(worksheet_name)
-    if box.category == "standard":
+    scoring = replace(scoring, gen=box.gen)
+    pc = box.pc
+    if not isinstance(pc, SoullinkPC):
         raise NotImplementedError("Standard Pokemon are not supported yet.")
+    teams: npt.NDArray[np.intp]
+    if budget is not None:
+        # only the best teams that fit in the worksheet are kept
+        _, teams, spill_report = get_teams_bounded(
+            pc,
+            budget,
+            limit=worksheet.row_count,
+            progress=progress,
+            scoring=scoring,
+        )
+        print(f"Generated {spill_report}")
     else:
-        info: list[list[str | float]] = [
-            [sum(pk.score for sl in team for pk in (sl.p1, sl.p2))]
-            + [pkname for sl in team for pkname in (sl.p1.name, sl.p2.name)]
-            for team in box.pc.get_teams()
-        ]
-    worksheet.update(gspread.utils.fill_gaps(info, worksheet.row_count, 13), "A:M")
+        teams = pc.get_team_indices(progress, box.gen)
+    features = pc.get_features(box.gen)
+    batch = progress.interval if progress is not None else max(len(teams), 1)
+    if progress is not None:
+        progress.start("scoring teams", len(teams))
+    batches: list[npt.NDArray[np.void]] = []
+    scored = 0
+    for i in range(0, len(teams), batch):
+        batches.append(analyse_teams(features, teams[i : i + batch], scoring))
+        scored += len(batches[-1])
+        if progress is not None and not progress.advance(len(batches[-1]), scored):
+            break
+    metrics = np.concatenate(batches) if batches else np.empty(0, dtype=TEAM_METRICS)
+    info: list[list[str | float]] = []
+    for i in rank_teams(metrics, scoring.sort_by)[: worksheet.row_count]:
+        members: list[int] = teams[i].tolist()
+        info.append([*metrics[i].tolist(), *(pkname for j in members for pkname in (pc[j].p1.name, pc[j].p2.name))])
+    columns = len(TEAM_METRICS.descr) + 12
+    worksheet.update(gspread.utils.fill_gaps(info, worksheet.row_count, columns), f"A:{chr(ord('A') + columns - 1)}")
@@ -0,0 +1,73 @@
+"""Vectorised queries on the base stats of the species in a box.
+
+The base stats of every pokedex entry are one row of a table with a column per stat, and an extra row of zeros for
+species missing from the pokedex. Soullinks and teams carry the pokedex entries of their souls, so their stats are
+gathered by indexing the table with those entries rather than by looking each Pokémon up.
+"""
+
+from functools import cache
+
+import numpy as np
+import numpy.typing as npt
+
+from pokemanager.const import GENS
+from pokemanager.data import SoullinkPC
+from pokemanager.pokedex import get_pokedex
+
+STATS = ("hp", "attack", "defense", "special-attack", "special-defense", "speed")
+TOTAL = "total"  # the base stat total, the sum of every stat
+BST_SCALE = 600  # a mean base stat total that adds its full weight to a team's score
+
+
+@cache
+def get_base_stats() -> npt.NDArray[np.uint8]:
+    """Get the base stats of every pokedex entry, plus a last row of zeros for unknown species."""
+    stats = get_pokedex().entries["stats"]
+    table = np.zeros((len(stats) + 1, len(STATS)), dtype=np.uint8)
+    table[:-1] = stats
+    table.flags.writeable = False
+    return table
+
+
+def species_stats(entries: npt.ArrayLike) -> npt.NDArray[np.uint8]:
+    """Get the base stats of pokedex entries of any shape, where EMPTY and other unknown entries have none."""
+    table = get_base_stats()
+    return table[np.minimum(np.asarray(entries, dtype=np.intp), len(table) - 1)]
+
+
+def select(stats: npt.NDArray[np.uint8], stat: str = TOTAL) -> npt.NDArray[np.intp]:
+    """Get one stat, or the total, of base stats of any shape.
+
+    Raises:
+        ValueError: If the stat is unknown.
+    """
+    if stat == TOTAL:
+        return stats.sum(axis=-1, dtype=np.intp)
+    if stat not in STATS:
+        raise ValueError(f"Unknown stat: {stat}. Known: {', '.join((*STATS, TOTAL))}.")
+    return stats[..., STATS.index(stat)].astype(np.intp)
+
+
+def link_stats(features: npt.NDArray[np.void], stat: str = TOTAL) -> npt.NDArray[np.float64]:
+    """Get one stat of Soullinks from their features, as the mean of both souls'."""
+    return select(species_stats(np.stack([features["s1"], features["s2"]], axis=-1)), stat).mean(axis=-1)
+
+
+def rank_links(
+    pc: SoullinkPC, stat: str = TOTAL, gen: GENS = 9
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+    """Get the indices of the active Soullinks of a PC from highest to lowest in a stat, with their values."""
+    active = pc.get_active_indices(gen)
+    values = link_stats(pc.get_features(gen)[active], stat)
+    order = np.argsort(-values, kind="stable")
+    return active[order], values[order]
+
+
+def team_stats(species: npt.ArrayLike, stat: str = TOTAL) -> npt.NDArray[np.float64]:
+    """Get the mean of one stat over the souls of each team, from their pokedex entries, one team per row."""
+    return select(species_stats(species), stat).mean(axis=-1)
+
+
+def link_stat_scores(features: npt.NDArray[np.void], weight: float, size: int = 6) -> npt.NDArray[np.float64]:
+    """Get what each Soullink adds to the score of a team of a size, so the stat component is a sum over members."""
+    return weight * link_stats(features) / (size * BST_SCALE)
@@ -0,0 +1,81 @@
+"""Pairwise synergy of team members derived from the dual type matchups.
+
+Two dual types have synergy when one has good matchups where the other has bad ones: their synergy is how much
+better the best of the pair does against every dual type than the pair does on average. A team's synergy is the sum
+over each pair of its Soullinks of the synergy of each player's souls.
+"""
+
+from collections.abc import Iterator, Sequence
+from functools import cache
+from itertools import combinations
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from pokemanager.const import GENS
+from pokemanager.typer import chart_era, get_dual_matchups, get_gen_duals
+
+
+@cache
+def _get_era_synergy(era: GENS) -> npt.NDArray[np.float64]:
+    matchups = get_dual_matchups(era)[:, get_gen_duals(era)]
+    means = matchups.mean(axis=1)
+    best = np.maximum(matchups[:, None, :], matchups[None, :, :]).mean(axis=2)
+    synergy = best - (means[:, None] + means[None, :]) / 2
+    synergy.flags.writeable = False
+    return synergy
+
+
+def get_dual_synergy(gen: GENS = 9) -> npt.NDArray[np.float64]:
+    """Get the synergy of every pair of dual types in a generation."""
+    return _get_era_synergy(chart_era(gen))
+
+
+def link_compatibility(features: npt.NDArray[np.void], gen: GENS = 9) -> npt.NDArray[np.float64]:
+    """Get the synergy of every pair of Soullinks, summed over both players' souls, from their feature records."""
+    synergy = get_dual_synergy(gen)
+    p1 = features["p1"].astype(np.intp)
+    p2 = features["p2"].astype(np.intp)
+    return synergy[p1[:, None], p1] + synergy[p2[:, None], p2]
+
+
+def team_synergy(teams: npt.ArrayLike, gen: GENS = 9) -> npt.NDArray[np.float64]:
+    """Get the synergy of a batch of teams given as the dual ids of both souls of each Soullink, one team per row."""
+    duals = np.asarray(teams, dtype=np.intp)
+    souls = duals.reshape(len(duals), -1, 2)
+    synergy = get_dual_synergy(gen)
+    total = np.zeros(len(duals))
+    for player in range(2):
+        members = souls[:, :, player]
+        # every pair is counted in both orders and souls have no synergy with themselves
+        total += synergy[members[:, :, None], members[:, None, :]].sum(axis=(1, 2)) / 2
+    return total
+
+
+def scored_combinations(
+    scores: Sequence[float], compatibility: Optional[npt.NDArray[np.float64]] = None, size: int = 6
+) -> Iterator[tuple[float, tuple[int, ...]]]:
+    """Generate the combinations of indices in lexicographic order with their summed scores and compatibility.
+
+    Compatibility is kept incrementally: a running sum of the rows of the chosen members holds what every later
+    index would add, so choosing a member costs one row and completing a combination one lookup.
+    """
+    if compatibility is None:
+        for team in combinations(range(len(scores)), size):
+            yield sum(scores[i] for i in team), team
+        return
+    n = len(scores)
+    base = np.asarray(scores, dtype=np.float64)
+
+    def extend(
+        start: int, team: tuple[int, ...], total: float, gains: npt.NDArray[np.float64]
+    ) -> Iterator[tuple[float, tuple[int, ...]]]:
+        if len(team) == size - 1:
+            for offset, gain in enumerate((base[start:] + gains[start:]).tolist()):
+                yield total + gain, (*team, start + offset)
+            return
+        for i in range(start, n - (size - len(team)) + 1):
+            yield from extend(i + 1, (*team, i), float(total + base[i] + gains[i]), gains + compatibility[i])
+
+    yield from extend(0, (), 0.0, np.zeros(n))
@@ -0,0 +1,262 @@
+"""Memory-bounded generation of Soullink teams.
+
+Teams are packed into fixed-size records of their negated score and the indices of their members, so that records
+sort best first. Records are buffered up to the memory budget, sorted in place, spilled to disk as runs and finally
+merged so that teams stream out best first.
+
+The budget covers every record held at once: the packed buffer and blocks, and the Python tuples that records pass
+through while they are enumerated, collected and merged, which take several times the bytes of a packed record.
+"""
+
+import sys
+from collections.abc import Generator, Iterator
+from contextlib import closing
+from dataclasses import dataclass, field
+from heapq import merge
+from itertools import islice
+from math import comb
+from pathlib import Path
+from tempfile import mkstemp
+from typing import Optional, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+from pokemanager.analytics import Scoring
+from pokemanager.data import SoullinkPC
+from pokemanager.progress import Progress
+from pokemanager.stats import link_stat_scores
+from pokemanager.synergy import link_compatibility, scored_combinations
+
+TEAM_RECORD = np.dtype([("neg_score", "<f8"), ("links", "<u2", (6,))])
+CHUNK_RECORDS = 4096  # records collected in Python before being packed into the buffer
+MIN_BLOCK_RECORDS = 64  # smallest block read from a run while merging
+
+Record: TypeAlias = tuple[float, tuple[int, ...]]
+
+
+def record_bytes(members: int) -> int:
+    """Get the bytes of a record held in a Python list, for teams drawn from a number of Soullinks.
+
+    A record is a pointer in the list, its tuple, its score and its team. The members of a team are indices below the
+    number of Soullinks, and indices up to 256 are cached small integers that records share rather than hold.
+    """
+    record: Record = (0.5, (0,) * 6)
+    nbytes = 8 + sys.getsizeof(record) + sys.getsizeof(record[0]) + sys.getsizeof(record[1])
+    return nbytes + (6 * sys.getsizeof(members) if members > 257 else 0)
+
+
+@dataclass(frozen=True)
+class MemoryBudget:
+    """The most bytes team generation may hold at once, and the directory it spills sorted runs to."""
+
+    size: int
+    spill_dir: Path
+
+
+@dataclass
+class SpillReport:
+    """Memory usage of a bounded team generation."""
+
+    budget: int
+    peak: int = 0
+    teams: int = 0
+    runs: int = 0
+    merge_passes: int = 0
+    files: list[Path] = field(default_factory=list[Path])
+
+    def __str__(self) -> str:
+        """Summarise the generation."""
+        return (
+            f"{self.teams} teams spilled in {self.runs} runs and merged in {self.merge_passes} passes, "
+            f"using at most {self.peak} of {self.budget} bytes"
+        )
+
+
+class BoundedTeams:
+    """The valid teams of a PC, generated within a fixed memory budget and iterated best first."""
+
+    def __init__(
+        self, pc: SoullinkPC, budget: MemoryBudget, progress: Optional[Progress] = None, *, scoring: Scoring = Scoring()
+    ):
+        """Prepare to generate the teams of the active Soullinks in the PC.
+
+        Args:
+            pc: The PC to generate teams from.
+            budget: The most bytes that may be held in team records at once, packed or as Python tuples, and where
+                sorted runs are temporarily stored.
+            progress: Tracks the enumeration of teams; if cancelled, only the teams found so far are merged.
+            scoring: How the teams are scored, and in which generation.
+        """
+        self.features = pc.get_features(scoring.gen)
+        self.indices = pc.get_active_indices(scoring.gen)
+        if len(self.indices) > np.iinfo(TEAM_RECORD["links"].base).max:
+            raise ValueError(f"Too many active Soullinks to pack: {len(self.indices)}")
+        # a record read while merging is held both packed in its block and as a Python tuple
+        self.record_bytes = record_bytes(len(self.indices))
+        self.merge_bytes = TEAM_RECORD.itemsize + self.record_bytes
+        if budget.size < 4 * MIN_BLOCK_RECORDS * self.merge_bytes:
+            raise ValueError(f"A memory budget of {budget.size} bytes is too small to generate teams.")
+        self.spill_dir = budget.spill_dir
+        self.progress = progress
+        self.scoring = scoring
+        # records collected before being packed, and enumerated between progress updates, together take at most half
+        self.chunk = min(CHUNK_RECORDS, budget.size // (4 * self.record_bytes))
+        self.batch = 0 if progress is None else min(progress.interval, budget.size // (4 * self.record_bytes))
+        self.report = SpillReport(budget.size)
+        self._held: dict[str, int] = {}
+
+    def _hold(self, what: str, nbytes: int) -> None:
+        """Account for the bytes held in one place until they are next accounted, keeping the total within budget."""
+        self._held[what] = nbytes
+        total = sum(self._held.values())
+        if total > self.report.budget:
+            raise MemoryError(f"Team generation exceeded its memory budget: {total} > {self.report.budget} bytes")
+        self.report.peak = max(self.report.peak, total)
+
+    def _records(self) -> Iterator[Record]:
+        active = self.features[self.indices]
+        masks = active["mask"].tolist()
+        scores = active["score"]
+        synergy, stats = self.scoring.synergy, self.scoring.stats
+        if stats:
+            # the stat component of a team's score is a sum over its members, like the score of their types
+            scores = scores + link_stat_scores(active, stats)
+        scores = scores.tolist()
+        compatibility = link_compatibility(active, self.scoring.gen) * synergy if synergy else None
+        combos = scored_combinations(scores, compatibility)
+        if self.progress is None:
+            for score, team in combos:
+                if SoullinkPC.team_exists([masks[i] for i in team]):
+                    yield -score, team
+            return
+        self.progress.start("enumerating teams", comb(len(self.indices), 6))
+        found = 0
+        while batch := list(islice(combos, self.batch)):
+            self._hold("batch", len(batch) * self.record_bytes)
+            for score, team in batch:
+                if SoullinkPC.team_exists([masks[i] for i in team]):
+                    found += 1
+                    yield -score, team
+            if not self.progress.advance(len(batch), found):
+                break
+        self._hold("batch", 0)
+
+    def _spill(self, buffer: npt.NDArray[np.void]) -> Path:
+        fd, name = mkstemp(suffix=".teams", dir=self.spill_dir)
+        path = Path(name)
+        self.report.files.append(path)
+        with open(fd, "wb") as f:
+            buffer.sort(order="neg_score")
+            buffer.tofile(f)
+        return path
+
+    def _generate_runs(self) -> list[Path]:
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        # the buffer takes what the Python lists leave, but never more than every possible team
+        lists = (self.chunk + self.batch) * self.record_bytes
+        capacity = min((self.report.budget - lists) // TEAM_RECORD.itemsize, comb(len(self.indices), 6))
+        buffer = np.empty(capacity, dtype=TEAM_RECORD)
+        self._hold("buffer", buffer.nbytes)
+        runs: list[Path] = []
+        filled = 0
+        chunk: list[Record] = []
+        for record in self._records():
+            chunk.append(record)
+            if len(chunk) < self.chunk:
+                continue
+            filled = self._pack(buffer, filled, chunk, runs)
+            chunk.clear()
+        filled = self._pack(buffer, filled, chunk, runs)
+        if filled:
+            runs.append(self._spill(buffer[:filled]))
+        self._held.clear()
+        self.report.runs = len(runs)
+        return runs
+
+    def _pack(self, buffer: npt.NDArray[np.void], filled: int, chunk: list[Record], runs: list[Path]) -> int:
+        self._hold("chunk", len(chunk) * self.record_bytes)
+        if filled + len(chunk) > len(buffer):
+            runs.append(self._spill(buffer[:filled]))
+            filled = 0
+        buffer[filled : filled + len(chunk)] = chunk
+        self.report.teams += len(chunk)
+        return filled + len(chunk)
+
+    def _read_run(self, path: Path, block: int) -> Iterator[Record]:
+        with path.open("rb") as f:
+            while len(records := np.fromfile(f, dtype=TEAM_RECORD, count=block)):
+                yield from records.tolist()
+
+    def _block(self, runs: int) -> int:
+        # every run being read holds a block, and merging a group writes through one more
+        share = self.report.budget // ((runs + 1) * self.merge_bytes)
+        return max(MIN_BLOCK_RECORDS, min(CHUNK_RECORDS, share))
+
+    def _merge_group(self, runs: list[Path]) -> Path:
+        block = self._block(len(runs))
+        self._hold("merge", len(runs) * block * self.merge_bytes + block * TEAM_RECORD.itemsize)
+        output = np.empty(block, dtype=TEAM_RECORD)
+        fd, name = mkstemp(suffix=".teams", dir=self.spill_dir)
+        path = Path(name)
+        self.report.files.append(path)
+        with open(fd, "wb") as f:
+            filled = 0
+            for record in merge(*(self._read_run(run, block) for run in runs)):
+                output[filled] = record
+                filled += 1
+                if filled == block:
+                    output.tofile(f)
+                    filled = 0
+            output[:filled].tofile(f)
+        for run in runs:
+            run.unlink()
+        return path
+
+    def _merge_runs(self, runs: list[Path]) -> Iterator[Record]:
+        fan_in = self.report.budget // (MIN_BLOCK_RECORDS * self.merge_bytes) - 1
+        while len(runs) > fan_in:
+            # too many runs to read at once, so merge them in groups into fewer, longer runs
+            self.report.merge_passes += 1
+            runs = [self._merge_group(runs[i : i + fan_in]) for i in range(0, len(runs), fan_in)]
+        self.report.merge_passes += 1
+        block = self._block(len(runs))
+        self._hold("merge", len(runs) * block * self.merge_bytes)
+        yield from merge(*(self._read_run(run, block) for run in runs))
+
+    def __iter__(self) -> Generator[tuple[float, tuple[int, ...]], None, None]:
+        """Generate the teams and iterate over them best first, with the positions of their members in the PC."""
+        positions = self.indices.tolist()
+        try:
+            for neg_score, links in self._merge_runs(self._generate_runs()):
+                yield -neg_score, tuple(positions[i] for i in links)
+        finally:
+            self.cleanup()
+
+    def cleanup(self) -> None:
+        """Remove any runs left in the spill directory."""
+        for path in self.report.files:
+            path.unlink(missing_ok=True)
+        self.report.files.clear()
+
+
+def get_teams_bounded(
+    pc: SoullinkPC,
+    budget: MemoryBudget,
+    limit: Optional[int] = None,
+    progress: Optional[Progress] = None,
+    *,
+    scoring: Scoring = Scoring(),
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.intp], SpillReport]:
+    """Get the best scoring teams of a PC within a memory budget, with a report of the memory used.
+
+    The budget covers generating the teams, and the teams returned are packed into arrays beside it.
+
+    Returns:
+        The scores of the teams from highest to lowest, the positions of their members in the PC, one team per row,
+        and the report.
+    """
+    teams = BoundedTeams(pc, budget, progress, scoring=scoring)
+    with closing(iter(teams)) as iterator:
+        best = np.fromiter(islice(iterator, limit), dtype=[("score", "<f8"), ("team", np.intp, (6,))])
+    return best["score"], best["team"], teams.report
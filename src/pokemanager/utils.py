@@ -40,6 +40,15 @@ def slugify(value: Any, allow_unicode: bool = False):
     return re.sub(r"[-\s]+", "-", value).strip("-_")
 
 
+def parse_size(value: str) -> int:
+    """Parse a size in bytes with an optional binary suffix, such as "512K", "256M" or "2G"."""
+    match = re.fullmatch(r"\s*(\d+)\s*([KMG]?)i?B?\s*", value, re.IGNORECASE)
+    if match is None:
+        raise ValueError(f'Invalid size: "{value}"')
+    number, suffix = match.groups()
+    return int(number) * 1024 ** " KMG".index(suffix.upper() or " ")
+
+
 class URL(str):
     """A string that is validated to be a URL."""
 
@@ -0,0 +1,32 @@
+"""Shared fixtures of the tests."""
+
+from pathlib import Path
+
+import pytest
+
+from pokemanager.data import Soul, Soullink
+
+
+@pytest.fixture(autouse=True)
+def no_appdata(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Run every test as if pokemanager had not been initialised, so nothing is read from or cached in appdata."""
+    monkeypatch.setattr("pokemanager.main.config_file", tmp_path / "pokemanager.toml")
+
+
+@pytest.fixture
+def appdata(tmp_path: Path) -> Path:
+    """Initialise pokemanager with an empty appdata directory, for tests of the commands."""
+    directory = tmp_path / "appdata"
+    (tmp_path / "pokemanager.toml").write_text(f'appdata = "{directory.as_posix()}"\n', encoding="utf-8")
+    return directory
+
+
+@pytest.fixture
+def links() -> list[Soullink]:
+    """Get nine Soullinks of distinct types, any six of which are a valid team."""
+    names = ["Bulbasaur", "Charmander", "Squirtle", "Pikachu", "Geodude", "Abra", "Gastly", "Machop", "Caterpie"]
+    types = ["Grass", "Fire", "Water", "Electric", "Rock", "Psychic", "Ghost", "Fighting", "Bug"]
+    return [
+        Soullink(False, f"Route {i}", Soul(name, name[:4], type_), Soul(name, name[-4:], type_))
+        for i, (name, type_) in enumerate(zip(names, types))
+    ]
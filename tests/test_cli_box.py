@@ -0,0 +1,60 @@
+"""Tests of the commands that analyse boxes."""
+
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from pokemanager.cli_commands.cli_box import box_stats, box_teams
+from pokemanager.data import Box, Soullink
+from pokemanager.main import AppData
+
+
+def save_box(game: str, links: list[Soullink]) -> Box:
+    """Save a soullink box of a game."""
+    box = Box(name="run", game=game, category="soullink", pokemon=links)  # type: ignore
+    AppData.save_box(box)
+    return box
+
+
+def test_box_teams(appdata: Path, links: list[Soullink], capsys: pytest.CaptureFixture[str]):
+    """Teams are ranked against the named bosses of the box's game."""
+    save_box("Red", links)
+    box_teams(Namespace(name="run", vs="brock,Misty", top=2))
+    out = capsys.readouterr().out
+    assert "Best 2 of" in out
+    assert "against Brock, Misty" in out
+
+
+@pytest.mark.usefixtures("appdata")
+@pytest.mark.parametrize(
+    ("game", "vs", "message"),
+    [("Red", "Gary", "Unknown opponents in Red: Gary."), ("Gold", "Falkner", "No opponent rosters for Gold.")],
+)
+def test_box_teams_unknown_opponents(
+    links: list[Soullink], capsys: pytest.CaptureFixture[str], game: str, vs: str, message: str
+):
+    """Unknown bosses, and games without rosters, are reported rather than raised."""
+    save_box(game, links)
+    box_teams(Namespace(name="run", vs=vs, top=2))
+    assert message in capsys.readouterr().out
+
+
+@pytest.mark.usefixtures("appdata")
+def test_box_stats(links: list[Soullink], capsys: pytest.CaptureFixture[str]):
+    """Soullinks are ranked by a base stat, keeping their box order on ties, and so are teams by its mean."""
+    save_box("Red", links)
+    box_stats(Namespace(name="run", stat="speed", teams=False, top=3))
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[-3:] == [
+        "- 90.0: Pikachu & Pikachu (Pikachu/Pikachu)",
+        "- 90.0: Abra & Abra (Abra/Abra)",
+        "- 80.0: Gastly & Gastly (Gastly/Gastly)",
+    ]
+    box_stats(Namespace(name="run", stat="speed", teams=True, top=1))
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[-2:] == [
+        "Best 1 of 84 teams by mean speed:",
+        "- 69.2: Bulbasaur & Bulbasaur, Charmander & Charmander, Pikachu & Pikachu, Abra & Abra, Gastly & Gastly, "
+        "Caterpie & Caterpie",
+    ]
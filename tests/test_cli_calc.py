@@ -0,0 +1,32 @@
+"""Tests of the commands that estimate damage."""
+
+from argparse import Namespace
+
+import pytest
+
+from pokemanager.cli_commands.cli_calc import calc_box
+from pokemanager.data import Box, Soul, Soullink
+from pokemanager.main import AppData
+
+
+@pytest.mark.usefixtures("appdata")
+def test_calc_box(links: list[Soullink], capsys: pytest.CaptureFixture[str]):
+    """Species missing from the pokedex are skipped, and the others are matched against the whole team."""
+    missing = Soullink(False, "Route 101", Soul("Treecko", "", "Grass"), Soul("Mudkip", "", "Water"))
+    AppData.save_box(Box(name="run", game="FireRed", category="soullink", pokemon=[*links, missing]))  # type: ignore
+    calc_box(Namespace(name="run", vs="Brock", level=None, moves=True))
+    out = capsys.readouterr().out
+    assert "Skipping species missing from the pokedex: Treecko, Mudkip" in out
+    assert "Damage of level 14 Pokémon of box 'run' against Brock" in out
+    assert "- Squi: " in out
+
+
+@pytest.mark.usefixtures("appdata")
+@pytest.mark.parametrize(
+    ("level", "message"), [(5, "Damage of level 5"), (0, "Levels must be between 1 and 100, got 0.")]
+)
+def test_calc_box_level(links: list[Soullink], capsys: pytest.CaptureFixture[str], level: int, message: str):
+    """Any given level is used, however low, and levels that don't exist are reported."""
+    AppData.save_box(Box(name="run", game="FireRed", category="soullink", pokemon=links))  # type: ignore
+    calc_box(Namespace(name="run", vs="Brock", level=level, moves=False))
+    assert message in capsys.readouterr().out
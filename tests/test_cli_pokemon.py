@@ -0,0 +1,60 @@
+"""Tests of the commands that manage Pokémon."""
+
+from argparse import Namespace
+
+import pytest
+
+from pokemanager.cli_commands.cli_pokemon import pokemon_add
+from pokemanager.const import Type
+from pokemanager.data import Box, Soullink
+from pokemanager.main import AppData
+
+
+def add(data: str, *types: str) -> Soullink:
+    """Add a Soullink to an empty Sun box and get it back."""
+    AppData.save_box(Box(name="run", game="Sun", category="soullink", pokemon=[]))  # type: ignore
+    pokemon_add(Namespace(box_name="run", pokemon_data=data, met="Route 101", party=False, moves=[], types=list(types)))
+    pc = AppData().boxes["run"].pc
+    assert len(pc) == 1
+    entry = pc[0]
+    assert isinstance(entry, Soullink)
+    return entry
+
+
+@pytest.mark.usefixtures("appdata")
+def test_add_from_pokedex():
+    """The types of species in the pokedex are looked up, and their names are spelled as in it."""
+    link = add("vulpix-alola:Frost,Oddish")
+    assert (link.p1.name, link.p1.nickname, link.p1.type1, link.p1.type2) == ("Vulpix-Alola", "Frost", Type.Ice, None)
+    assert (link.p2.name, link.p2.nickname, link.p2.type1, link.p2.type2) == (
+        "Oddish",
+        "Oddish",
+        Type.Grass,
+        Type.Poison,
+    )
+
+
+@pytest.mark.usefixtures("appdata")
+def test_add_with_types():
+    """Species missing from the pokedex are added with the types they are given."""
+    link = add("Treecko,Mudkip:Mud", "grass", "Water/Ground")
+    assert (link.p1.name, link.p1.type1, link.p1.type2) == ("Treecko", Type.Grass, None)
+    assert (link.p2.name, link.p2.nickname, link.p2.type1, link.p2.type2) == ("Mudkip", "Mud", Type.Water, Type.Ground)
+
+
+@pytest.mark.usefixtures("appdata")
+@pytest.mark.parametrize(
+    ("data", "types", "message"),
+    [
+        ("Treecko,Oddish", [], "Unknown species: Treecko."),
+        ("Treecko,Oddish", ["Wood"], "Unknown type: Wood"),
+        ("Treecko,Oddish", ["Grass/Poison/Bug"], "At most two types per soul, got Grass/Poison/Bug."),
+        ("Treecko,Oddish", ["Grass", "Grass", "Grass"], "needs at most 2 types per entry, got 3."),
+    ],
+)
+def test_add_errors(capsys: pytest.CaptureFixture[str], data: str, types: list[str], message: str):
+    """Species that can't be typed are reported, and nothing is added."""
+    AppData.save_box(Box(name="run", game="Sun", category="soullink", pokemon=[]))  # type: ignore
+    pokemon_add(Namespace(box_name="run", pokemon_data=data, met="", party=False, moves=[], types=types))
+    assert message in capsys.readouterr().out
+    assert not AppData().boxes["run"].pc
@@ -0,0 +1,91 @@
+"""Tests of the bitset profiles of dual types, against the type charts they are packed from."""
+
+import numpy as np
+import pytest
+
+from pokemanager.analytics import popcount
+from pokemanager.const import Dual, Type
+from pokemanager.coverage import (
+    count_at_least,
+    get_profiles,
+    immunities,
+    shared_weaknesses,
+    super_effective,
+    unresisted,
+)
+from pokemanager.data import Soul
+from pokemanager.typer import get_gen_duals, get_gen_types, get_type_vs_dual_chart
+
+
+def bits(mask: int) -> set[int]:
+    """Get the positions of the set bits of a mask."""
+    return {i for i in range(32) if mask >> i & 1}
+
+
+def random_teams(gen: int, count: int = 200, seed: int = 0) -> np.ndarray:
+    """Draw teams of six dual types that exist in a generation."""
+    duals = np.flatnonzero(get_gen_duals(gen))
+    return np.random.default_rng(seed).choice(duals, size=(count, 6))
+
+
+@pytest.mark.parametrize("at_least", [0, 1, 2, 3, 5, 6, 7, 9])
+def test_count_at_least(at_least: int):
+    """Bits set in at least a number of masks are those a plain count finds."""
+    masks = np.random.default_rng(at_least).integers(0, 2**32, size=(8, 50), dtype=np.uint32)
+    expected = [
+        sum(1 << i for i in range(32) if sum(int(m) >> i & 1 for m in masks[:, j]) >= at_least)
+        for j in range(masks.shape[1])
+    ]
+    assert count_at_least(list(masks), at_least).tolist() == expected
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint32, np.uint64])
+def test_popcount(dtype: type):
+    """Set bits are counted in masks of any width and shape."""
+    masks = np.random.default_rng(0).integers(0, np.iinfo(dtype).max, size=(4, 25), dtype=dtype, endpoint=True)
+    assert popcount(masks).tolist() == [[bin(int(m)).count("1") for m in row] for row in masks]
+
+
+@pytest.mark.parametrize("gen", [1, 2, 6, 9])
+def test_team_profiles(gen: int):
+    """Holes, immunities and shared weaknesses of teams match the type chart of their generation."""
+    chart = get_type_vs_dual_chart(gen)
+    types = np.flatnonzero(get_gen_types(gen))
+    teams = random_teams(gen, seed=gen)
+    holes, immune, shared = unresisted(teams, gen), immunities(teams, gen), shared_weaknesses(teams, 3, gen)
+    for team, hole, immunity, weakness in zip(teams, holes.tolist(), immune.tolist(), shared.tolist()):
+        effects = chart[np.ix_(types, team)]
+        assert bits(hole) == set(types[(effects >= 1).all(axis=1)].tolist())
+        assert bits(immunity) == set(types[(effects == 0).any(axis=1)].tolist())
+        assert bits(weakness) == set(types[(effects > 1).sum(axis=1) >= 3].tolist())
+
+
+def test_profiles_only_have_existing_types():
+    """Attacking types that did not exist yet are in no profile of the first generation."""
+    profiles = get_profiles(1)
+    missing = sum(1 << t for t in (Type.Dark, Type.Steel, Type.Fairy))
+    assert not profiles.types & missing
+    assert not (unresisted(random_teams(1), 1) & missing).any()
+
+
+@pytest.mark.parametrize("gen", [1, 9])
+def test_super_effective(gen: int):
+    """Pokémon hit the existing dual types their types, or their damaging moves, are super effective against."""
+    chart = get_type_vs_dual_chart(gen)
+    exists = get_gen_duals(gen)
+    souls = [
+        Soul("Pikachu", "", "Electric"),
+        Soul("Gyarados", "", "Water", "Flying"),
+        Soul("Gengar", "", "Ghost", "Poison", moves=("Shadow Ball", "Thunderbolt", "Hypnosis", "Not A Move")),
+        Soul("Clefable", "", "Fairy", moves=("Moonblast",)),
+    ]
+    attacks = [
+        [Type.Electric],
+        [Type.Water, Type.Flying],
+        [Type.Ghost, Type.Electric],
+        [Type.Fairy] if get_gen_types(gen)[Type.Fairy] else [],
+    ]
+    hits = np.unpackbits(super_effective(souls, gen), axis=1, count=len(Dual)).astype(bool)
+    for row, types in zip(hits, attacks):
+        expected = (chart[types] > 1).any(axis=0) & exists if types else np.zeros(len(Dual), dtype=bool)
+        assert np.array_equal(row, expected)
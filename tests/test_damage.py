@@ -0,0 +1,81 @@
+"""Tests of the damage ranges of attacks."""
+
+import numpy as np
+
+from pokemanager.const import Type
+from pokemanager.damage import PHYSICAL, SPECIAL, STATUS, Fighters, Moves, best_ranges, damage_ranges, get_moves
+from pokemanager.data import Soul
+from pokemanager.pokedex import get_pokedex
+from pokemanager.typer import get_dual
+
+
+def fighters(duals: list[int], level: int = 50, stat: int = 100) -> Fighters:
+    """Make fighters with every stat the same."""
+    return Fighters(np.full(len(duals), level), np.full((len(duals), 6), stat), np.array(duals))
+
+
+def moves(*rows: tuple[Type, int, int, bool]) -> Moves:
+    """Make the moves of a single attacker from their types, categories, powers and same type bonuses."""
+    types, categories, powers, stab = zip(*rows)
+    return Moves(
+        type=np.array([types]),
+        category=np.array([categories]),
+        power=np.array([powers]),
+        stab=np.array([stab]),
+        names=(tuple(t.name for t in types),),
+    )
+
+
+def test_known_damage():
+    """Damage follows the formula, rounding down after the roll, the same type bonus and the effectiveness."""
+    attacker = fighters([get_dual(Type.Fire)])
+    defenders = fighters([get_dual(Type.Normal), get_dual(Type.Grass), get_dual(Type.Ghost)])
+    attack = moves(
+        (Type.Normal, PHYSICAL, 80, False),
+        (Type.Fire, SPECIAL, 80, True),
+        (Type.Normal, STATUS, 0, False),
+    )
+    low, high = damage_ranges(attacker, attack, defenders)
+    # a base damage of 37, rolled down to 31 at 85%
+    assert low.tolist() == [[[31, 31, 0], [46, 92, 46], [0, 0, 0]]]
+    assert high.tolist() == [[[37, 37, 0], [55, 110, 55], [0, 0, 0]]]
+
+
+def test_stats_are_chosen_by_category():
+    """Physical moves compare attack with defense and special moves special attack with special defense."""
+    attacker = Fighters(np.array([50]), np.array([[100, 200, 100, 50, 100, 100]]), np.array([get_dual(Type.Normal)]))
+    defender = Fighters(np.array([50]), np.array([[100, 100, 200, 100, 50, 100]]), np.array([get_dual(Type.Water)]))
+    low, high = damage_ranges(
+        attacker, moves((Type.Fire, PHYSICAL, 80, False), (Type.Fire, SPECIAL, 80, False)), defender
+    )
+    # each move meets a defending stat equal to the attacking stat it uses, so both deal the same damage
+    assert low[0, 0, 0] == low[0, 1, 0]
+    assert high[0, 0, 0] == high[0, 1, 0]
+
+
+def test_damage_ranges_shape():
+    """Every move of every attacker has a range against every defender, and its best move is the most damaging."""
+    souls = [
+        Soul("Charizard", "", "Fire", "Flying", moves=("Flamethrower", "Air Slash", "Roost")),
+        Soul("Gengar", "", "Ghost", "Poison"),
+        Soul("Snorlax", "", "Normal", moves=("Body Slam",)),
+    ]
+    pokedex = get_pokedex()
+    entries = [pokedex.find(soul.name) for soul in souls]
+    duals = [soul.dual for soul in souls]
+    attackers = Fighters.build(entries, [50, 60, 70], duals)
+    defenders = Fighters.build(entries[::-1], [40, 50, 60], duals[::-1])
+    attack = get_moves(souls, attackers.stats)
+    low, high = damage_ranges(attackers, attack, defenders)
+    assert low.shape == high.shape == (3, 3, 3)
+    assert (low <= high).all()
+    assert (low >= 0).all()
+    # Snorlax's Normal moves cannot touch Gengar, nor can Gengar's Ghost attack touch Snorlax
+    assert not high[2, :, 1].any()
+    assert high[1, 0, 0] == 0
+    # Roost deals no damage
+    assert not high[0, 2].any()
+    best_low, best_high, best = best_ranges(low, high)
+    assert np.array_equal(best_high, high.max(axis=1))
+    assert (best_low <= best_high).all()
+    assert np.array_equal(np.take_along_axis(high, best[:, None], axis=1)[:, 0], best_high)
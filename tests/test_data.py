@@ -0,0 +1,165 @@
+"""Tests of the records of a box and how they are saved."""
+
+import pickle
+from dataclasses import fields
+from pathlib import Path
+
+import pytest
+
+from pokemanager.const import Dual, Type
+from pokemanager.data import Box, Pokemon, Soul, Soullink, SoullinkPC, StandardPC, get_type_record
+from pokemanager.typer import get_dual
+
+DATA = Path(__file__).with_name("data")
+
+
+def load(name: str) -> Box:
+    """Load a box pickled by the release before the records had slots and shared type records."""
+    with (DATA / name).open("rb") as file:
+        return pickle.load(file)
+
+
+def test_baseline_soullink_box():
+    """Souls pickled without dual types are restored with the shared type records of their box's generation."""
+    box = load("soullink_box.pkl")
+    for pk in box.get_pokemon():
+        record = get_type_record(pk.type1, pk.type2, box.gen)
+        assert (pk.dual, pk.score) == (record.dual, record.score)
+        hash(pk)
+    assert len({hash(sl) for sl in box.pc}) == len(box.pc)
+    assert len(box.pc.get_active()) == len(box.pc) - 1
+    assert box.pc.get_teams(gen=box.gen)
+    assert 0 in box.index.get("name", box.pc[0].p1.name)
+
+
+def test_baseline_standard_box():
+    """Pokémon pickled without dual types are restored with the shared type records of their box's generation."""
+    box = load("standard_box.pkl")
+    pk = box.pc[0]
+    assert (pk.type1, pk.type2, pk.dual) == (Type.Electric, None, Dual.Electric)
+    assert pk.score == get_type_record(Type.Electric, None, box.gen).score
+    assert pk.moves == ()
+    assert len(box.pc.get_active()) == 1
+
+
+def test_baseline_pokemon_state():
+    """A Pokémon restored from the __dict__ it was pickled with before it had slots gains its dual type."""
+    pk = Pokemon.__new__(Pokemon)
+    pk.__setstate__(
+        {
+            "party": False,
+            "met": "",
+            "name": "Bulbasaur",
+            "nickname": "Bulby",
+            "type1": Type.Grass,
+            "type2": Type.Poison,
+            "lost": False,
+            "dead": True,
+            "score": 0.0,
+        }
+    )
+    assert pk == Pokemon("Bulbasaur", "Bulby", "Grass", "Poison", dead=True)
+    assert pk.dual == get_dual(Type.Grass, Type.Poison)
+    assert hash(pk) == hash(Pokemon("Bulbasaur", "Bulby", "Grass", "Poison", dead=True))
+
+
+def test_round_trip():
+    """Souls survive a round trip through pickle unchanged."""
+    soul = Soul("Charmander", "Char", "Fire", moves=("Ember",))
+    assert pickle.loads(pickle.dumps(soul)) == soul
+
+
+def test_hash_is_not_a_field():
+    """The cached hash of a record is neither one of its fields nor saved with it."""
+    soul = Soul("Charmander", "Char", "Fire")
+    hash(soul)
+    assert "_hash" not in {f.name for f in fields(soul)}
+    assert "_hash" not in soul.__getstate__()
+    assert hash(pickle.loads(pickle.dumps(soul))) == hash(soul)
+
+
+def test_type_records_are_shared():
+    """Pokémon with the same types in a generation hold the same type record, also once loaded from a pickle."""
+    soul = Soul("Charmander", "Char", "Fire")
+    other = Soul("Vulpix", "Vulp", "Fire")
+    assert soul.types is other.types is get_type_record(Type.Fire)
+    loaded = pickle.loads(pickle.dumps([soul, Soul("Growlithe", "", "Fire", gen=1)]))
+    assert loaded[0].types is soul.types
+    assert loaded[1].types is get_type_record(Type.Fire, None, 1)
+
+
+def test_box_scores_without_mutating():
+    """A box scores copies of the Pokémon it is given for its generation, leaving the Pokémon themselves alone."""
+    soul = Soul("Gengar", "", "Ghost", "Poison")
+    link = Soullink(False, "Lavender Town", soul, Soul("Haunter", "", "Ghost", "Poison"))
+    box = Box(name="test", game="Red", category="soullink", pokemon=[link])
+    assert soul.types is get_type_record(Type.Ghost, Type.Poison)
+    assert box.pc[0].p1.types is get_type_record(Type.Ghost, Type.Poison, 1)
+    assert box.pc[0] == link
+    assert Soul("Gengar", "", "Ghost", "Poison", gen=1).in_gen(1).score == box.pc[0].p1.score
+
+
+def test_features_follow_changes():
+    """The feature tables of a PC are updated whenever it changes, and are not saved with it."""
+    box = load("soullink_box.pkl")
+    pc = box.pc
+    features = pc.get_features(box.gen)
+    link = pc[0]
+    soul = link.p2
+    dead = Soullink(link.party, link.met, link.p1, Soul(soul.name, soul.nickname, soul.type1.name, dead=True))
+    pc[0] = dead
+    assert not pc.get_features(box.gen)["active"][0]
+    assert pc.get_features(box.gen) is features
+    pc.append(link)
+    assert pc.get_features(box.gen)["active"][-1]
+    del pc[-1]
+    assert len(pc.get_features(box.gen)) == len(pc)
+    assert b"_features" not in pickle.dumps(pc)
+    assert not vars(pickle.loads(pickle.dumps(pc)))
+
+
+def test_columns_follow_changes():
+    """The columns of a PC are rebuilt whenever it changes, even in place, and are not saved with it."""
+    box = load("standard_box.pkl")
+    pc = box.pc
+    assert len(pc.view().active()) == 1
+    pk = pc[0]
+    pc[0] = Pokemon(pk.name, pk.nickname, pk.type1.name, dead=True)
+    assert not pc.view().active()
+    pc.get_columns()
+    assert b"_columns" not in pickle.dumps(pc)
+    assert not vars(pickle.loads(pickle.dumps(pc)))
+
+
+def test_empty_pcs():
+    """Empty PCs have empty columns, views and feature tables."""
+    assert list(StandardPC([]).get_active()) == []
+    pc = SoullinkPC([])
+    assert len(pc.view()) == len(pc.view().active()) == 0
+    assert pc.get_columns().souls.shape == (0, 2)
+    assert len(pc.get_features()) == 0
+    assert pc.get_team_indices().shape == (0, 6)
+
+
+def test_views_ignore_case():
+    """Views find entries by name, nickname and met location regardless of case, as the box indexes do."""
+    box = load("soullink_box.pkl")
+    link = box.pc[0]
+    view = box.pc.view()
+    assert link in view.named(link.p1.name.upper())
+    assert link in view.named(link.p2.nickname.swapcase())
+    assert link in view.met_at(link.met.casefold())
+    assert list(view.named(link.p1.name.upper())) == [box.pc[i] for i in box.index.get("name", link.p1.name)]
+    assert not view.named("Missingno")
+
+
+def test_box_generation():
+    """A box scores its Pokémon in the generation of its game and refuses types that don't exist in it."""
+    pk = Pokemon("Clefairy", "", "Normal")
+    old, new = (Box(name="run", game=game, category="standard", pokemon=[pk]) for game in ("Red", "Sword"))  # type: ignore
+    assert (old.gen, new.gen) == (1, 8)
+    assert old.pc[0].score == get_type_record(Type.Normal, None, 1).score
+    assert new.pc[0].score == get_type_record(Type.Normal, None, 8).score
+    assert old.pc[0].score != new.pc[0].score
+    with pytest.raises(ValueError, match="Clefairy cannot be Fairy type in generation 1"):
+        Box(name="run", game="Red", category="standard", pokemon=[Pokemon("Clefairy", "", "Fairy")])  # type: ignore
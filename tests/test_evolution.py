@@ -0,0 +1,56 @@
+"""Tests of evolution chains and boxes once their Pokémon have fully evolved."""
+
+import pytest
+
+from pokemanager.const import GENS, Type
+from pokemanager.data import Box, Pokemon, Soul, Soullink
+from pokemanager.evolution import evolve, evolve_box, get_final_stages
+from pokemanager.pokedex import get_pokedex
+
+
+def finals(species: str, gen: GENS) -> list[str]:
+    """Get the names of the final stages of a species in a generation."""
+    pokedex = get_pokedex()
+    return [pokedex.name(entry) for entry in get_final_stages(gen)[pokedex.find(species)]]  # type: ignore
+
+
+def test_final_stages():
+    """Only evolutions that exist in a generation are final stages, and final stages are their own."""
+    assert finals("Eevee", 1) == ["Vaporeon", "Jolteon", "Flareon"]
+    assert finals("Eevee", 2) == ["Vaporeon", "Jolteon", "Flareon", "Espeon", "Umbreon"]
+    assert finals("Oddish", 1) == ["Vileplume"]
+    assert finals("Gloom", 9) == ["Vileplume", "Bellossom"]
+    assert finals("Charizard", 9) == ["Charizard"]
+
+
+def test_evolve():
+    """Pokémon evolve into their first final stage unless another is chosen, keeping everything but their species."""
+    pk = Pokemon("Charmander", "Char", "Fire", dead=True, moves=("Ember",))
+    evolved = evolve(pk)
+    assert (evolved.name, evolved.nickname, evolved.type1, evolved.type2) == (
+        "Charizard",
+        "Char",
+        Type.Fire,
+        Type.Flying,
+    )
+    assert (evolved.dead, evolved.moves) == (True, ("Ember",))
+    assert evolve(Soul("Eevee", "", "Normal"), 2, {"eevee": "Umbreon"}).type1 is Type.Dark
+    unknown = Soul("Treecko", "", "Grass")
+    assert evolve(unknown) is unknown
+    with pytest.raises(ValueError, match="Umbreon is not a final stage of Eevee in generation 1"):
+        evolve(Soul("Eevee", "", "Normal"), 1, {"Eevee": "Umbreon"})
+
+
+def test_evolve_box(links: list[Soullink]):
+    """Every soul of a box evolves in its generation, and the Soullinks keep where they were met."""
+    box = Box(name="run", game="Red", category="soullink", pokemon=links)  # type: ignore
+    evolved = evolve_box(box)
+    assert [sl.name for sl in evolved.pc][:3] == [
+        "Venusaur & Venusaur",
+        "Charizard & Charizard",
+        "Blastoise & Blastoise",
+    ]
+    assert [sl.met for sl in evolved.pc] == [sl.met for sl in box.pc]
+    assert evolved.gen == box.gen
+    with pytest.raises(ValueError, match="Unknown species: Missingno"):
+        evolve_box(box, {"Missingno": "Mew"})
@@ -0,0 +1,56 @@
+"""Tests of the secondary indexes of boxes."""
+
+import pytest
+
+from pokemanager.const import Type
+from pokemanager.data import Pokemon, Soul, Soullink
+from pokemanager.indexes import BoxIndex, entry_keys, parse_key
+
+
+def test_entry_keys():
+    """Soullinks are keyed by both souls, and Pokémon by themselves."""
+    link = Soullink(
+        True, "Route 1", Soul("Pidgey", "Pidge", "Normal", "Flying", lost=True), Soul("Oddish", "", "Grass")
+    )
+    assert set(entry_keys(link)) == {
+        ("name", "pidgey"),
+        ("name", "pidge"),
+        ("name", "oddish"),
+        ("name", "pidgey & oddish"),
+        ("type", Type.Normal),
+        ("type", Type.Flying),
+        ("type", Type.Grass),
+        ("met", "route 1"),
+        ("status", "lost"),
+        ("status", "party"),
+    }
+    assert set(entry_keys(Pokemon("Abra", "Kadabra", "Psychic"))) == {
+        ("name", "abra"),
+        ("name", "kadabra"),
+        ("type", Type.Psychic),
+        ("met", ""),
+        ("status", "alive"),
+    }
+
+
+def test_box_index(links: list[Soullink]):
+    """Filters intersect the positions of every key, which follow entries as they are removed."""
+    index = BoxIndex(links)
+    assert index.get("name", "CHARMANDER") == [1]
+    assert index.find([("status", "alive"), ("type", Type.Water)]) == [2]
+    assert index.find([("met", "route 3"), ("type", Type.Water)]) == []
+    index.remove(2, links[2])
+    assert index.get("type", Type.Water) == []
+    assert "route 2" not in index.postings["met"]
+    with pytest.raises(ValueError, match="At least one filter"):
+        index.find([])
+
+
+def test_parse_key():
+    """Types are parsed by name and statuses must be known, regardless of case."""
+    assert parse_key("type", "fire") is Type.Fire
+    assert parse_key("status", "Party") == "party"
+    with pytest.raises(ValueError, match="Invalid type"):
+        parse_key("type", "Wood")
+    with pytest.raises(ValueError, match="Invalid status"):
+        parse_key("status", "fainted")
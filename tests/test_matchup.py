@@ -0,0 +1,47 @@
+"""Tests of the type matchup queries and their commands."""
+
+from argparse import Namespace
+
+import numpy as np
+import pytest
+
+from pokemanager.cli_commands.cli_type import type_query_resists, type_query_walls
+from pokemanager.const import Type
+from pokemanager.matchup import resisting, top_attackers, walls
+from pokemanager.typer import get_dual, get_dual_matchups, get_dual_type_chart, get_type_vs_dual_chart
+
+
+def test_resisting():
+    """Exactly the dual types that take at most an effectiveness from every attacking type are found."""
+    chart = get_type_vs_dual_chart()
+    expected = np.flatnonzero((chart[[Type.Fire, Type.Water]] <= 0.5).all(axis=0))
+    assert sorted(resisting([Type.Fire, Type.Water])) == expected.tolist()
+    assert get_dual(Type.Water, Type.Dragon) in resisting([Type.Fire, Type.Water])
+    assert sorted(resisting([Type.Ground], at_most=0)) == np.flatnonzero(chart[Type.Ground] == 0).tolist()
+
+
+def test_walls():
+    """Exactly the dual types that take at most an effectiveness from every member of a team are found."""
+    team = [get_dual(Type.Fire), get_dual(Type.Water, Type.Ground)]
+    chart = get_dual_type_chart()
+    expected = np.flatnonzero((chart[team] <= 0.5).all(axis=0))
+    assert sorted(walls(team)) == expected.tolist()
+
+
+def test_top_attackers():
+    """The best attackers against a dual type are found from the best matchup to the worst."""
+    defender = get_dual(Type.Water, Type.Ground)
+    top = top_attackers(defender, 5)
+    matchups = get_dual_matchups()[:, defender]
+    assert [matchup for _, matchup in top] == sorted(matchups, reverse=True)[:5]
+    assert all(matchups[attacker] == matchup for attacker, matchup in top)
+
+
+def test_type_commands(capsys: pytest.CaptureFixture[str]):
+    """The commands list what they find, and report unknown types."""
+    type_query_resists(Namespace(types=["fire", "water"], gen=9, at_most=0.5))
+    out = capsys.readouterr().out
+    assert out.startswith(f"{len(resisting([Type.Fire, Type.Water]))} dual types take at most x0.5 from Fire, Water:")
+    assert "- Water/Dragon\n" in out
+    type_query_walls(Namespace(team=["Fire", "Water/Ground", "fyre"], gen=9, at_most=0.5))
+    assert capsys.readouterr().out == "Unknown type: fyre\n"
@@ -0,0 +1,35 @@
+"""Tests of the database of moves and the movesets of Pokémon."""
+
+import pytest
+
+from pokemanager.const import Type
+from pokemanager.movedex import CATEGORIES, Movedex, get_movedex, parse_moveset
+
+
+def test_movedex():
+    """Moves are found by name regardless of case, with their types, categories and powers."""
+    movedex = get_movedex()
+    ember = movedex.find(" ember ")
+    assert ember is not None
+    assert movedex.names[ember] == "Ember"
+    assert movedex.type(ember) is Type.Fire
+    assert movedex.moves[ember]["power"] > 0
+    hypnosis = movedex.find("HYPNOSIS")
+    assert hypnosis is not None
+    assert (CATEGORIES[movedex.moves[hypnosis]["category"]], movedex.moves[hypnosis]["power"]) == ("status", 0)
+    assert movedex.find("Not A Move") is None
+
+
+def test_names_are_unique():
+    """Databases with a name repeated regardless of case are refused."""
+    with pytest.raises(ValueError, match="unique"):
+        Movedex("Tackle\tNormal\tphysical\t40\ntackle\tNormal\tphysical\t40\n")
+
+
+def test_parse_moveset():
+    """Movesets are spelled as in the database without repeats, and unknown moves and long movesets are refused."""
+    assert parse_moveset(["thunderbolt", " Ember", "", "THUNDERBOLT"]) == ("Thunderbolt", "Ember")
+    with pytest.raises(ValueError, match=r"Unknown move: Thunderbot\. Did you mean: Thunderbolt"):
+        parse_moveset(["Thunderbot"])
+    with pytest.raises(ValueError, match="at most 4 moves, got 5"):
+        parse_moveset(["Tackle", "Scratch", "Pound", "Ember", "Thunderbolt"])
@@ -0,0 +1,41 @@
+"""Tests of progress reporting and cooperative cancellation."""
+
+import signal
+
+import pytest
+
+from pokemanager.data import Soullink, SoullinkPC
+from pokemanager.progress import Progress, ProgressUpdate
+
+
+def test_updates(links: list[Soullink]):
+    """Every batch of teams is reported, with how many were examined and found so far."""
+    updates: list[ProgressUpdate] = []
+    teams = SoullinkPC(links).get_team_indices(Progress(updates.append, interval=30))
+    assert [(u.stage, u.examined, u.found, u.total) for u in updates] == [
+        ("enumerating teams", 30, 30, 84),
+        ("enumerating teams", 60, 60, 84),
+        ("enumerating teams", 84, 84, 84),
+    ]
+    assert updates[-1].eta == 0
+    assert len(teams) == 84
+
+
+def test_cancel_keeps_results(links: list[Soullink]):
+    """Cancelling stops the stage after its batch, keeping the teams found so far."""
+    progress = Progress(lambda update: progress.cancel(), interval=30)
+    teams = SoullinkPC(links).get_team_indices(progress)
+    assert progress.cancelled
+    assert teams.tolist() == SoullinkPC(links).get_team_indices()[:30].tolist()
+
+
+def test_cancel_on_interrupt():
+    """A first SIGINT cancels the stage and a second one interrupts, until the handler is restored."""
+    progress = Progress()
+    previous = signal.getsignal(signal.SIGINT)
+    with progress.cancel_on_interrupt():
+        signal.raise_signal(signal.SIGINT)
+        assert progress.cancelled
+        with pytest.raises(KeyboardInterrupt):
+            signal.raise_signal(signal.SIGINT)
+    assert signal.getsignal(signal.SIGINT) is previous
@@ -0,0 +1,56 @@
+"""Tests of the query language for finding Pokémon across boxes."""
+
+import pytest
+
+from pokemanager.data import Box, Soul, Soullink
+from pokemanager.main import AppData
+from pokemanager.query import compile_query, parse, run
+
+
+def found(criteria: str) -> list[tuple[str, str]]:
+    """Get the boxes and names of the entries a query finds, in the order they are found."""
+    return [(match.box, match.label) for match in run(compile_query(criteria))]
+
+
+@pytest.fixture
+def boxes(appdata: object, links: list[Soullink]) -> None:
+    """Save two boxes, the second with Soullinks named from the worst match of "pikachu" to the best."""
+    AppData.save_box(Box(name="Run 1", game="Red", category="soullink", pokemon=links))  # type: ignore
+    similar = [
+        Soullink(True, "Route 2", Soul("Pichu", "", "Electric"), Soul("Raichu", "", "Electric")),
+        Soullink(False, "Route 3", Soul("Pikachu", "Sparky", "Electric"), Soul("Pikachu", "Pika", "Electric")),
+        Soullink(False, "Route 4", Soul("Pidgey", "Pikachu", "Normal"), Soul("Sandshrew", "", "Ground")),
+    ]
+    AppData.save_box(Box(name="Run 2", game="Red", category="soullink", pokemon=similar))  # type: ignore
+
+
+@pytest.mark.usefixtures("boxes")
+def test_run():
+    """Terms narrow down entries across boxes, which are found in the order of each box without fuzzy words."""
+    assert sorted(found("type:electric")) == [
+        ("Run 1", "Pikachu & Pikachu"),
+        ("Run 2", "Pichu & Raichu"),
+        ("Run 2", "Pikachu & Pikachu"),
+    ]
+    assert found("type:electric status:party") == [("Run 2", "Pichu & Raichu")]
+    assert found('met~"route 1" box:run1') == [("Run 1", "Charmander & Charmander")]
+    assert found("box:run3") == []
+
+
+@pytest.mark.usefixtures("boxes")
+def test_run_ranks_fuzzy_words():
+    """Entries matched by fuzzy words are found from the best match to the worst, with or without other terms."""
+    alone = found("pikachu")
+    assert alone[-1] == ("Run 2", "Pichu & Raichu")
+    assert found("pikachu type:electric") == [entry for entry in alone if "Pidgey" not in entry[1]]
+    assert found("pikachu box:run2 met~route") == [entry for entry in alone if entry[0] == "Run 2"]
+
+
+def test_parse_errors():
+    """Unknown fields and values, and fields that can't be matched partially, are refused."""
+    with pytest.raises(ValueError, match="Unknown field"):
+        parse("colour:red")
+    with pytest.raises(ValueError, match="Invalid type"):
+        parse("type:wood")
+    with pytest.raises(ValueError, match="only be matched exactly"):
+        parse("type~fire")
@@ -0,0 +1,61 @@
+"""Tests of the fuzzy search index of names and nicknames."""
+
+import pickle
+from pathlib import Path
+
+from pokemanager.data import Box, Soul, Soullink
+from pokemanager.main import AppData
+from pokemanager.search import SearchIndex
+
+
+def box(name: str, links: list[Soullink]) -> Box:
+    """Make a Soullink box."""
+    return Box(name=name, game="Red", category="soullink", pokemon=links)  # type: ignore
+
+
+def test_search(links: list[Soullink]):
+    """Names containing the query match fully, misspelled ones partially, and entries come best match first."""
+    index = SearchIndex()
+    index.update_box(box("run", links))
+    exact, *_ = index.search("charm")
+    assert (exact.score, exact.index, exact.label, exact.term) == (1.0, 1, "Charmander & Charmander", "Charmander")
+    (typo,) = index.search("charmandr")
+    assert 0.3 <= typo.score < 1
+    assert typo.index == 1
+    scores = [match.score for match in index.search("pikachu")]
+    assert scores == sorted(scores, reverse=True)
+    assert [match.term for match in index.search("abra")] == ["Abra"]
+
+
+def test_update_box(links: list[Soullink]):
+    """Reindexing or removing a box leaves the index as if it had been built from scratch."""
+    index = SearchIndex()
+    index.update_box(box("run", links))
+    renamed = [Soullink(False, "Route 1", Soul("Zubat", "Bat", "Poison", "Flying"), Soul("Oddish", "", "Grass"))]
+    index.update_box(box("other", links[:2]))
+    index.update_box(box("run", renamed))
+    fresh = SearchIndex()
+    fresh.update_box(box("other", links[:2]))
+    fresh.update_box(box("run", renamed))
+    assert (index.grams, index.postings, index.terms, index.entries) == (
+        fresh.grams,
+        fresh.postings,
+        fresh.terms,
+        fresh.entries,
+    )
+    index.remove_box("run")
+    index.remove_box("other")
+    assert not (index.grams or index.postings or index.terms or index.entries)
+
+
+def test_saved_index_follows_box_files(appdata: Path, links: list[Soullink]):
+    """The saved index picks up boxes that were saved, changed on disk or deleted since it was last used."""
+    AppData.save_box(box("Run 1", links))
+    assert [match.box for match in AppData.get_search_index().search("gastly")] == ["Run 1"]
+    # a box written without going through the app is indexed from its file
+    (appdata / "boxes" / "run-2.pkl").write_bytes(pickle.dumps(box("Run 2", links)))
+    assert sorted(match.box for match in AppData.get_search_index().search("gastly")) == ["Run 1", "Run 2"]
+    AppData.delete_box("Run 1")
+    assert [match.box for match in AppData.get_search_index().search("gastly")] == ["Run 2"]
+    AppData.delete_box("Run 2")
+    assert not list(AppData.get_search_index().search("gastly"))
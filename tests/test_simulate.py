@@ -0,0 +1,68 @@
+"""Tests of the Monte Carlo simulation of a run's survival."""
+
+from argparse import Namespace
+
+import pytest
+
+from pokemanager.cli_commands.cli_box import box_survival
+from pokemanager.data import Box, Soullink, SoullinkPC
+from pokemanager.main import AppData
+from pokemanager.simulate import SimulationOptions, simulate_survival
+
+
+def test_same_seed_same_estimates(links: list[Soullink]):
+    """Scenarios sampled with the same seed give the same estimates with any number of workers."""
+    pc = SoullinkPC(links)
+    estimates = [
+        simulate_survival(pc, 0.2, SimulationOptions(fights=3, samples=2500, workers=workers, seed=7))
+        for workers in (1, 2, 3)
+    ]
+    assert estimates[0] == estimates[1] == estimates[2]
+    assert [estimate.samples for estimate in estimates[0]] == [2500] * 3
+
+
+def test_certain_outcomes(links: list[Soullink]):
+    """Links that never die always leave a team, and links that always die never do."""
+    pc = SoullinkPC(links)
+    options = SimulationOptions(fights=2, samples=50, workers=1, seed=0)
+    assert [estimate.probability for estimate in simulate_survival(pc, 0.0, options)] == [1.0, 1.0]
+    assert [estimate.probability for estimate in simulate_survival(pc, 1.0, options)] == [0.0, 0.0]
+    # four certain deaths leave five links, too few for a team
+    doomed = dict.fromkeys(range(4), 1.0)
+    assert [estimate.probability for estimate in simulate_survival(pc, doomed, options)] == [0.0, 0.0]
+
+
+@pytest.mark.parametrize(
+    ("chance", "options"),
+    [
+        (1.5, SimulationOptions(fights=1)),
+        (-0.1, SimulationOptions(fights=1)),
+        (0.1, SimulationOptions(fights=0)),
+        (0.1, SimulationOptions(fights=1, samples=0)),
+        (0.1, SimulationOptions(fights=1, workers=0)),
+    ],
+)
+def test_invalid_options(links: list[Soullink], chance: float, options: SimulationOptions):
+    """Chances outside 0 to 1, and simulating nothing, are refused."""
+    with pytest.raises(ValueError):
+        simulate_survival(SoullinkPC(links), chance, options)
+
+
+@pytest.mark.usefixtures("appdata")
+@pytest.mark.parametrize(
+    ("arguments", "message"),
+    [
+        ({"death_chance": 1.5}, "Death chances must be between 0 and 1."),
+        ({"fights": 0}, "At least one fight and one sample must be simulated."),
+        ({"risk": ["Char=x"]}, "Invalid death chance of 'Char': x"),
+        ({"risk": ["Missingno=0.5"]}, "Soullink 'Missingno' not found in box 'run'."),
+    ],
+)
+def test_survival_command_errors(
+    links: list[Soullink], capsys: pytest.CaptureFixture[str], arguments: dict[str, object], message: str
+):
+    """Invalid options of the survival command are reported rather than raised."""
+    AppData.save_box(Box(name="run", game="Red", category="soullink", pokemon=links))
+    defaults = {"name": "run", "fights": 1, "death_chance": 0.1, "risk": [], "samples": 100, "workers": 1, "seed": 0}
+    box_survival(Namespace(**defaults | arguments))
+    assert message in capsys.readouterr().out
@@ -0,0 +1,46 @@
+"""Tests of the pairwise synergy of team members."""
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from pokemanager.synergy import get_dual_synergy, scored_combinations, team_synergy
+
+
+def test_dual_synergy():
+    """Synergy is symmetric, never negative, and no dual type has any with itself."""
+    synergy = get_dual_synergy()
+    assert np.allclose(synergy, synergy.T)
+    assert np.allclose(np.diag(synergy), 0)
+    assert (synergy >= -1e-12).all()
+
+
+def test_team_synergy():
+    """A team's synergy is the sum over each pair of its Soullinks of the synergy of each player's souls."""
+    rng = np.random.default_rng(0)
+    teams = rng.integers(0, len(get_dual_synergy()), size=(20, 12))
+    synergy = get_dual_synergy()
+    expected = [
+        sum(synergy[team[2 * i + p], team[2 * j + p]] for i, j in combinations(range(6), 2) for p in range(2))
+        for team in teams
+    ]
+    assert team_synergy(teams) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("size", [1, 3, 6])
+def test_scored_combinations(size: int):
+    """Combinations come in lexicographic order, with their scores plus the compatibility of each pair summed."""
+    rng = np.random.default_rng(size)
+    scores = rng.random(8).tolist()
+    compatibility = rng.random((8, 8))
+    compatibility += compatibility.T
+    found = list(scored_combinations(scores, compatibility, size))
+    assert [team for _, team in found] == list(combinations(range(8), size))
+    expected = [
+        sum(scores[i] for i in team) + sum(compatibility[i, j] for i, j in combinations(team, 2)) for _, team in found
+    ]
+    assert [total for total, _ in found] == pytest.approx(expected)
+    assert [total for total, _ in scored_combinations(scores, None, size)] == pytest.approx(
+        [sum(scores[i] for i in team) for _, team in found]
+    )
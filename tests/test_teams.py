@@ -0,0 +1,68 @@
+"""Tests of generating the best teams of a PC within a memory budget."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from pokemanager.analytics import Scoring
+from pokemanager.const import Type
+from pokemanager.data import Soul, Soullink, SoullinkPC
+from pokemanager.teams import BoundedTeams, MemoryBudget, get_teams_bounded
+
+
+def make_pc(size: int, seed: int = 0) -> SoullinkPC:
+    """Make a PC of Soullinks with random types, a few of them dead."""
+    rng = random.Random(seed)
+    types = [t.name for t in Type]
+
+    def soul(i: int) -> Soul:
+        type1, type2 = rng.choice(types), rng.choice([*types, *[None] * 10])
+        return Soul(f"S{i}", "", type1, None if type2 == type1 else type2, dead=rng.random() < 0.05)
+
+    return SoullinkPC(Soullink(False, f"Route {i}", soul(2 * i), soul(2 * i + 1)) for i in range(size))
+
+
+def expected_teams(pc: SoullinkPC, scoring: Scoring = Scoring()) -> tuple[list[float], set[tuple[int, ...]]]:
+    """Get the scores, from highest to lowest, and members of every valid team, as the unbounded search finds them."""
+    teams = pc.get_team_indices(gen=scoring.gen)
+    scores = pc.get_features(scoring.gen)["score"][teams].sum(axis=1)
+    return sorted(scores.round(9).tolist(), reverse=True), set(map(tuple, teams.tolist()))
+
+
+@pytest.mark.parametrize("budget", [64 * 2**20, 400_000, 60_000])
+def test_bounded_teams_match_unbounded(tmp_path: Path, budget: int):
+    """Every valid team is found with its score, best first, whether or not the teams spill to disk."""
+    pc = make_pc(22, seed=3)
+    scores, teams, report = get_teams_bounded(pc, MemoryBudget(budget, tmp_path))
+    expected_scores, expected_members = expected_teams(pc)
+    assert expected_scores
+    assert scores.round(9).tolist() == expected_scores
+    assert set(map(tuple, teams.tolist())) == expected_members
+    assert report.peak <= budget
+    assert not list(tmp_path.iterdir())
+
+
+def test_bounded_teams_limit(tmp_path: Path):
+    """Only the best teams are returned when there is a limit."""
+    pc = make_pc(16, seed=1)
+    scores, teams, _ = get_teams_bounded(pc, MemoryBudget(200_000, tmp_path), limit=5)
+    assert teams.shape == (5, 6)
+    assert scores.round(9).tolist() == expected_teams(pc)[0][:5]
+    assert not list(tmp_path.iterdir())
+
+
+def test_bounded_teams_generation(tmp_path: Path):
+    """Teams are scored with the type records of the generation being scored."""
+    pc = make_pc(16, seed=2)
+    scoring = Scoring(gen=1)
+    scores, teams, _ = get_teams_bounded(pc, MemoryBudget(2**20, tmp_path), scoring=scoring)
+    expected_scores, expected_members = expected_teams(pc, scoring)
+    assert scores.round(9).tolist() == expected_scores
+    assert set(map(tuple, teams.tolist())) == expected_members
+
+
+def test_budget_too_small(tmp_path: Path):
+    """A budget too small to hold what generating teams needs is refused."""
+    with pytest.raises(ValueError):
+        BoundedTeams(make_pc(16), MemoryBudget(1000, tmp_path))
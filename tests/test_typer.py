@@ -0,0 +1,106 @@
+"""Tests of the type charts."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pokemanager.const import GENS, Type
+from pokemanager.typer import (
+    _cache_path,
+    _get_era_tables,
+    chart_era,
+    get_dual,
+    get_dual_matchups,
+    get_dual_tables,
+    get_dual_type_chart,
+    get_gen_duals,
+    get_scores,
+    get_type_chart,
+    get_type_vs_dual_chart,
+)
+
+IMPORT_BUDGET = 0.1  # seconds importing the type charts may take, once numpy is imported
+
+
+def test_dual_tables_are_lazy(tmp_path: Path):
+    """Importing the type charts is quick and builds no dual type table until one is accessed."""
+    script = f"""
+from time import perf_counter
+import numpy
+start = perf_counter()
+import pokemanager.typer as typer
+elapsed = perf_counter() - start
+assert elapsed < {IMPORT_BUDGET}, f"importing took {{elapsed:.3f}}s"
+assert "DUAL_TYPE_CHART" not in vars(typer) and "DUAL_MATCHUPS" not in vars(typer)
+assert typer._get_era_tables.cache_info().currsize == 0
+typer.DUAL_TYPE_CHART
+assert typer._get_era_tables.cache_info().currsize == 1
+"""
+    env = {"XDG_CONFIG_HOME": str(tmp_path), "XDG_DATA_HOME": str(tmp_path), "PATH": ""}
+    subprocess.run([sys.executable, "-c", script], env=env, check=True)
+
+
+def test_dual_tables_are_cached(appdata: Path):
+    """Dual type tables are saved to appdata once, then memory-mapped, and rebuilt if the saved file is broken."""
+    _get_era_tables.cache_clear()
+    try:
+        built = get_dual_tables(6)
+        (path,) = appdata.joinpath("cache").glob("*.npy")
+        assert not isinstance(built, np.memmap)
+        _get_era_tables.cache_clear()
+        mapped = get_dual_tables(9)
+        assert isinstance(mapped, np.memmap)
+        assert np.array_equal(mapped, built)
+        _get_era_tables.cache_clear()
+        path.write_bytes(b"not a table")
+        assert np.array_equal(get_dual_tables(6), built)
+        assert np.array_equal(np.load(path), built)
+    finally:
+        # later tests must not map the file of this test's appdata
+        _get_era_tables.cache_clear()
+
+
+def test_unreadable_config_skips_the_cache(tmp_path: Path):
+    """The dual type tables are built without a cache when the config can't be read."""
+    assert _cache_path(9) is None
+    (tmp_path / "pokemanager.toml").write_text("appdata = \n", encoding="utf-8")
+    assert _cache_path(9) is None
+
+
+def test_single_types_attack_as_their_dual_type():
+    """A dual type of a single type attacks like that type."""
+    chart = get_dual_type_chart()
+    assert np.array_equal(chart[get_dual(Type.Fire)], get_type_vs_dual_chart()[Type.Fire])
+    assert chart[get_dual(Type.Electric), get_dual(Type.Water, Type.Ground)] == 0
+
+
+def test_type_charts_of_generations():
+    """Each generation has the type chart of its era, where types it lacks are neutral."""
+    assert [chart_era(gen) for gen in (1, 2, 5, 6, 9)] == [1, 2, 2, 6, 6]
+    gen1, gen2, gen9 = get_type_chart(1), get_type_chart(2), get_type_chart(9)
+    assert gen1[Type.Ghost, Type.Psychic] == 0
+    assert gen1[Type.Bug, Type.Poison] == 2
+    assert gen1[Type.Dark].tolist() == [1.0] * len(Type)
+    assert gen2[Type.Ghost, Type.Steel] == 0.5
+    assert gen2[Type.Dragon, Type.Fairy] == 1
+    assert gen9[Type.Ghost, Type.Steel] == 1
+    assert gen9[Type.Dragon, Type.Fairy] == 0
+    assert not get_gen_duals(5)[get_dual(Type.Normal, Type.Fairy)]
+    assert get_gen_duals(6)[get_dual(Type.Normal, Type.Fairy)]
+
+
+@pytest.mark.parametrize("gen", [1, 5, 9])
+def test_scores_are_the_perron_vector(gen: GENS):
+    """Scores are the positive unit eigenvector of the matchups of the dual types of a generation, 0 for the others."""
+    scores = get_scores(gen)
+    exists = get_gen_duals(gen)
+    assert not scores[~exists].any()
+    assert (scores[exists] > 0).all()
+    assert np.linalg.norm(scores) == pytest.approx(1)
+    matchups = get_dual_matchups(gen)[np.ix_(exists, exists)]
+    eigenvalues, eigenvectors = np.linalg.eig(matchups)
+    perron = np.abs(eigenvectors[:, np.argmax(eigenvalues.real)].real)
+    assert np.allclose(scores[exists], perron / np.linalg.norm(perron))